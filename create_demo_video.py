@@ -8,37 +8,98 @@ import cv2
 import numpy as np
 import time
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from bird_simulation import Bird
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from bird_simulation import STATE_COLORS, BirdFlock
 from uav_controller import UAVController
+from video_writer import ThreadedVideoWriter, create_video_writer
 
 class VideoGenerator:
-    def __init__(self, width=1280, height=720):
+    # Half extent of the drone illustration sprite (propellers and labels included)
+    DRONE_SPRITE_HALF = 80
+    
+    def __init__(self, width=1280, height=720, use_opencl=False, seed=None):
         self.width = width
         self.height = height
         self.fps = 30
+        # Shared random generator; pass a seed for a reproducible demo
+        self.rng = np.random.default_rng(seed)
+        # Route the cv2 overlay drawing through the OpenCL T-API (only pays off
+        # when drawing is heavy, so it is opt-in)
+        self.use_opencl = use_opencl and cv2.ocl.haveOpenCL()
+        cv2.ocl.setUseOpenCL(self.use_opencl)
         self.output_filename = f"uav_demo_video_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
         
-        # Initialize video writer
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        self.video_writer = cv2.VideoWriter(self.output_filename, fourcc, self.fps, (width, height))
+        # Initialize video writer (hardware encoder when available, encoding
+        # runs on a background thread)
+        self.video_writer = ThreadedVideoWriter(
+            create_video_writer(self.output_filename, self.fps, (width, height))
+        )
         
         # Initialize simulation components
-        self.birds = []
+        self.flock = None
         self.uav = UAVController((width//2, height//2))
         self.frame_count = 0
         self.section = 0  # 0: Intro, 1: Specs, 2: Simulation, 3: Conclusion
         self.section_timer = 0
         
+        # Reusable simulation frame buffers, cycled so a frame still waiting
+        # in the writer queue is never drawn over
+        self._sim_frames = [
+            np.empty((height, width, 3), dtype=np.uint8)
+            for _ in range(self.video_writer.max_in_flight + 1)
+        ]
+        self._sim_frame_idx = 0
+        
+        # Simulation background with static HUD labels and legend
+        self._build_sim_background()
+        
+        # Title gradient as an (H, 3) uint8 row colour table, built on first use
+        self._gradient_lut = None
+        
+        # Drone illustration sprite, rendered on first use
+        self._drone_sprite = None
+        
+        # Specifications text overlay, built on first use
+        self._specs_text_layer = None
+        self._specs_text_mask = None
+        
+        # Circle masks splatted with array indexing instead of per-bird cv2.circle calls
+        self._disk4 = self._circle_mask(4, -1)
+        self._disk8 = self._circle_mask(8, -1)
+        self._ring8 = self._circle_mask(8, 2)
+        self._disk12 = self._circle_mask(12, -1)
+        self._ring12 = self._circle_mask(12, 2)
+        
+        # Static screens never change, so render them once up front; they are
+        # independent, and OpenCV drawing releases the GIL, so render them concurrently
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            intro = pool.submit(
+                self.create_title_screen,
+                "UAV Path Planning Demo",
+                "Drone Specifications & Simulation"
+            )
+            specs = pool.submit(self.create_specifications_screen)
+            concl = pool.submit(self.create_conclusion_screen)
+            self._intro_frame = intro.result()
+            self._specs_frame = specs.result()
+            self._concl_frame = concl.result()
+        
     def create_title_screen(self, title, subtitle=""):
         """Create a title screen"""
-        frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-        
-        # Create gradient background
-        for y in range(self.height):
-            color = int(50 + (y / self.height) * 100)
-            frame[y, :] = [color//3, color//2, color]
-        
+        frame = np.empty((self.height, self.width, 3), dtype=np.uint8)
+
+        # Create gradient background from a per-row uint8 colour table
+        if self._gradient_lut is None:
+            col = (50 + np.arange(self.height) / self.height * 100).astype(np.uint8)
+            self._gradient_lut = np.stack([col // 3, col // 2, col], axis=1)
+        frame[:] = self._gradient_lut[:, None, :]
+
         # Add title
         font_large = cv2.FONT_HERSHEY_DUPLEX
         font_small = cv2.FONT_HERSHEY_SIMPLEX
@@ -60,46 +121,71 @@ class VideoGenerator:
     
     def create_specifications_screen(self):
         """Create drone specifications screen"""
-        frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-        
         # Background
-        frame.fill(30)
+        frame = np.full((self.height, self.width, 3), 30, dtype=np.uint8)
+        
+        # All text lives on one overlay rasterized once, then composited in a
+        # single masked copy
+        if self._specs_text_layer is None:
+            self._build_specs_text_layer()
+        cv2.copyTo(self._specs_text_layer, self._specs_text_mask, frame)
+        
+        # Add drone illustration
+        self.blit_drone_sprite(frame, (self.width - 300, 200))
+        
+        return frame
+    
+    def _build_specs_text_layer(self):
+        """Rasterize the specifications title, headers and items into an overlay"""
+        layer = np.zeros((self.height, self.width, 3), dtype=np.uint8)
         
         # Title
-        cv2.putText(frame, "UAV Specifications", (50, 80), cv2.FONT_HERSHEY_DUPLEX, 2, (255, 255, 255), 2)
+        cv2.putText(layer, "UAV Specifications", (50, 80), cv2.FONT_HERSHEY_DUPLEX, 2, (255, 255, 255), 2)
+        
+        # Section headers
+        headers = [
+            ("Physical Characteristics:", (50, 120)),
+            ("Performance Parameters:", (50, 270)),
+            ("Sensor Systems:", (50, 420)),
+        ]
+        for text, position in headers:
+            cv2.putText(layer, text, position, cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 255, 255), 2)
         
         # Specifications
         specs = [
-            ("Physical Characteristics:", ""),
             ("• Wingspan: 1.2 - 1.8 meters", (100, 150)),
             ("• Mass: 2.5 - 4.0 kg", (100, 180)),
             ("• Max Speed: 25 m/s", (100, 210)),
             ("• Service Ceiling: 4000m", (100, 240)),
-            ("", ""),
-            ("Performance Parameters:", ""),
             ("• Endurance: 45-60 minutes", (100, 300)),
             ("• Range: 15-25 km", (100, 330)),
             ("• Payload Capacity: 1.5 kg", (100, 360)),
             ("• Climb Rate: 5 m/s", (100, 390)),
-            ("", ""),
-            ("Sensor Systems:", ""),
             ("• HD Camera: 4K resolution", (100, 450)),
             ("• GPS: High-precision navigation", (100, 480)),
             ("• IMU: 6-axis stabilization", (100, 510)),
             ("• Altimeter: Barometric + GPS", (100, 540)),
         ]
+        for text, position in specs:
+            cv2.putText(layer, text, position, cv2.FONT_HERSHEY_SIMPLEX, 0.7, (200, 200, 200), 2)
         
-        for spec in specs:
-            if spec[1]:  # If position is provided
-                cv2.putText(frame, spec[0], spec[1], cv2.FONT_HERSHEY_SIMPLEX, 0.7, (200, 200, 200), 2)
-            else:  # Section header
-                cv2.putText(frame, spec[0], (50, spec[1][1] if spec[1] else 150), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 255, 255), 2)
-        
-        # Add drone illustration
-        self.draw_drone_illustration(frame, (self.width - 300, 200))
+        self._specs_text_layer = layer
+        self._specs_text_mask = layer.any(axis=2).astype(np.uint8)
+    
+    def blit_drone_sprite(self, frame, position):
+        """Copy the pre-rendered drone illustration centred on position
         
-        return frame
+        The sprite is drawn over the frame's own background on first use, so
+        it assumes a uniform background (as on the specifications screen).
+        """
+        x, y = position
+        half = self.DRONE_SPRITE_HALF
+        roi = frame[y - half:y + half + 1, x - half:x + half + 1]
+        if self._drone_sprite is None:
+            sprite = roi.copy()
+            self.draw_drone_illustration(sprite, (half, half))
+            self._drone_sprite = sprite
+        np.copyto(roi, self._drone_sprite)
     
     def draw_drone_illustration(self, frame, position):
         """Draw a simple drone illustration"""
@@ -123,85 +209,111 @@ class VideoGenerator:
         cv2.putText(frame, "Camera", (x-30, y+60), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
         cv2.putText(frame, "Propellers", (x-40, y-60), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
     
+    @staticmethod
+    def _circle_mask(radius, thickness):
+        """Rasterize a circle once into a boolean mask centred in its array"""
+        half = radius + max(thickness, 0)
+        canvas = np.zeros((2 * half + 1, 2 * half + 1), dtype=np.uint8)
+        cv2.circle(canvas, (half, half), radius, 255, thickness)
+        return canvas.astype(bool)
+    
+    def _stamp(self, frame, mask, center, color):
+        """Paint a precomputed mask centred on a point, clipped to the frame"""
+        height, width = frame.shape[:2]
+        half = mask.shape[0] // 2
+        x, y = center
+        x0, y0 = max(x - half, 0), max(y - half, 0)
+        x1, y1 = min(x + half + 1, width), min(y + half + 1, height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        mx, my = x0 - (x - half), y0 - (y - half)
+        frame[y0:y1, x0:x1][mask[my:my + (y1 - y0), mx:mx + (x1 - x0)]] = color
+    
     def create_simulation_frame(self):
         """Create a simulation frame"""
-        frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        frame = self._sim_frames[self._sim_frame_idx]
+        self._sim_frame_idx = (self._sim_frame_idx + 1) % len(self._sim_frames)
         
-        # Background
-        frame.fill((50, 100, 50))
+        # Background with the static HUD labels and legend already drawn
+        frame[:] = self._sim_background
         
         # Update birds
         wind = (0, 0)
         bounds = (self.width, self.height)
         
         # Initialize birds if needed
-        if len(self.birds) == 0:
-            for i in range(8):
-                pos = (np.random.randint(100, self.width-100), np.random.randint(100, self.height-100))
-                vel = (np.random.uniform(-2, 2), np.random.uniform(-2, 2))
-                self.birds.append(Bird(pos, vel))
-        
-        # Update and draw birds
-        for bird in self.birds:
-            bird.update(self.birds, bounds, wind)
-            
-            # Draw bird
-            x, y = int(bird.position[0]), int(bird.position[1])
-            color = bird.get_color()
-            cv2.circle(frame, (x, y), 8, color, -1)
-            cv2.circle(frame, (x, y), 8, (255, 255, 255), 2)
+        if self.flock is None:
+            positions = self.rng.integers([100, 100], [self.width-100, self.height-100], size=(8, 2))
+            velocities = self.rng.uniform(-2, 2, size=(8, 2))
+            self.flock = BirdFlock(positions, velocities, rng=self.rng)
+        
+        # Update the whole flock in one batched step
+        self.flock.update(bounds, wind)
+        
+        # Draw birds (positions cast to pixel coordinates in one batch)
+        pixels = self.flock.positions.astype(np.int32).tolist()
+        state_colors = STATE_COLORS[self.flock.states]
+        # Bind loop invariants to locals so the per-bird loop does no attribute lookups
+        stamp, disk8, ring8, disk4 = self._stamp, self._disk8, self._ring8, self._disk4
+        for (x, y), bird_color, state_color in zip(pixels, self.flock.get_colors(), state_colors):
+            stamp(frame, disk8, (x, y), bird_color)
+            stamp(frame, ring8, (x, y), (255, 255, 255))
             
             # Draw state indicator
-            state_colors = {
-                'CRUISING': (0, 255, 0),
-                'SOARING': (255, 255, 0),
-                'GLIDING': (0, 255, 255),
-                'PERCHED': (128, 128, 128),
-                'TAKING_OFF': (255, 128, 0)
-            }
-            state_color = state_colors.get(bird.state, (255, 255, 255))
-            cv2.circle(frame, (x+12, y-12), 4, state_color, -1)
+            stamp(frame, disk4, (x+12, y-12), state_color)
         
         # Update and draw UAV
-        self.uav.update(self.birds)
+        self.uav.update(self.flock)
         uav_x, uav_y = int(self.uav.position[0]), int(self.uav.position[1])
-        cv2.circle(frame, (uav_x, uav_y), 12, (255, 0, 0), -1)
-        cv2.circle(frame, (uav_x, uav_y), 12, (255, 255, 255), 2)
+        self._stamp(frame, self._disk12, (uav_x, uav_y), (255, 0, 0))
+        self._stamp(frame, self._ring12, (uav_x, uav_y), (255, 255, 255))
+        
+        # Remaining primitives are cv2 draws; with OpenCL they go to a UMat
+        # and the result is downloaded once at the end
+        canvas = cv2.UMat(frame) if self.use_opencl else frame
         
         # Draw UAV target line if tracking
-        if self.uav.target_bird:
-            target_x, target_y = int(self.uav.target_bird.position[0]), int(self.uav.target_bird.position[1])
-            cv2.line(frame, (uav_x, uav_y), (target_x, target_y), (255, 255, 0), 2)
-        
-        # Add UI elements
-        cv2.putText(frame, "UAV Path Planning Simulation", (10, 30), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
-        cv2.putText(frame, f"Birds: {len(self.birds)}", (10, 60), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        cv2.putText(frame, f"UAV Energy: {self.uav.energy:.1f}%", (10, 90), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        cv2.putText(frame, f"Frame: {self.frame_count}", (10, 120), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        
-        # Add legend
+        if self.uav.target_index >= 0:
+            target_x, target_y = self.flock.positions[self.uav.target_index].astype(np.int32).tolist()
+            cv2.line(canvas, (uav_x, uav_y), (target_x, target_y), (255, 255, 0), 2)
+        
+        # Add UI values next to their pre-drawn labels
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        cv2.putText(canvas, str(len(self.flock)), (self._hud_value_x[0], 60), font, 0.7, (255, 255, 255), 2)
+        cv2.putText(canvas, f"{self.uav.energy:.1f}%", (self._hud_value_x[1], 90), font, 0.7, (255, 255, 255), 2)
+        cv2.putText(canvas, str(self.frame_count), (self._hud_value_x[2], 120), font, 0.7, (255, 255, 255), 2)
+        
+        if self.use_opencl:
+            frame = canvas.get()
+        return frame
+    
+    def _build_sim_background(self):
+        """Draw the simulation background with every HUD element that never changes"""
+        background = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        background[:] = (50, 100, 50)
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        
+        # UI title and metric labels; values are drawn per frame after the labels
+        cv2.putText(background, "UAV Path Planning Simulation", (10, 30), font, 0.8, (255, 255, 255), 2)
+        self._hud_value_x = []
+        for label, y in (("Birds:", 60), ("UAV Energy:", 90), ("Frame:", 120)):
+            cv2.putText(background, label, (10, y), font, 0.7, (255, 255, 255), 2)
+            self._hud_value_x.append(10 + cv2.getTextSize(label + " ", font, 0.7, 2)[0][0])
+        
+        # Legend
         legend_y = self.height - 100
-        cv2.putText(frame, "Legend:", (self.width - 200, legend_y), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-        cv2.circle(frame, (self.width - 180, legend_y + 20), 6, (255, 0, 0), -1)
-        cv2.putText(frame, "UAV", (self.width - 160, legend_y + 25), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-        cv2.circle(frame, (self.width - 180, legend_y + 40), 6, (0, 255, 0), -1)
-        cv2.putText(frame, "Birds", (self.width - 160, legend_y + 45), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+        cv2.putText(background, "Legend:", (self.width - 200, legend_y), font, 0.6, (255, 255, 255), 2)
+        cv2.circle(background, (self.width - 180, legend_y + 20), 6, (255, 0, 0), -1)
+        cv2.putText(background, "UAV", (self.width - 160, legend_y + 25), font, 0.5, (255, 255, 255), 1)
+        cv2.circle(background, (self.width - 180, legend_y + 40), 6, (0, 255, 0), -1)
+        cv2.putText(background, "Birds", (self.width - 160, legend_y + 45), font, 0.5, (255, 255, 255), 1)
         
-        return frame
+        self._sim_background = background
     
     def create_conclusion_screen(self):
         """Create conclusion screen"""
-        frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-        
         # Background
-        frame.fill(30)
+        frame = np.full((self.height, self.width, 3), 30, dtype=np.uint8)
         
         # Title
         cv2.putText(frame, "Demo Complete", (50, 80), cv2.FONT_HERSHEY_DUPLEX, 2, (255, 255, 255), 2)
@@ -250,34 +362,32 @@ class VideoGenerator:
         
         total_frames = intro_duration + specs_duration + simulation_duration + conclusion_duration
         
-        # Generate video frames
-        for frame_num in range(total_frames):
-            if frame_num < intro_duration:
-                # Intro section
-                frame = self.create_title_screen(
-                    "UAV Path Planning Demo",
-                    "Drone Specifications & Simulation"
-                )
-            elif frame_num < intro_duration + specs_duration:
-                # Specifications section
-                frame = self.create_specifications_screen()
-            elif frame_num < intro_duration + specs_duration + simulation_duration:
-                # Simulation section
-                frame = self.create_simulation_frame()
-                self.frame_count += 1
-            else:
-                # Conclusion section
-                frame = self.create_conclusion_screen()
+        # Intro and specifications sections are static frames, queued once
+        # per section so the writer can encode them as holds
+        self.video_writer.write_repeated(self._intro_frame, intro_duration)
+        self.video_writer.write_repeated(self._specs_frame, specs_duration)
+        
+        # Simulation section
+        last_progress = time.monotonic()
+        for frame_num in range(intro_duration + specs_duration,
+                               intro_duration + specs_duration + simulation_duration):
+            frame = self.create_simulation_frame()
+            self.frame_count += 1
             
-            # Write frame
+            # Queue frame for the writer thread
             self.video_writer.write(frame)
             
-            # Progress indicator
-            if frame_num % 30 == 0:
+            # Progress indicator, throttled to about once per second of wall time
+            now = time.monotonic()
+            if now - last_progress >= 1.0:
+                last_progress = now
                 progress = (frame_num / total_frames) * 100
                 print(f"Progress: {progress:.1f}%")
         
-        # Release video writer
+        # Conclusion section
+        self.video_writer.write_repeated(self._concl_frame, conclusion_duration)
+        
+        # Flush queued frames and release video writer
         self.video_writer.release()
         
         print(f"Video generation complete: {self.output_filename}")
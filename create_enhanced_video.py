@@ -6,105 +6,240 @@ Creates a comprehensive video showcasing detailed drone specifications and UAV s
 
 import cv2
 import numpy as np
+import math
 import time
 import os
 import sys
+import multiprocessing
+from collections import deque
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import islice
 
 # Add src directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from bird_simulation import Bird
+from bird_simulation import STATE_COLORS, BirdFlock
+from blend_sprites import blit_blend_sprite, render_blend_sprite
 from uav_controller import UAVController
+from video_writer import ThreadedVideoWriter, create_video_writer
+
+# Downsampling factor of the tile the animated gradients are evaluated on
+BACKGROUND_TILE_SCALE = 8
+
+# The intro and conclusion frames depend only on the frame index, so they are
+# rendered by these module-level functions, which pool workers can run
+
+@lru_cache(maxsize=None)
+def _background_grids(width, height):
+    """Pixel coordinate terms of the animated gradients for a frame size"""
+    tile_w = max(width // BACKGROUND_TILE_SCALE, 1)
+    tile_h = max(height // BACKGROUND_TILE_SCALE, 1)
+    # Full-resolution pixel coordinates of the tile samples, matching
+    # the pixel-center mapping used by cv2.resize
+    xs = (np.arange(tile_w, dtype=np.float32) + 0.5) * (width / tile_w) - 0.5
+    ys = (np.arange(tile_h, dtype=np.float32)[:, None] + 0.5) * (height / tile_h) - 0.5
+    return xs * 0.01, ys * 0.01, (xs + ys) * 0.005
+
+def animated_background(width, height, time_factor, r, g, b):
+    """Build the animated sinusoid gradient for one frame
+    
+    r, g and b are (offset, amplitude) pairs for the terms in x, y and x + y.
+    """
+    # The gradient is smooth, so it is evaluated on a coarse tile and upsampled
+    grid_x, grid_y, grid_xy = _background_grids(width, height)
+    # Channels are written straight into a contiguous uint8 tile; assignment
+    # broadcasts the row and column terms and truncates like the int() casts did
+    tile = np.empty((grid_y.shape[0], grid_x.shape[0], 3), dtype=np.uint8)
+    tile[..., 0] = r[0] + r[1] * np.sin(grid_x + time_factor)
+    tile[..., 1] = g[0] + g[1] * np.sin(grid_y + time_factor)
+    tile[..., 2] = b[0] + b[1] * np.sin(grid_xy + time_factor)
+    return cv2.resize(tile, (width, height), interpolation=cv2.INTER_LINEAR)
+
+# Peak opacity and blur radius of the white glow around the title
+TITLE_GLOW_STRENGTH = 0.3
+TITLE_GLOW_SIGMA = 8
+
+@lru_cache(maxsize=None)
+def _centered_text_x(text, font, scale, thickness, width):
+    """X coordinate that centers text horizontally in a frame of the given width"""
+    text_size = cv2.getTextSize(text, font, scale, thickness)[0]
+    return (width - text_size[0]) // 2
+
+def _draw_title(frame, title, width, height):
+    """Draw the title with its glow effect"""
+    font_large = cv2.FONT_HERSHEY_DUPLEX
+    title_x = _centered_text_x(title, font_large, 3, 5, width)
+    title_y = height // 2 - 100
+    
+    # Glow effect: the title mask blurred once and blended toward white,
+    # which keeps the drawing affine in the background for blend_sprite
+    mask = np.zeros(frame.shape[:2], dtype=np.uint8)
+    cv2.putText(mask, title, (title_x, title_y), font_large, 3, 255, 5)
+    glow = cv2.GaussianBlur(mask, (0, 0), sigmaX=TITLE_GLOW_SIGMA)
+    alpha = glow[..., None] * np.float32(TITLE_GLOW_STRENGTH / 255.0)
+    frame[:] = frame * (1 - alpha) + 255 * alpha
+    
+    # Main title
+    cv2.putText(frame, title, (title_x, title_y), font_large, 3, (255, 255, 255), 5)
+
+@lru_cache(maxsize=None)
+def _title_overlay(width, height, title):
+    """Rasterize the glowing title once as a blend sprite"""
+    return render_blend_sprite(partial(_draw_title, title=title, width=width, height=height),
+                               width, height)
+
+def render_animated_title(animation_frame, width, height, title, subtitle=""):
+    """Create an animated title screen"""
+    # Create animated gradient background
+    time_factor = animation_frame * 0.02
+    frame = animated_background(width, height, time_factor, (50, 30), (50, 30), (100, 50))
+    
+    # Title with glow effect, blended from the cached overlay
+    blit_blend_sprite(frame, _title_overlay(width, height, title))
+    
+    # Animated subtitle
+    font_small = cv2.FONT_HERSHEY_SIMPLEX
+    if subtitle:
+        subtitle_x = _centered_text_x(subtitle, font_small, 1.5, 3, width)
+        subtitle_y = height // 2 + 50
+        
+        # Animated color
+        color_val = int(200 + 55 * math.sin(animation_frame * 0.1))
+        cv2.putText(frame, subtitle, (subtitle_x, subtitle_y), font_small, 1.5, (color_val, color_val, color_val), 3)
+    
+    # Add animated drone icon
+    draw_animated_drone(frame, (width - 200, 200), animation_frame)
+    
+    return frame
+
+def draw_animated_drone(frame, position, animation_frame):
+    """Draw an animated drone icon"""
+    x, y = position
+    time_factor = animation_frame * 0.1
+    
+    # Rotating propellers
+    for i in range(4):
+        angle = time_factor + i * math.pi / 2
+        prop_x = x + int(60 * math.cos(angle))
+        prop_y = y + int(60 * math.sin(angle))
+        cv2.circle(frame, (prop_x, prop_y), 8, (100, 100, 100), -1)
+        cv2.circle(frame, (prop_x, prop_y), 8, (255, 255, 255), 2)
+    
+    # Main body
+    cv2.rectangle(frame, (x-50, y-30), (x+50, y+30), (80, 80, 80), -1)
+    cv2.rectangle(frame, (x-50, y-30), (x+50, y+30), (255, 255, 255), 3)
+    
+    # Camera with pulsing effect
+    pulse = int(20 + 10 * math.sin(animation_frame * 0.2))
+    cv2.circle(frame, (x, y), pulse, (0, 0, 255), -1)
+    cv2.circle(frame, (x, y), pulse, (255, 255, 255), 2)
+
+def render_conclusion_screen(animation_frame, width, height):
+    """Create enhanced conclusion screen"""
+    # Animated background
+    time_factor = animation_frame * 0.01
+    frame = animated_background(width, height, time_factor, (20, 10), (20, 10), (30, 15))
+    
+    # Title
+    cv2.putText(frame, "Demo Complete", (50, 100), cv2.FONT_HERSHEY_DUPLEX, 3, (255, 255, 255), 4)
+    
+    # Content with animations
+    content = [
+        "This demonstration showcases:",
+        "",
+        "• Real-time UAV path planning algorithms",
+        "• Dynamic bird behavior simulation",
+        "• 3D environment visualization",
+        "• Energy-efficient navigation systems",
+        "• Advanced target acquisition methods",
+        "• Flocking behavior modeling",
+        "• Thermal updraft utilization",
+        "",
+        "For more information about the full research project:",
+        "",
+        "Author: Solomon Makuwa",
+        "Email: 202211185@spu.ac.za",
+        "Institution: Sol Plaatje University",
+        "Supervisors: Lebelo Serutla, Dr Alfred Mwanza",
+        "",
+        "Thank you for watching!"
+    ]
+    
+    y_start = 200
+    for i, line in enumerate(content):
+        y = y_start + i * 40
+        
+        # Animated text appearance
+        if animation_frame > i * 10:
+            if line.startswith("•"):
+                color = (0, 255, 255)
+            elif "Author:" in line or "Email:" in line or "Institution:" in line or "Supervisors:" in line:
+                color = (255, 255, 0)
+            elif "Thank you" in line:
+                # Pulsing effect for thank you
+                pulse = int(200 + 55 * math.sin(animation_frame * 0.2))
+                color = (pulse, pulse, pulse)
+            else:
+                color = (200, 200, 200)
+            
+            cv2.putText(frame, line, (50, y), cv2.FONT_HERSHEY_SIMPLEX, 0.8, color, 2)
+    
+    return frame
 
 class EnhancedVideoGenerator:
-    def __init__(self, width=1920, height=1080):
+    def __init__(self, width=1920, height=1080, seed=None, writer_cpu=None):
         self.width = width
         self.height = height
         self.fps = 30
+        self.rng = np.random.default_rng(seed)
         self.output_filename = f"uav_enhanced_demo_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
         
-        # Initialize video writer
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        self.video_writer = cv2.VideoWriter(self.output_filename, fourcc, self.fps, (width, height))
+        # Initialize video writer (hardware/threaded H.264 when available),
+        # encoding on a background thread (optionally pinned to writer_cpu)
+        # while frames are generated
+        self.video_writer = ThreadedVideoWriter(
+            create_video_writer(self.output_filename, self.fps, (width, height)),
+            cpu=writer_cpu
+        )
         
         # Initialize simulation components
-        self.birds = []
+        self.flock = None
         self.uav = UAVController((width//2, height//2))
         self.frame_count = 0
         self.animation_frame = 0
         
-    def create_animated_title(self, title, subtitle=""):
-        """Create an animated title screen"""
-        frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        # Static specifications screen, rendered on first use
+        self._specs_frame = None
         
-        # Create animated gradient background
-        for y in range(self.height):
-            for x in range(self.width):
-                # Animated gradient
-                time_factor = self.animation_frame * 0.02
-                r = int(50 + 30 * np.sin(x * 0.01 + time_factor))
-                g = int(50 + 30 * np.sin(y * 0.01 + time_factor))
-                b = int(100 + 50 * np.sin((x + y) * 0.005 + time_factor))
-                frame[y, x] = [r, g, b]
-        
-        # Add animated title
-        font_large = cv2.FONT_HERSHEY_DUPLEX
-        font_small = cv2.FONT_HERSHEY_SIMPLEX
-        
-        # Title with glow effect
-        title_size = cv2.getTextSize(title, font_large, 3, 5)[0]
-        title_x = (self.width - title_size[0]) // 2
-        title_y = self.height // 2 - 100
-        
-        # Glow effect
-        for i in range(5, 0, -1):
-            alpha = 0.3 - i * 0.05
-            color = (int(255 * alpha), int(255 * alpha), int(255 * alpha))
-            cv2.putText(frame, title, (title_x, title_y), font_large, 3, color, i)
-        
-        # Main title
-        cv2.putText(frame, title, (title_x, title_y), font_large, 3, (255, 255, 255), 5)
-        
-        # Animated subtitle
-        if subtitle:
-            subtitle_size = cv2.getTextSize(subtitle, font_small, 1.5, 3)[0]
-            subtitle_x = (self.width - subtitle_size[0]) // 2
-            subtitle_y = self.height // 2 + 50
-            
-            # Animated color
-            color_val = int(200 + 55 * np.sin(self.animation_frame * 0.1))
-            cv2.putText(frame, subtitle, (subtitle_x, subtitle_y), font_small, 1.5, (color_val, color_val, color_val), 3)
+        # Static simulation background, rendered on first use
+        self._sim_background = None
         
-        # Add animated drone icon
-        self.draw_animated_drone(frame, (self.width - 200, 200))
+        # Reusable simulation frame buffers, cycled so a frame still waiting
+        # in the writer queue is never drawn over
+        self._sim_frames = [
+            np.empty((height, width, 3), dtype=np.uint8)
+            for _ in range(self.video_writer.max_in_flight + 1)
+        ]
+        self._sim_frame_idx = 0
         
-        return frame
+    def create_animated_title(self, title, subtitle=""):
+        """Create an animated title screen"""
+        return render_animated_title(self.animation_frame, self.width, self.height, title, subtitle)
     
     def draw_animated_drone(self, frame, position):
         """Draw an animated drone icon"""
-        x, y = position
-        time_factor = self.animation_frame * 0.1
-        
-        # Rotating propellers
-        for i in range(4):
-            angle = time_factor + i * np.pi / 2
-            prop_x = x + int(60 * np.cos(angle))
-            prop_y = y + int(60 * np.sin(angle))
-            cv2.circle(frame, (prop_x, prop_y), 8, (100, 100, 100), -1)
-            cv2.circle(frame, (prop_x, prop_y), 8, (255, 255, 255), 2)
-        
-        # Main body
-        cv2.rectangle(frame, (x-50, y-30), (x+50, y+30), (80, 80, 80), -1)
-        cv2.rectangle(frame, (x-50, y-30), (x+50, y+30), (255, 255, 255), 3)
-        
-        # Camera with pulsing effect
-        pulse = int(20 + 10 * np.sin(self.animation_frame * 0.2))
-        cv2.circle(frame, (x, y), pulse, (0, 0, 255), -1)
-        cv2.circle(frame, (x, y), pulse, (255, 255, 255), 2)
+        draw_animated_drone(frame, position, self.animation_frame)
     
     def create_detailed_specifications_screen(self):
         """Create detailed drone specifications screen"""
+        # The screen has no animation, so it is rendered once and reused
+        if self._specs_frame is None:
+            self._specs_frame = self._build_specs_frame()
+        return self._specs_frame
+    
+    def _build_specs_frame(self):
+        """Render the static specifications screen"""
         frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
         
         # Background with subtle pattern
@@ -230,107 +365,57 @@ class EnhancedVideoGenerator:
         for label, pos in labels:
             cv2.putText(frame, label, pos, cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
     
-    def create_enhanced_simulation_frame(self):
-        """Create an enhanced simulation frame with better visuals"""
-        frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-        
-        # Create gradient background
-        for y in range(self.height):
-            color = int(30 + (y / self.height) * 70)
-            frame[y, :] = [color//3, color//2, color]
+    def _build_sim_background(self):
+        """Render the static gradient and grid behind the simulation"""
+        # Vertical gradient, one color per row
+        ys = np.arange(self.height)
+        color = (30 + ys / self.height * 70).astype(np.int32)
+        rows = np.stack([color // 3, color // 2, color], axis=-1).astype(np.uint8)
+        background = np.ascontiguousarray(np.broadcast_to(rows[:, None, :], (self.height, self.width, 3)))
         
         # Add grid pattern
         for x in range(0, self.width, 50):
-            cv2.line(frame, (x, 0), (x, self.height), (40, 40, 40), 1)
+            cv2.line(background, (x, 0), (x, self.height), (40, 40, 40), 1)
         for y in range(0, self.height, 50):
-            cv2.line(frame, (0, y), (self.width, y), (40, 40, 40), 1)
-        
-        # Update birds
-        wind = (0, 0)
-        bounds = (self.width, self.height)
-        
-        # Initialize birds if needed
-        if len(self.birds) == 0:
-            for i in range(12):
-                pos = (np.random.randint(100, self.width-100), np.random.randint(100, self.height-100))
-                vel = (np.random.uniform(-2, 2), np.random.uniform(-2, 2))
-                self.birds.append(Bird(pos, vel))
-        
-        # Update and draw birds with enhanced visuals
-        for bird in self.birds:
-            bird.update(self.birds, bounds, wind)
-            
-            # Draw bird with shadow
-            x, y = int(bird.position[0]), int(bird.position[1])
-            
-            # Shadow
-            cv2.circle(frame, (x+2, y+2), 10, (20, 20, 20), -1)
-            
-            # Bird body
-            color = bird.get_color()
-            cv2.circle(frame, (x, y), 10, color, -1)
-            cv2.circle(frame, (x, y), 10, (255, 255, 255), 2)
-            
-            # Bird direction indicator
-            direction_x = int(x + bird.velocity[0] * 5)
-            direction_y = int(y + bird.velocity[1] * 5)
-            cv2.line(frame, (x, y), (direction_x, direction_y), (255, 255, 255), 2)
-            
-            # State indicator
-            state_colors = {
-                'CRUISING': (0, 255, 0),
-                'SOARING': (255, 255, 0),
-                'GLIDING': (0, 255, 255),
-                'PERCHED': (128, 128, 128),
-                'TAKING_OFF': (255, 128, 0)
-            }
-            state_color = state_colors.get(bird.state, (255, 255, 255))
-            cv2.circle(frame, (x+15, y-15), 5, state_color, -1)
+            cv2.line(background, (0, y), (self.width, y), (40, 40, 40), 1)
         
-        # Update and draw UAV with enhanced visuals
-        self.uav.update(self.birds)
-        uav_x, uav_y = int(self.uav.position[0]), int(self.uav.position[1])
-        
-        # UAV shadow
-        cv2.circle(frame, (uav_x+3, uav_y+3), 15, (20, 20, 20), -1)
-        
-        # UAV body
-        cv2.circle(frame, (uav_x, uav_y), 15, (255, 0, 0), -1)
-        cv2.circle(frame, (uav_x, uav_y), 15, (255, 255, 255), 3)
-        
-        # UAV direction
-        direction_x = int(uav_x + self.uav.velocity[0] * 8)
-        direction_y = int(uav_y + self.uav.velocity[1] * 8)
-        cv2.line(frame, (uav_x, uav_y), (direction_x, direction_y), (255, 255, 255), 3)
+        return background
+    
+    def _build_sim_overlays(self):
+        """Pre-render the metrics panel and legend as sprites"""
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        
+        # Metric value positions; values are drawn per frame after the labels
+        self._hud_value_x = [
+            20 + cv2.getTextSize(label + " ", font, 0.7, 2)[0][0]
+            for label in ("Birds Active:", "UAV Energy:", "Frame:", "Target:")
+        ]
         
-        # UAV target line if tracking
-        if self.uav.target_bird:
-            target_x, target_y = int(self.uav.target_bird.position[0]), int(self.uav.target_bird.position[1])
-            cv2.line(frame, (uav_x, uav_y), (target_x, target_y), (255, 255, 0), 3)
-            
-            # Target indicator
-            cv2.circle(frame, (target_x, target_y), 15, (255, 255, 0), 2)
+        # Panel interiors are opaque and copied as one slice each
+        self._hud_sprite = render_blend_sprite(
+            self._draw_hud_panel, self.width, self.height, (10, 181, 10, 401))
+        legend_x = self.width - 250
+        legend_y = 50
+        self._legend_sprite = render_blend_sprite(
+            self._draw_legend_panel, self.width, self.height, (legend_y - 10, legend_y + 121, legend_x - 10, legend_x + 241))
+    
+    def _draw_hud_panel(self, frame):
+        """Draw the metrics panel with its title and labels"""
+        font = cv2.FONT_HERSHEY_SIMPLEX
         
-        # Enhanced UI elements
         # Background panel
         cv2.rectangle(frame, (10, 10), (400, 180), (0, 0, 0), -1)
         cv2.rectangle(frame, (10, 10), (400, 180), (255, 255, 255), 2)
         
         # Title
-        cv2.putText(frame, "UAV Path Planning Simulation", (20, 40), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.9, (255, 255, 255), 2)
-        
-        # Metrics
-        cv2.putText(frame, f"Birds Active: {len(self.birds)}", (20, 70), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        cv2.putText(frame, f"UAV Energy: {self.uav.energy:.1f}%", (20, 100), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        cv2.putText(frame, f"Frame: {self.frame_count}", (20, 130), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        cv2.putText(frame, f"Target: {'Yes' if self.uav.target_bird else 'No'}", (20, 160), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+        cv2.putText(frame, "UAV Path Planning Simulation", (20, 40), font, 0.9, (255, 255, 255), 2)
         
-        # Enhanced legend
+        # Metric labels
+        for label, y in (("Birds Active:", 70), ("UAV Energy:", 100), ("Frame:", 130), ("Target:", 160)):
+            cv2.putText(frame, label, (20, y), font, 0.7, (255, 255, 255), 2)
+    
+    def _draw_legend_panel(self, frame):
+        """Draw the enhanced legend"""
         legend_x = self.width - 250
         legend_y = 50
         
@@ -355,68 +440,119 @@ class EnhancedVideoGenerator:
             cv2.circle(frame, (legend_x, y_pos), 6, color, -1)
             cv2.putText(frame, label, (legend_x + 15, y_pos + 5), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-        
-        return frame
     
-    def create_conclusion_screen(self):
-        """Create enhanced conclusion screen"""
-        frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+    def create_enhanced_simulation_frame(self):
+        """Create an enhanced simulation frame with better visuals"""
+        if self._sim_background is None:
+            self._sim_background = self._build_sim_background()
+            self._build_sim_overlays()
+        frame = self._sim_frames[self._sim_frame_idx]
+        self._sim_frame_idx = (self._sim_frame_idx + 1) % len(self._sim_frames)
+        frame[:] = self._sim_background
         
-        # Animated background
-        for y in range(self.height):
-            for x in range(self.width):
-                time_factor = self.animation_frame * 0.01
-                r = int(20 + 10 * np.sin(x * 0.01 + time_factor))
-                g = int(20 + 10 * np.sin(y * 0.01 + time_factor))
-                b = int(30 + 15 * np.sin((x + y) * 0.005 + time_factor))
-                frame[y, x] = [r, g, b]
+        # Update birds
+        wind = (0, 0)
+        bounds = (self.width, self.height)
         
-        # Title
-        cv2.putText(frame, "Demo Complete", (50, 100), cv2.FONT_HERSHEY_DUPLEX, 3, (255, 255, 255), 4)
-        
-        # Content with animations
-        content = [
-            "This demonstration showcases:",
-            "",
-            "• Real-time UAV path planning algorithms",
-            "• Dynamic bird behavior simulation",
-            "• 3D environment visualization",
-            "• Energy-efficient navigation systems",
-            "• Advanced target acquisition methods",
-            "• Flocking behavior modeling",
-            "• Thermal updraft utilization",
-            "",
-            "For more information about the full research project:",
-            "",
-            "Author: Solomon Makuwa",
-            "Email: 202211185@spu.ac.za",
-            "Institution: Sol Plaatje University",
-            "Supervisors: Lebelo Serutla, Dr Alfred Mwanza",
-            "",
-            "Thank you for watching!"
-        ]
+        # Initialize birds if needed
+        if self.flock is None:
+            positions = self.rng.integers([100, 100], [self.width-100, self.height-100], size=(12, 2))
+            velocities = self.rng.uniform(-2, 2, size=(12, 2))
+            self.flock = BirdFlock(positions, velocities, rng=self.rng)
+        
+        # Update the whole flock in one batched step
+        self.flock.update(bounds, wind)
+        
+        # Draw birds with enhanced visuals, one layer at a time for the whole flock
+        pts = self.flock.positions.astype(np.int32)
+        pixels = pts.tolist()
+        bird_colors = self.flock.get_colors().tolist()
+        state_colors = STATE_COLORS[self.flock.states].tolist()
+        circle = cv2.circle
+        
+        # Shadows
+        for x, y in pixels:
+            circle(frame, (x+2, y+2), 10, (20, 20, 20), -1)
+        
+        # Bird bodies
+        for (x, y), color in zip(pixels, bird_colors):
+            circle(frame, (x, y), 10, color, -1)
+            circle(frame, (x, y), 10, (255, 255, 255), 2, lineType=cv2.LINE_4)
+        
+        # Bird direction indicators, all segments in a single call
+        tips = (pts + self.flock.velocities * 5).astype(np.int32)
+        segments = np.stack([pts, tips], axis=1)
+        cv2.polylines(frame, list(segments), False, (255, 255, 255), 2)
+        
+        # State indicators
+        for (x, y), state_color in zip(pixels, state_colors):
+            circle(frame, (x+15, y-15), 5, state_color, -1)
         
-        y_start = 200
-        for i, line in enumerate(content):
-            y = y_start + i * 40
+        # Update and draw UAV with enhanced visuals
+        self.uav.update(self.flock)
+        uav_x, uav_y = int(self.uav.position[0]), int(self.uav.position[1])
+        
+        # UAV shadow
+        circle(frame, (uav_x+3, uav_y+3), 15, (20, 20, 20), -1)
+        
+        # UAV body
+        circle(frame, (uav_x, uav_y), 15, (255, 0, 0), -1)
+        circle(frame, (uav_x, uav_y), 15, (255, 255, 255), 3, lineType=cv2.LINE_4)
+        
+        # UAV direction
+        direction_x = int(uav_x + self.uav.velocity[0] * 8)
+        direction_y = int(uav_y + self.uav.velocity[1] * 8)
+        cv2.line(frame, (uav_x, uav_y), (direction_x, direction_y), (255, 255, 255), 3)
+        
+        # UAV target line if tracking
+        if self.uav.target_index >= 0:
+            target_x, target_y = self.flock.positions[self.uav.target_index].astype(np.int32).tolist()
+            cv2.line(frame, (uav_x, uav_y), (target_x, target_y), (255, 255, 0), 3)
             
-            # Animated text appearance
-            if self.animation_frame > i * 10:
-                if line.startswith("•"):
-                    color = (0, 255, 255)
-                elif "Author:" in line or "Email:" in line or "Institution:" in line or "Supervisors:" in line:
-                    color = (255, 255, 0)
-                elif "Thank you" in line:
-                    # Pulsing effect for thank you
-                    pulse = int(200 + 55 * np.sin(self.animation_frame * 0.2))
-                    color = (pulse, pulse, pulse)
-                else:
-                    color = (200, 200, 200)
-                
-                cv2.putText(frame, line, (50, y), cv2.FONT_HERSHEY_SIMPLEX, 0.8, color, 2)
+            # Target indicator
+            cv2.circle(frame, (target_x, target_y), 15, (255, 255, 0), 2)
+        
+        # Enhanced UI elements: pre-rendered panels, then the live values
+        blit_blend_sprite(frame, self._hud_sprite)
+        blit_blend_sprite(frame, self._legend_sprite)
+        
+        # Metrics next to their pre-drawn labels
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        values = (
+            str(len(self.flock)),
+            f"{self.uav.energy:.1f}%",
+            str(self.frame_count),
+            'Yes' if self.uav.target_index >= 0 else 'No'
+        )
+        for value, value_x, y in zip(values, self._hud_value_x, (70, 100, 130, 160)):
+            cv2.putText(frame, value, (value_x, y), font, 0.7, (255, 255, 255), 2)
         
         return frame
     
+    def create_conclusion_screen(self):
+        """Create enhanced conclusion screen"""
+        return render_conclusion_screen(self.animation_frame, self.width, self.height)
+    
+    @staticmethod
+    def _render_in_pool(pool, render, animation_frames, max_pending=None):
+        """Submit frames to the pool now and return an iterator over them in order
+        
+        The first max_pending frames (all of them if None) are submitted
+        immediately; each one consumed submits the next.
+        """
+        animation_frames = iter(animation_frames)
+        pending = deque(pool.apply_async(render, (animation_frame,))
+                        for animation_frame in islice(animation_frames, max_pending))
+        
+        def results():
+            while pending:
+                frame = pending.popleft().get()
+                for animation_frame in islice(animation_frames, 1):
+                    pending.append(pool.apply_async(render, (animation_frame,)))
+                yield frame
+        
+        return results()
+    
     def generate_enhanced_video(self):
         """Generate the complete enhanced demo video"""
         print("Generating Enhanced UAV Demo Video...")
@@ -429,36 +565,66 @@ class EnhancedVideoGenerator:
         conclusion_duration = 6 * self.fps  # 6 seconds
         
         total_frames = intro_duration + specs_duration + simulation_duration + conclusion_duration
-        
-        # Generate video frames
-        for frame_num in range(total_frames):
-            if frame_num < intro_duration:
-                # Intro section
-                frame = self.create_animated_title(
-                    "UAV Path Planning Demo",
-                    "Advanced Drone Specifications & Simulation"
-                )
-            elif frame_num < intro_duration + specs_duration:
-                # Specifications section
-                frame = self.create_detailed_specifications_screen()
-            elif frame_num < intro_duration + specs_duration + simulation_duration:
-                # Simulation section
-                frame = self.create_enhanced_simulation_frame()
-                self.frame_count += 1
-            else:
-                # Conclusion section
-                frame = self.create_conclusion_screen()
-            
-            # Update animation frame
-            self.animation_frame += 1
+        simulation_end = intro_duration + specs_duration + simulation_duration
+        
+        # Frames are many small draws that OpenCV's own threading only slows
+        # down; parallelism comes from the pool and the writer thread instead
+        cv2.setNumThreads(1)
+        
+        # Intro and conclusion frames are rendered by a process pool; spawned
+        # rather than forked so workers don't inherit the encoder's pipe or threads
+        processes = max((os.cpu_count() or 1) - 1, 1)
+        with multiprocessing.get_context('spawn').Pool(
+                processes, initializer=cv2.setNumThreads, initargs=(1,)) as pool:
+            intro_frames = self._render_in_pool(
+                pool,
+                partial(render_animated_title, width=self.width, height=self.height,
+                        title="UAV Path Planning Demo",
+                        subtitle="Advanced Drone Specifications & Simulation"),
+                range(0, intro_duration),
+                max_pending=2 * processes
+            )
+            conclusion_frames = None
             
-            # Write frame
-            self.video_writer.write(frame)
-            
-            # Progress indicator
-            if frame_num % 30 == 0:
-                progress = (frame_num / total_frames) * 100
-                print(f"Progress: {progress:.1f}%")
+            # Generate video frames
+            for frame_num in range(total_frames):
+                if frame_num < intro_duration:
+                    # Intro section
+                    frame = next(intro_frames)
+                elif frame_num < intro_duration + specs_duration:
+                    # Specifications section: a static frame, queued once for
+                    # the whole section so the writer can encode it as a hold
+                    if frame_num == intro_duration:
+                        # The intro is fully submitted by now; queue every
+                        # conclusion frame so the otherwise idle workers render
+                        # them during the simulation section
+                        conclusion_frames = self._render_in_pool(
+                            pool,
+                            partial(render_conclusion_screen, width=self.width, height=self.height),
+                            range(simulation_end, total_frames)
+                        )
+                        self.video_writer.write_repeated(
+                            self.create_detailed_specifications_screen(), specs_duration)
+                    frame = None
+                elif frame_num < simulation_end:
+                    # Simulation section
+                    frame = self.create_enhanced_simulation_frame()
+                    self.frame_count += 1
+                else:
+                    # Conclusion section
+                    frame = next(conclusion_frames)
+                
+                # Update animation frame
+                self.animation_frame += 1
+                
+                # Write frame
+                if frame is not None:
+                    self.video_writer.write(frame)
+                
+                # Progress indicator
+                if frame_num % 30 == 0:
+                    progress = (frame_num / total_frames) * 100
+                    print(f"Progress: {progress:.1f}%")
         
         # Release video writer
         self.video_writer.release()
@@ -10,20 +10,141 @@ import time
 import os
 import sys
 import math
-import random
 from datetime import datetime
 
 # Add src directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from bird_simulation import Bird
+from bird_simulation import STATE_COLORS, BirdFlock, BirdState
+from blend_sprites import blit_blend_sprite, render_blend_sprite
 from uav_controller import UAVController
+from video_writer import ThreadedVideoWriter, create_video_writer
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; the kernels below then run as plain Python
+    NUMBA_AVAILABLE = False
+
+# Downsampling factor of the tile the animated gradients are evaluated on
+BACKGROUND_TILE_SCALE = 8
+
+# Learning phase names, indexed by the integer codes the kernels below use
+PHASES = ("EXPLORATION", "LEARNING", "OPTIMIZATION")
+EXPLORATION, LEARNING, OPTIMIZATION = range(len(PHASES))
+
+def _adaptive_velocity(x, y, target_x, target_y, target_vx, target_vy, phase,
+                       adaptation_level, energy, max_speed, noise_x, noise_y):
+    """Velocity towards a target for the given learning phase
+    
+    noise_x and noise_y are the exploration offsets, only used while exploring.
+    """
+    # Calculate base direction
+    dx = target_x - x
+    dy = target_y - y
+    
+    # Normalize direction
+    distance = math.hypot(dx, dy)
+    if distance > 0:
+        dx /= distance
+        dy /= distance
+        
+    # Apply learning-based adjustments
+    if phase == EXPLORATION:
+        # Add exploration noise
+        dx += noise_x
+        dy += noise_y
+    else:
+        # Predict movement, further ahead once optimized
+        lead = 5.0 if phase == LEARNING else 8.0
+        pred_dx = target_x + target_vx * lead - x
+        pred_dy = target_y + target_vy * lead - y
+        pred_dist = math.hypot(pred_dx, pred_dy)
+        if pred_dist > 0:
+            pred_dx /= pred_dist
+            pred_dy /= pred_dist
+            if phase == LEARNING:
+                # Blend current and predicted
+                blend = adaptation_level
+                dx = dx * (1 - blend) + pred_dx * blend
+                dy = dy * (1 - blend) + pred_dy * blend
+            else:  # OPTIMIZATION
+                # Use prediction with high confidence
+                dx = pred_dx * 0.8 + dx * 0.2
+                dy = pred_dy * 0.8 + dy * 0.2
+                
+    # Apply speed with learning-based optimization
+    speed = min(max_speed, max_speed * (energy / 100.0))
+    if phase == OPTIMIZATION:
+        speed *= 1.0 + adaptation_level * 0.3
+        
+    return dx * speed, dy * speed
+
+def _learning_step(distance, phase, adaptation_level, prediction_accuracy, learning_rate):
+    """Updated (adaptation_level, prediction_accuracy, captured) after one chase step"""
+    # Update adaptation level based on performance
+    if distance < 30:  # Close to target
+        adaptation_level = min(1.0, adaptation_level + learning_rate)
+    else:
+        # Gradually decrease adaptation if not successful
+        adaptation_level = max(0.0, adaptation_level - learning_rate * 0.1)
+        
+    # Update prediction accuracy
+    if phase != EXPLORATION:
+        # Simulate prediction accuracy improvement
+        prediction_accuracy = min(1.0, prediction_accuracy + learning_rate * 0.5)
+        
+    # Very close - successful capture
+    return adaptation_level, prediction_accuracy, distance < 15
+
+def _swarm_step(positions, velocities, swarm_velocity, drift):
+    """Advance the swarm-level motion in place and return the swarm center
+    
+    swarm_velocity takes a random-walk step by drift, is limited to speed 2
+    and then nudges every bird's velocity.
+    """
+    n = positions.shape[0]
+    center_x = 0.0
+    center_y = 0.0
+    for i in range(n):
+        center_x += positions[i, 0]
+        center_y += positions[i, 1]
+        
+    # Add some swarm-level movement
+    swarm_velocity[0] += drift[0]
+    swarm_velocity[1] += drift[1]
+    
+    # Limit swarm velocity
+    swarm_speed = math.hypot(swarm_velocity[0], swarm_velocity[1])
+    if swarm_speed > 2:
+        swarm_velocity[0] *= 2 / swarm_speed
+        swarm_velocity[1] *= 2 / swarm_speed
+        
+    # Add swarm influence
+    influence_x = swarm_velocity[0] * 0.1
+    influence_y = swarm_velocity[1] * 0.1
+    for i in range(n):
+        velocities[i, 0] += influence_x
+        velocities[i, 1] += influence_y
+        
+    return center_x / max(n, 1), center_y / max(n, 1)
+
+if NUMBA_AVAILABLE:
+    _adaptive_velocity = njit(cache=True)(_adaptive_velocity)
+    _learning_step = njit(cache=True)(_learning_step)
+    _swarm_step = njit(cache=True)(_swarm_step)
 
 class LearningUAVController(UAVController):
     """Enhanced UAV controller with learning capabilities"""
     
-    def __init__(self, position):
+    NOISE_BUFFER_SIZE = 4096
+    
+    def __init__(self, position, rng=None):
         super().__init__(position)
+        self.rng = rng if rng is not None else np.random.default_rng()
+        # Uniform [-1, 1) noise drawn in batches and handed out in slices
+        self._noise = self.rng.uniform(-1, 1, size=self.NOISE_BUFFER_SIZE)
+        self._noise_idx = 0
         self.learning_rate = 0.01
         self.experience = []
         self.prediction_accuracy = 0.5
@@ -31,10 +152,13 @@ class LearningUAVController(UAVController):
         self.successful_captures = 0
         self.total_attempts = 0
         self.learning_phase = "EXPLORATION"  # EXPLORATION, LEARNING, OPTIMIZATION
+        self.phase_id = EXPLORATION  # Index of learning_phase in PHASES
         self.phase_timer = 0
         
-    def update(self, birds):
-        """Update UAV with learning behavior"""
+    def update(self, flock):
+        """Update UAV with learning behavior against a BirdFlock"""
+        self._bind_birds(flock)
+        
         # Consume energy
         self.energy = max(0, self.energy - self.energy_consumption_rate)
         
@@ -42,246 +166,286 @@ class LearningUAVController(UAVController):
         self._update_learning_phase()
         
         # Find target with learning-based selection
-        if not self.target_bird or self._distance_to_bird(self.target_bird) > self.search_radius:
-            self._find_optimal_target(birds)
+        if self.target_index < 0 or self._sq_distance_to_target() > self.search_radius_sq:
+            self._find_optimal_target(flock)
             
         # Move towards target with adaptive behavior
-        if self.target_bird:
+        if self.target_index >= 0:
             self._adaptive_movement()
         else:
             self._patrol_behavior()
             
         # Update position
-        self.position[0] += self.velocity[0]
-        self.position[1] += self.velocity[1]
+        self.position += self.velocity
         
         # Learn from experience
         self._learn_from_experience()
         
+    def _take_noise(self, count):
+        """Next count uniform [-1, 1) samples from the noise buffer, refilled when used up"""
+        if self._noise_idx + count > len(self._noise):
+            self._noise = self.rng.uniform(-1, 1, size=max(self.NOISE_BUFFER_SIZE, count))
+            self._noise_idx = 0
+        noise = self._noise[self._noise_idx:self._noise_idx + count]
+        self._noise_idx += count
+        return noise
+        
     def _update_learning_phase(self):
         """Update the learning phase based on performance"""
         self.phase_timer += 1
         
         if self.phase_timer < 300:  # First 10 seconds
-            self.learning_phase = "EXPLORATION"
+            self.phase_id = EXPLORATION
         elif self.phase_timer < 600:  # Next 10 seconds
-            self.learning_phase = "LEARNING"
+            self.phase_id = LEARNING
         else:  # Final phase
-            self.learning_phase = "OPTIMIZATION"
+            self.phase_id = OPTIMIZATION
+        self.learning_phase = PHASES[self.phase_id]
             
-    def _find_optimal_target(self, birds):
-        """Find optimal target using learned patterns"""
-        best_target = None
-        best_score = float('inf')
-        
-        for bird in birds:
-            if bird.state != 'PERCHED':
-                distance = self._distance_to_bird(bird)
-                if distance <= self.search_radius:
-                    # Enhanced scoring with learning
-                    base_score = distance + (100 - bird.energy) * 0.5
-                    
-                    # Learning-based adjustments
-                    if self.learning_phase == "EXPLORATION":
-                        # Random exploration
-                        score = base_score + random.uniform(-50, 50)
-                    elif self.learning_phase == "LEARNING":
-                        # Start using learned patterns
-                        learned_bonus = self.adaptation_level * 20
-                        score = base_score - learned_bonus
-                    else:  # OPTIMIZATION
-                        # Fully optimized selection
-                        learned_bonus = self.adaptation_level * 50
-                        prediction_bonus = self.prediction_accuracy * 30
-                        score = base_score - learned_bonus - prediction_bonus
-                    
-                    if score < best_score:
-                        best_score = score
-                        best_target = bird
-                        
-        self.target_bird = best_target
+    def _find_optimal_target(self, flock):
+        """Find optimal target using learned patterns, scoring the whole flock at once"""
+        distances = np.hypot(flock.positions[:, 0] - self.position[0],
+                             flock.positions[:, 1] - self.position[1])
+        candidates = (flock.states != BirdState.PERCHED) & (distances <= self.search_radius)
+        
+        # Enhanced scoring with learning
+        scores = distances + (100 - flock.energy) * 0.5
+        
+        # Learning-based adjustments
+        if self.phase_id == EXPLORATION:
+            # Random exploration
+            scores += self._take_noise(len(scores)) * 50
+        else:
+            # Learned patterns, fully optimized with predictions
+            if self.phase_id == LEARNING:
+                learned_bonus = self.adaptation_level * 20
+            else:
+                learned_bonus = self.adaptation_level * 50 + self.prediction_accuracy * 30
+            scores -= learned_bonus
+        
+        scores[~candidates] = np.inf
+        self.target_index = int(scores.argmin()) if candidates.any() else -1
         
     def _adaptive_movement(self):
         """Adaptive movement based on learning phase"""
-        if not self.target_bird:
+        if self.target_index < 0:
             return
             
-        # Calculate base direction
-        dx = self.target_bird.position[0] - self.position[0]
-        dy = self.target_bird.position[1] - self.position[1]
-        
-        # Normalize direction
-        distance = math.sqrt(dx**2 + dy**2)
-        if distance > 0:
-            dx /= distance
-            dy /= distance
-            
-        # Apply learning-based adjustments
-        if self.learning_phase == "EXPLORATION":
+        if self.phase_id == EXPLORATION:
             # Add exploration noise
-            dx += random.uniform(-0.3, 0.3)
-            dy += random.uniform(-0.3, 0.3)
-        elif self.learning_phase == "LEARNING":
-            # Start predicting movement
-            predicted_x = self.target_bird.position[0] + self.target_bird.velocity[0] * 5
-            predicted_y = self.target_bird.position[1] + self.target_bird.velocity[1] * 5
-            pred_dx = predicted_x - self.position[0]
-            pred_dy = predicted_y - self.position[1]
-            pred_dist = math.sqrt(pred_dx**2 + pred_dy**2)
-            if pred_dist > 0:
-                pred_dx /= pred_dist
-                pred_dy /= pred_dist
-                # Blend current and predicted
-                blend = self.adaptation_level
-                dx = dx * (1 - blend) + pred_dx * blend
-                dy = dy * (1 - blend) + pred_dy * blend
-        else:  # OPTIMIZATION
-            # Fully optimized movement with prediction
-            predicted_x = self.target_bird.position[0] + self.target_bird.velocity[0] * 8
-            predicted_y = self.target_bird.position[1] + self.target_bird.velocity[1] * 8
-            pred_dx = predicted_x - self.position[0]
-            pred_dy = predicted_y - self.position[1]
-            pred_dist = math.sqrt(pred_dx**2 + pred_dy**2)
-            if pred_dist > 0:
-                pred_dx /= pred_dist
-                pred_dy /= pred_dist
-                # Use prediction with high confidence
-                dx = pred_dx * 0.8 + dx * 0.2
-                dy = pred_dy * 0.8 + dy * 0.2
-            
-        # Apply speed with learning-based optimization
-        base_speed = min(self.max_speed, self.max_speed * (self.energy / 100.0))
-        if self.learning_phase == "OPTIMIZATION":
-            speed = base_speed * (1.0 + self.adaptation_level * 0.3)
+            noise_x, noise_y = (self._take_noise(2) * 0.3).tolist()
         else:
-            speed = base_speed
-            
-        self.velocity[0] = dx * speed
-        self.velocity[1] = dy * speed
+            noise_x = noise_y = 0.0
+        target_x, target_y = self._birds.positions[self.target_index].tolist()
+        target_vx, target_vy = self._birds.velocities[self.target_index].tolist()
+        self.velocity[0], self.velocity[1] = _adaptive_velocity(
+            float(self.position[0]), float(self.position[1]),
+            target_x, target_y, target_vx, target_vy, self.phase_id,
+            self.adaptation_level, self.energy, self.max_speed, noise_x, noise_y)
         
     def _learn_from_experience(self):
         """Learn from current experience"""
-        if self.target_bird:
+        if self.target_index >= 0:
             # Calculate success metrics
-            distance = self._distance_to_bird(self.target_bird)
-            
-            # Update adaptation level based on performance
-            if distance < 30:  # Close to target
-                self.adaptation_level = min(1.0, self.adaptation_level + self.learning_rate)
-                if distance < 15:  # Very close - successful capture
-                    self.successful_captures += 1
-            else:
-                # Gradually decrease adaptation if not successful
-                self.adaptation_level = max(0.0, self.adaptation_level - self.learning_rate * 0.1)
-                
-            # Update prediction accuracy
-            if self.learning_phase in ["LEARNING", "OPTIMIZATION"]:
-                # Simulate prediction accuracy improvement
-                self.prediction_accuracy = min(1.0, self.prediction_accuracy + self.learning_rate * 0.5)
-                
+            distance = self._distance_to_target()
+            self.adaptation_level, self.prediction_accuracy, captured = _learning_step(
+                distance, self.phase_id, self.adaptation_level,
+                self.prediction_accuracy, self.learning_rate)
+            if captured:
+                self.successful_captures += 1
             self.total_attempts += 1
 
 class EnhancedBirdSwarm:
-    """Enhanced bird swarm with more complex flocking behavior"""
+    """Enhanced bird swarm with more complex flocking behavior
     
-    def __init__(self, num_birds=15, bounds=(1920, 1080)):
-        self.birds = []
+    Birds live in a structure-of-arrays BirdFlock; self.birds holds views
+    into it for code that works on individual birds.
+    """
+    
+    def __init__(self, num_birds=15, bounds=(1920, 1080), rng=None):
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.bounds = bounds
-        self.swarm_center = [bounds[0]//2, bounds[1]//2]
-        self.swarm_velocity = [0, 0]
+        self.swarm_center = np.array([bounds[0]//2, bounds[1]//2], dtype=np.float64)
+        self.swarm_velocity = np.zeros(2)
         
         # Initialize birds in a more natural formation
-        for i in range(num_birds):
-            angle = (i / num_birds) * 2 * math.pi
-            radius = random.uniform(50, 150)
-            x = self.swarm_center[0] + radius * math.cos(angle)
-            y = self.swarm_center[1] + radius * math.sin(angle)
-            vel = (random.uniform(-2, 2), random.uniform(-2, 2))
-            self.birds.append(Bird((x, y), vel))
-            
+        angles = np.arange(num_birds) / num_birds * 2 * math.pi
+        radii = self.rng.uniform(50, 150, size=num_birds)
+        positions = self.swarm_center + radii[:, None] * np.column_stack((np.cos(angles), np.sin(angles)))
+        velocities = self.rng.uniform(-2, 2, size=(num_birds, 2))
+        self.flock = BirdFlock(positions, velocities, rng=self.rng)
+        self.birds = self.flock.birds
+        
     def update(self, wind=(0, 0)):
         """Update all birds with enhanced flocking"""
-        # Update swarm center and velocity
-        if len(self.birds) > 0:
-            center_x = sum(b.position[0] for b in self.birds) / len(self.birds)
-            center_y = sum(b.position[1] for b in self.birds) / len(self.birds)
-            self.swarm_center = [center_x, center_y]
-            
-            # Add some swarm-level movement
-            self.swarm_velocity[0] += random.uniform(-0.1, 0.1)
-            self.swarm_velocity[1] += random.uniform(-0.1, 0.1)
-            
-            # Limit swarm velocity
-            swarm_speed = math.sqrt(self.swarm_velocity[0]**2 + self.swarm_velocity[1]**2)
-            if swarm_speed > 2:
-                self.swarm_velocity[0] = (self.swarm_velocity[0] / swarm_speed) * 2
-                self.swarm_velocity[1] = (self.swarm_velocity[1] / swarm_speed) * 2
-        
-        # Update individual birds
-        bounds = self.bounds
-        for bird in self.birds:
-            bird.update(self.birds, bounds, wind)
-            
-            # Add swarm influence
-            bird.velocity[0] += self.swarm_velocity[0] * 0.1
-            bird.velocity[1] += self.swarm_velocity[1] * 0.1
+        # Random-walk step of the swarm-level movement
+        drift = self.rng.uniform(-0.1, 0.1, size=2)
+        
+        # Update the whole flock in one batched step
+        self.flock.update(self.bounds, wind)
+        
+        # Swarm center, drift and influence on the birds in one fused pass
+        if len(self.flock) > 0:
+            center = _swarm_step(self.flock.positions, self.flock.velocities, self.swarm_velocity, drift)
+            self.swarm_center = np.array(center)
 
 class LearningVideoGenerator:
-    def __init__(self, width=1920, height=1080):
+    TITLE = "UAV Learning to Chase Bird Swarms"
+    SUBTITLE = "Adaptive Path Planning & Target Acquisition"
+    
+    # UAV body color for each learning phase
+    PHASE_COLORS = (
+        (255, 128, 0),  # EXPLORATION - Orange
+        (255, 255, 0),  # LEARNING - Yellow
+        (0, 255, 0),    # OPTIMIZATION - Green
+    )
+    
+    def __init__(self, width=1920, height=1080, seed=None):
         self.width = width
         self.height = height
         self.fps = 30
+        self.rng = np.random.default_rng(seed)
         self.output_filename = f"uav_learning_demo_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
         
-        # Initialize video writer
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        self.video_writer = cv2.VideoWriter(self.output_filename, fourcc, self.fps, (width, height))
+        # Initialize video writer with the fastest available encoder;
+        # frames are encoded on a background thread
+        self.video_writer = ThreadedVideoWriter(
+            create_video_writer(self.output_filename, self.fps, (width, height)), queue_size=4)
+        
+        # Reusable frame buffers, cycled so a frame still waiting in the
+        # writer queue is never drawn over
+        self._frames = [
+            np.empty((height, width, 3), dtype=np.uint8)
+            for _ in range(self.video_writer.max_in_flight + 1)
+        ]
+        self._frame_idx = 0
         
         # Initialize components
-        self.bird_swarm = EnhancedBirdSwarm(20, (width, height))
-        self.uav = LearningUAVController((width//2, height//2))
+        self.bird_swarm = EnhancedBirdSwarm(20, (width, height), rng=self.rng)
+        self.uav = LearningUAVController((width//2, height//2), rng=self.rng)
         self.frame_count = 0
         self.animation_frame = 0
         
+        # Pixel coordinate terms of the animated gradients, built on first use
+        self._grid_x = None
+        self._grid_y = None
+        self._grid_xy = None
+        
+        # Static simulation background, rendered once
+        self._sim_background = self._build_sim_background()
+        
+        # UAV shadow, body and outline for each learning phase
+        self._uav_sprites = [self._build_uav_sprite(color) for color in self.PHASE_COLORS]
+        
+        # Styled conclusion lines and the results they were built from
+        self._conclusion_results = None
+        self._conclusion_lines = None
+        
+        # Static text and panels, rasterized once as blend sprites; the panel
+        # interiors are opaque and copied as one slice each
+        self._subtitle_x = (width - cv2.getTextSize(self.SUBTITLE, cv2.FONT_HERSHEY_SIMPLEX, 1.2, 3)[0][0]) // 2
+        self._title_sprite = render_blend_sprite(self._draw_title_text, width, height)
+        self._hud_sprite = render_blend_sprite(self._draw_hud_panel, width, height, (10, 221, 10, 451))
+        legend_x = width - 280
+        legend_y = 50
+        self._legend_sprite = render_blend_sprite(
+            self._draw_legend_panel, width, height, (legend_y - 10, legend_y + 161, legend_x - 10, legend_x + 271))
+        
+    def _next_frame_buffer(self):
+        """Take the next reusable frame buffer from the ring"""
+        frame = self._frames[self._frame_idx]
+        self._frame_idx = (self._frame_idx + 1) % len(self._frames)
+        return frame
+    
+    def _animated_background(self, time_factor, r, g, b):
+        """Build the animated sinusoid gradient for one frame into a reusable buffer
+        
+        r, g and b are (offset, amplitude) pairs for the terms in x, y and x + y.
+        """
+        # The gradient is smooth, so it is evaluated on a coarse tile and upsampled
+        if self._grid_x is None:
+            tile_w = max(self.width // BACKGROUND_TILE_SCALE, 1)
+            tile_h = max(self.height // BACKGROUND_TILE_SCALE, 1)
+            # Full-resolution pixel coordinates of the tile samples, matching
+            # the pixel-center mapping used by cv2.resize
+            xs = (np.arange(tile_w, dtype=np.float32) + 0.5) * (self.width / tile_w) - 0.5
+            ys = (np.arange(tile_h, dtype=np.float32)[:, None] + 0.5) * (self.height / tile_h) - 0.5
+            self._grid_x = xs * 0.01
+            self._grid_y = ys * 0.01
+            self._grid_xy = (xs + ys) * 0.005
+        
+        # Channel assignment broadcasts the row and column terms and
+        # truncates like the int() casts did
+        tile = np.empty((self._grid_y.shape[0], self._grid_x.shape[0], 3), dtype=np.uint8)
+        tile[..., 0] = r[0] + r[1] * np.sin(self._grid_x + time_factor)
+        tile[..., 1] = g[0] + g[1] * np.sin(self._grid_y + time_factor)
+        tile[..., 2] = b[0] + b[1] * np.sin(self._grid_xy + time_factor)
+        return cv2.resize(tile, (self.width, self.height), dst=self._next_frame_buffer(),
+                          interpolation=cv2.INTER_LINEAR)
+    
     def create_title_screen(self):
         """Create title screen for learning demo"""
-        frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-        
         # Animated background
-        for y in range(self.height):
-            for x in range(self.width):
-                time_factor = self.animation_frame * 0.02
-                r = int(30 + 20 * np.sin(x * 0.01 + time_factor))
-                g = int(50 + 30 * np.sin(y * 0.01 + time_factor))
-                b = int(80 + 40 * np.sin((x + y) * 0.005 + time_factor))
-                frame[y, x] = [r, g, b]
+        time_factor = self.animation_frame * 0.02
+        frame = self._animated_background(time_factor, (30, 20), (50, 30), (80, 40))
         
-        # Title
-        title = "UAV Learning to Chase Bird Swarms"
-        subtitle = "Adaptive Path Planning & Target Acquisition"
+        # Title with glow and phase names, blended from the cached overlay
+        blit_blend_sprite(frame, self._title_sprite)
+        
+        # Subtitle
+        subtitle_y = self.height // 2 + 20
+        color_val = int(200 + 55 * np.sin(self.animation_frame * 0.1))
+        cv2.putText(frame, self.SUBTITLE, (self._subtitle_x, subtitle_y), cv2.FONT_HERSHEY_SIMPLEX, 1.2,
+                    (color_val, color_val, color_val), 3)
         
+        return frame
+    
+    @staticmethod
+    def _build_uav_sprite(color):
+        """Rasterize the UAV shadow, body and outline once as (pixels, mask), centred on the UAV"""
+        half = 18 + 4 + 2  # Radius, shadow offset and outline overhang
+        size = 2 * half + 1
+        pixels = np.zeros((size, size, 3), dtype=np.uint8)
+        coverage = np.zeros((size, size), dtype=np.uint8)
+        for canvas, shadow, body, outline in ((pixels, (15, 15, 15), color, (255, 255, 255)),
+                                              (coverage, 255, 255, 255)):
+            cv2.circle(canvas, (half+4, half+4), 18, shadow, -1)
+            cv2.circle(canvas, (half, half), 18, body, -1)
+            cv2.circle(canvas, (half, half), 18, outline, 3, lineType=cv2.LINE_4)
+        mask = np.repeat(coverage.astype(bool)[..., None], 3, axis=2)
+        return pixels, mask
+    
+    @staticmethod
+    def _stamp_sprite(frame, sprite, center):
+        """Copy a sprite's covered pixels centred on a point, clipped to the frame"""
+        pixels, mask = sprite
+        height, width = frame.shape[:2]
+        half = mask.shape[0] // 2
+        x, y = center
+        x0, y0 = max(x - half, 0), max(y - half, 0)
+        x1, y1 = min(x + half + 1, width), min(y + half + 1, height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        sx, sy = x0 - (x - half), y0 - (y - half)
+        np.copyto(frame[y0:y1, x0:x1], pixels[sy:sy + (y1 - y0), sx:sx + (x1 - x0)],
+                  where=mask[sy:sy + (y1 - y0), sx:sx + (x1 - x0)])
+    
+    def _draw_title_text(self, frame):
+        """Draw the static title screen text: the glowing title and phase names"""
         font_large = cv2.FONT_HERSHEY_DUPLEX
         font_small = cv2.FONT_HERSHEY_SIMPLEX
         
         # Title with glow
-        title_size = cv2.getTextSize(title, font_large, 2.5, 5)[0]
+        title_size = cv2.getTextSize(self.TITLE, font_large, 2.5, 5)[0]
         title_x = (self.width - title_size[0]) // 2
         title_y = self.height // 2 - 80
         
         for i in range(5, 0, -1):
             alpha = 0.3 - i * 0.05
             color = (int(255 * alpha), int(255 * alpha), int(255 * alpha))
-            cv2.putText(frame, title, (title_x, title_y), font_large, 2.5, color, i)
+            cv2.putText(frame, self.TITLE, (title_x, title_y), font_large, 2.5, color, i)
         
-        cv2.putText(frame, title, (title_x, title_y), font_large, 2.5, (255, 255, 255), 5)
-        
-        # Subtitle
-        subtitle_size = cv2.getTextSize(subtitle, font_small, 1.2, 3)[0]
-        subtitle_x = (self.width - subtitle_size[0]) // 2
-        subtitle_y = self.height // 2 + 20
-        
-        color_val = int(200 + 55 * np.sin(self.animation_frame * 0.1))
-        cv2.putText(frame, subtitle, (subtitle_x, subtitle_y), font_small, 1.2, (color_val, color_val, color_val), 3)
+        cv2.putText(frame, self.TITLE, (title_x, title_y), font_large, 2.5, (255, 255, 255), 5)
         
         # Learning phases indicator
         phases = ["EXPLORATION", "LEARNING", "OPTIMIZATION"]
@@ -292,71 +456,106 @@ class LearningVideoGenerator:
             x = phase_x + i * 300
             color = (100, 100, 100) if i == 0 else (150, 150, 150)
             cv2.putText(frame, phase, (x, phase_y), font_small, 0.8, color, 2)
+    
+    def _draw_hud_panel(self, frame):
+        """Draw the metrics panel and progress label without the live values"""
+        # Main panel
+        cv2.rectangle(frame, (10, 10), (450, 220), (0, 0, 0), -1)
+        cv2.rectangle(frame, (10, 10), (450, 220), (255, 255, 255), 2)
         
-        return frame
+        # Title
+        cv2.putText(frame, "UAV Learning Simulation", (20, 40), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.9, (255, 255, 255), 2)
+        
+        # Phase progress indicator
+        cv2.putText(frame, "Learning Progress:", (20, 250), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
     
-    def create_learning_simulation_frame(self):
-        """Create simulation frame showing learning process"""
-        frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+    def _draw_legend_panel(self, frame):
+        """Draw the enhanced legend"""
+        legend_x = self.width - 280
+        legend_y = 50
         
-        # Create gradient background
-        for y in range(self.height):
-            color = int(20 + (y / self.height) * 60)
-            frame[y, :] = [color//3, color//2, color]
+        cv2.rectangle(frame, (legend_x-10, legend_y-10), (legend_x+270, legend_y+160), (0, 0, 0), -1)
+        cv2.rectangle(frame, (legend_x-10, legend_y-10), (legend_x+270, legend_y+160), (255, 255, 255), 2)
+        
+        cv2.putText(frame, "Legend:", (legend_x, legend_y), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+        
+        legend_items = [
+            ((255, 128, 0), "UAV (Exploration)"),
+            ((255, 255, 0), "UAV (Learning)"),
+            ((0, 255, 0), "UAV (Optimization)"),
+            ((0, 255, 0), "Birds (High Energy)"),
+            ((255, 255, 0), "Birds (Medium Energy)"),
+            ((255, 128, 0), "Birds (Low Energy)"),
+            ((255, 255, 0), "Target Line"),
+            ((0, 255, 255), "Prediction")
+        ]
+        
+        for i, (color, label) in enumerate(legend_items):
+            y_pos = legend_y + 25 + i * 18
+            cv2.circle(frame, (legend_x, y_pos), 6, color, -1)
+            cv2.putText(frame, label, (legend_x + 15, y_pos + 5), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+    
+    def _build_sim_background(self):
+        """Render the static gradient and grid behind the simulation"""
+        # Vertical gradient, one color per row
+        ys = np.arange(self.height)
+        color = (20 + ys / self.height * 60).astype(np.int32)
+        rows = np.stack([color // 3, color // 2, color], axis=-1).astype(np.uint8)
+        background = np.ascontiguousarray(np.broadcast_to(rows[:, None, :], (self.height, self.width, 3)))
         
         # Add subtle grid
         for x in range(0, self.width, 100):
-            cv2.line(frame, (x, 0), (x, self.height), (30, 30, 30), 1)
+            cv2.line(background, (x, 0), (x, self.height), (30, 30, 30), 1)
         for y in range(0, self.height, 100):
-            cv2.line(frame, (0, y), (self.width, y), (30, 30, 30), 1)
+            cv2.line(background, (0, y), (self.width, y), (30, 30, 30), 1)
+        
+        return background
+    
+    def create_learning_simulation_frame(self):
+        """Create simulation frame showing learning process"""
+        # Start from the static gradient and grid
+        frame = self._next_frame_buffer()
+        np.copyto(frame, self._sim_background)
         
         # Update bird swarm
         self.bird_swarm.update()
         
-        # Draw birds with enhanced visuals
-        for bird in self.bird_swarm.birds:
-            x, y = int(bird.position[0]), int(bird.position[1])
-            
-            # Shadow
+        # Draw birds with enhanced visuals, one layer at a time for the whole flock;
+        # pixel positions and colors come from the flock arrays in one batch
+        flock = self.bird_swarm.flock
+        pts = flock.positions.astype(np.int32)
+        pixels = pts.tolist()
+        bird_colors = flock.get_colors().tolist()
+        state_colors = STATE_COLORS[flock.states].tolist()
+        
+        # Shadows
+        for x, y in pixels:
             cv2.circle(frame, (x+3, y+3), 12, (15, 15, 15), -1)
-            
-            # Bird body
-            color = bird.get_color()
+        
+        # Bird bodies
+        for (x, y), color in zip(pixels, bird_colors):
             cv2.circle(frame, (x, y), 12, color, -1)
-            cv2.circle(frame, (x, y), 12, (255, 255, 255), 2)
-            
-            # Direction indicator
-            direction_x = int(x + bird.velocity[0] * 8)
-            direction_y = int(y + bird.velocity[1] * 8)
-            cv2.line(frame, (x, y), (direction_x, direction_y), (255, 255, 255), 2)
-            
-            # State indicator
-            state_colors = {
-                'CRUISING': (0, 255, 0),
-                'SOARING': (255, 255, 0),
-                'GLIDING': (0, 255, 255),
-                'PERCHED': (128, 128, 128),
-                'TAKING_OFF': (255, 128, 0)
-            }
-            state_color = state_colors.get(bird.state, (255, 255, 255))
+            cv2.circle(frame, (x, y), 12, (255, 255, 255), 2, lineType=cv2.LINE_4)
+        
+        # Direction indicators, all segments in a single call
+        tips = (pts + flock.velocities * 8).astype(np.int32)
+        segments = np.stack([pts, tips], axis=1)
+        cv2.polylines(frame, list(segments), False, (255, 255, 255), 2)
+        
+        # State indicators
+        for (x, y), state_color in zip(pixels, state_colors):
             cv2.circle(frame, (x+18, y-18), 6, state_color, -1)
         
         # Update and draw UAV
-        self.uav.update(self.bird_swarm.birds)
+        self.uav.update(self.bird_swarm.flock)
         uav_x, uav_y = int(self.uav.position[0]), int(self.uav.position[1])
         
-        # UAV shadow
-        cv2.circle(frame, (uav_x+4, uav_y+4), 18, (15, 15, 15), -1)
-        
-        # UAV body with learning phase color
-        phase_colors = {
-            "EXPLORATION": (255, 128, 0),  # Orange
-            "LEARNING": (255, 255, 0),     # Yellow
-            "OPTIMIZATION": (0, 255, 0)    # Green
-        }
-        uav_color = phase_colors.get(self.uav.learning_phase, (255, 0, 0))
-        cv2.circle(frame, (uav_x, uav_y), 18, uav_color, -1)
-        cv2.circle(frame, (uav_x, uav_y), 18, (255, 255, 255), 3)
+        # UAV shadow and body with learning phase color, stamped in one copy
+        self._stamp_sprite(frame, self._uav_sprites[self.uav.phase_id], (uav_x, uav_y))
         
         # UAV direction
         direction_x = int(uav_x + self.uav.velocity[0] * 10)
@@ -364,30 +563,26 @@ class LearningVideoGenerator:
         cv2.line(frame, (uav_x, uav_y), (direction_x, direction_y), (255, 255, 255), 4)
         
         # Target line and prediction
-        if self.uav.target_bird:
-            target_x, target_y = int(self.uav.target_bird.position[0]), int(self.uav.target_bird.position[1])
+        if self.uav.target_index >= 0:
+            target_x, target_y = flock.positions[self.uav.target_index].astype(np.int32).tolist()
             
             # Current target line
             cv2.line(frame, (uav_x, uav_y), (target_x, target_y), (255, 255, 0), 3)
             
             # Prediction line (in learning phases)
-            if self.uav.learning_phase in ["LEARNING", "OPTIMIZATION"]:
-                pred_x = int(target_x + self.uav.target_bird.velocity[0] * 10)
-                pred_y = int(target_y + self.uav.target_bird.velocity[1] * 10)
+            if self.uav.phase_id != EXPLORATION:
+                target_vx, target_vy = flock.velocities[self.uav.target_index].tolist()
+                pred_x = int(target_x + target_vx * 10)
+                pred_y = int(target_y + target_vy * 10)
                 cv2.line(frame, (target_x, target_y), (pred_x, pred_y), (0, 255, 255), 2)
                 cv2.circle(frame, (pred_x, pred_y), 8, (0, 255, 255), 2)
             
             # Target indicator
             cv2.circle(frame, (target_x, target_y), 18, (255, 255, 0), 2)
         
-        # Enhanced UI with learning metrics
-        # Main panel
-        cv2.rectangle(frame, (10, 10), (450, 220), (0, 0, 0), -1)
-        cv2.rectangle(frame, (10, 10), (450, 220), (255, 255, 255), 2)
-        
-        # Title
-        cv2.putText(frame, "UAV Learning Simulation", (20, 40), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.9, (255, 255, 255), 2)
+        # Enhanced UI with learning metrics: pre-rendered panels, then the live values
+        blit_blend_sprite(frame, self._hud_sprite)
+        blit_blend_sprite(frame, self._legend_sprite)
         
         # Learning metrics
         cv2.putText(frame, f"Phase: {self.uav.learning_phase}", (20, 70), 
@@ -401,11 +596,9 @@ class LearningVideoGenerator:
         cv2.putText(frame, f"Energy: {self.uav.energy:.1f}%", (20, 190), 
                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
         
-        # Phase progress indicator
+        # Phase progress indicator, below its pre-drawn label
         phase_x = 20
         phase_y = 250
-        cv2.putText(frame, "Learning Progress:", (phase_x, phase_y), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
         
         # Progress bar
         bar_width = 400
@@ -417,9 +610,9 @@ class LearningVideoGenerator:
         cv2.rectangle(frame, (bar_x, bar_y), (bar_x + bar_width, bar_y + bar_height), (100, 100, 100), -1)
         
         # Progress based on learning phase
-        if self.uav.learning_phase == "EXPLORATION":
+        if self.uav.phase_id == EXPLORATION:
             progress = min(1.0, self.uav.phase_timer / 300)
-        elif self.uav.learning_phase == "LEARNING":
+        elif self.uav.phase_id == LEARNING:
             progress = 0.33 + min(0.33, (self.uav.phase_timer - 300) / 300)
         else:
             progress = 0.66 + min(0.34, (self.uav.phase_timer - 600) / 300)
@@ -434,52 +627,35 @@ class LearningVideoGenerator:
             color = (255, 255, 255) if i * 0.33 <= progress else (100, 100, 100)
             cv2.putText(frame, label, (x, bar_y + 40), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1)
         
-        # Enhanced legend
-        legend_x = self.width - 280
-        legend_y = 50
-        
-        cv2.rectangle(frame, (legend_x-10, legend_y-10), (legend_x+270, legend_y+160), (0, 0, 0), -1)
-        cv2.rectangle(frame, (legend_x-10, legend_y-10), (legend_x+270, legend_y+160), (255, 255, 255), 2)
-        
-        cv2.putText(frame, "Legend:", (legend_x, legend_y), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        
-        legend_items = [
-            ((255, 128, 0), "UAV (Exploration)"),
-            ((255, 255, 0), "UAV (Learning)"),
-            ((0, 255, 0), "UAV (Optimization)"),
-            ((0, 255, 0), "Birds (High Energy)"),
-            ((255, 255, 0), "Birds (Medium Energy)"),
-            ((255, 128, 0), "Birds (Low Energy)"),
-            ((255, 255, 0), "Target Line"),
-            ((0, 255, 255), "Prediction")
-        ]
-        
-        for i, (color, label) in enumerate(legend_items):
-            y_pos = legend_y + 25 + i * 18
-            cv2.circle(frame, (legend_x, y_pos), 6, color, -1)
-            cv2.putText(frame, label, (legend_x + 15, y_pos + 5), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-        
         return frame
     
     def create_conclusion_screen(self):
         """Create conclusion screen showing learning results"""
-        frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-        
         # Animated background
-        for y in range(self.height):
-            for x in range(self.width):
-                time_factor = self.animation_frame * 0.01
-                r = int(20 + 10 * np.sin(x * 0.01 + time_factor))
-                g = int(30 + 15 * np.sin(y * 0.01 + time_factor))
-                b = int(40 + 20 * np.sin((x + y) * 0.005 + time_factor))
-                frame[y, x] = [r, g, b]
+        time_factor = self.animation_frame * 0.01
+        frame = self._animated_background(time_factor, (20, 10), (30, 15), (40, 20))
         
         # Title
         cv2.putText(frame, "Learning Complete", (50, 100), cv2.FONT_HERSHEY_DUPLEX, 3, (255, 255, 255), 4)
         
-        # Results
+        # Results, styled once per set of learning results
+        results = (self.uav.adaptation_level, self.uav.prediction_accuracy,
+                   self.uav.successful_captures, self.uav.total_attempts)
+        if results != self._conclusion_results:
+            self._conclusion_results = results
+            self._conclusion_lines = self._style_conclusion_lines()
+        
+        # Animated text appearance: line i shows once animation_frame > i * 8
+        visible = (self.animation_frame + 7) // 8
+        for i, line, y, color in self._conclusion_lines:
+            if i >= visible:
+                break
+            cv2.putText(frame, line, (50, y), cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
+        
+        return frame
+    
+    def _style_conclusion_lines(self):
+        """Lay out the conclusion text as (index, line, y, color) for each non-empty line"""
         success_rate = self.uav.successful_captures / max(1, self.uav.total_attempts) * 100
         
         content = [
@@ -512,24 +688,21 @@ class LearningVideoGenerator:
             "Supervisors: Lebelo Serutla, Dr Alfred Mwanza"
         ]
         
+        lines = []
         y_start = 200
         for i, line in enumerate(content):
-            y = y_start + i * 35
-            
-            # Animated text appearance
-            if self.animation_frame > i * 8:
-                if line.startswith("•"):
-                    color = (0, 255, 255)
-                elif "Author:" in line or "Email:" in line or "Institution:" in line or "Supervisors:" in line:
-                    color = (255, 255, 0)
-                elif "Learning Results:" in line or "Learning Phases Completed:" in line or "The UAV has learned to:" in line:
-                    color = (255, 255, 255)
-                else:
-                    color = (200, 200, 200)
-                
-                cv2.putText(frame, line, (50, y), cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
-        
-        return frame
+            if not line:
+                continue
+            if line.startswith("•"):
+                color = (0, 255, 255)
+            elif "Author:" in line or "Email:" in line or "Institution:" in line or "Supervisors:" in line:
+                color = (255, 255, 0)
+            elif "Learning Results:" in line or "Learning Phases Completed:" in line or "The UAV has learned to:" in line:
+                color = (255, 255, 255)
+            else:
+                color = (200, 200, 200)
+            lines.append((i, line, y_start + i * 35, color))
+        return lines
     
     def generate_learning_video(self):
         """Generate the complete learning demo video"""
@@ -567,7 +740,7 @@ class LearningVideoGenerator:
                 progress = (frame_num / total_frames) * 100
                 print(f"Progress: {progress:.1f}%")
         
-        # Release video writer
+        # Flush queued frames and release video writer
         self.video_writer.release()
         
         print(f"Learning video generation complete: {self.output_filename}")
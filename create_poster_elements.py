@@ -4,37 +4,130 @@ Poster Design Elements Generator
 Creates visual elements for UAV Path Planning poster
 """
 
-import cv2
+import hashlib
+import io
+import os
+from functools import lru_cache
+from multiprocessing import get_context
+from pathlib import Path
+
 import numpy as np
+import matplotlib
+# Elements are only ever saved to file; skip loading a GUI backend
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch, ConnectionPatch, Circle, Rectangle
-import seaborn as sns
-from datetime import datetime
+from matplotlib.patches import BoxStyle, FancyBboxPatch, ConnectionPatch, Circle, Rectangle
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.font_manager import FontProperties
+
+try:
+    import cairosvg
+    CAIROSVG_AVAILABLE = True
+except (ImportError, OSError):
+    # OSError: the package is installed but the cairo library is missing
+    CAIROSVG_AVAILABLE = False
+
+# Colors shared by every poster element
+PALETTE = {
+    'title': '#2c3e50',
+    'text': '#34495e',
+    'accent': '#3498db',
+    'good': '#27ae60',
+    'background': '#f8f9fa',
+}
+
+# Style applied once for all elements (font avoids emoji issues)
+plt.rcParams.update({
+    'font.family': 'DejaVu Sans',
+    'axes.spines.top': False,
+    'axes.spines.right': False,
+    'axes.grid': True,
+    'grid.alpha': 0.3,
+    'xtick.color': PALETTE['text'],
+    'ytick.color': PALETTE['text'],
+})
+
+# Rounded box styles, built once rather than parsed from a string per patch
+ROUND_001 = BoxStyle('Round', pad=0.01)
+ROUND_002 = BoxStyle('Round', pad=0.02)
+ROUND_02 = BoxStyle('Round', pad=0.2)
+ROUND_03 = BoxStyle('Round', pad=0.3)
+
+# Text box for highlighted results
+GOOD_BADGE = dict(boxstyle=ROUND_03, facecolor='white', edgecolor=PALETTE['good'])
+
+@lru_cache(maxsize=None)
+def _font(size, weight='bold'):
+    """Shared font properties for one text size and weight"""
+    return FontProperties(family='DejaVu Sans', weight=weight, size=size)
 
 class PosterElementGenerator:
-    def __init__(self, width=1200, height=800):
+    # Each element has a create_<name> method that saves <name>.png
+    ELEMENTS = ('iconography', 'flow_diagram', 'comparison_table',
+                'system_architecture', 'performance_chart')
+    
+    def __init__(self, width=1200, height=800, dpi=150, thumbnail_width=None):
         self.width = width
         self.height = height
-        self.output_dir = "poster_elements"
-        
-        # Create output directory
-        import os
-        os.makedirs(self.output_dir, exist_ok=True)
-        
-        # Set font to avoid emoji issues
-        plt.rcParams['font.family'] = 'DejaVu Sans'
+        # Output resolution; pass dpi=300 for print-quality elements
+        self.dpi = dpi
+        # Pixel width of an optional <name>_thumb.png written next to each element
+        self.thumbnail_width = thumbnail_width
+        self.output_dir = Path("poster_elements")
+        
+        # Create output directory and the PNG path of every element
+        self.output_dir.mkdir(exist_ok=True)
+        self.paths = {name: self.output_dir / f'{name}.png' for name in self.ELEMENTS}
+        
+        # One figure is cleared and reused for every element; constrained
+        # layout sizes it up front so saving renders each element only once
+        self._fig = plt.figure(figsize=(14, 10), layout='constrained')
+        
+    def _new_figure(self, width, height):
+        """Clear the shared figure and resize it for the next element"""
+        fig = self._fig
+        fig.clf()
+        fig.set_size_inches(width, height)
+        return fig
+        
+    def _save_figure(self, name):
+        """Write the shared figure as an element's PNG, plus its thumbnail"""
+        path = self.paths[name]
+        thumbnail_path = path.with_name(f'{name}_thumb.png')
+        if self.thumbnail_width and CAIROSVG_AVAILABLE:
+            # Draw the figure once as SVG and rasterize both sizes from that
+            svg = io.BytesIO()
+            self._fig.savefig(svg, format='svg')
+            width = round(self._fig.get_figwidth() * self.dpi)
+            for out_path, out_width in ((path, width), (thumbnail_path, self.thumbnail_width)):
+                cairosvg.svg2png(bytestring=svg.getvalue(), write_to=str(out_path),
+                                 output_width=out_width)
+            return
+        
+        # Flat-colored diagrams barely shrink past zlib level 3, and writing is much faster
+        png_kwargs = dict(metadata={'Software': None},
+                          pil_kwargs={'compress_level': 3, 'optimize': False})
+        # Print straight from the Agg canvas; savefig would only resolve
+        # defaults and swap the dpi in and out around the same call
+        fig = self._fig
+        fig.set_dpi(self.dpi)
+        fig.canvas.print_png(path, **png_kwargs)
+        if self.thumbnail_width:
+            fig.set_dpi(self.thumbnail_width / fig.get_figwidth())
+            fig.canvas.print_png(thumbnail_path, **png_kwargs)
         
     def create_iconography(self):
         """Create iconography section for the poster"""
-        fig, ax = plt.subplots(1, 1, figsize=(12, 8))
+        fig = self._new_figure(12, 8)
+        ax = fig.add_subplot(111)
+        to_axes = ax.transAxes
         fig.patch.set_facecolor('#f0f0f0')
         ax.set_facecolor('#f0f0f0')
         
         # Title
         ax.text(0.5, 0.95, 'UAV Path Planning System Components', 
-                fontsize=24, fontweight='bold', ha='center', va='center',
-                transform=ax.transAxes, color='#2c3e50')
+                fontproperties=_font(24), ha='center', va='center',
+                transform=to_axes, color=PALETTE['title'])
         
         # Define components and their positions
         components = [
@@ -52,21 +145,21 @@ class PosterElementGenerator:
             ('S', 'Safety Features', 0.75, 0.1)
         ]
         
+        # Background circles, added as one collection
+        circles = [Circle((x, y + 0.1), 0.08) for _, _, x, y in components]
+        ax.add_collection(PatchCollection(circles, facecolor='white', edgecolor=PALETTE['accent'],
+                                          linewidth=2, alpha=0.8))
+        
         # Draw components and labels
         for icon, label, x, y in components:
-            # Background circle
-            circle = Circle((x, y + 0.1), 0.08, facecolor='white', 
-                              edgecolor='#3498db', linewidth=2, alpha=0.8)
-            ax.add_patch(circle)
-            
             # Icon text
-            ax.text(x, y + 0.1, icon, fontsize=16, fontweight='bold', ha='center', va='center',
-                   transform=ax.transAxes, color='#3498db')
+            ax.text(x, y + 0.1, icon, fontproperties=_font(16), ha='center', va='center',
+                   transform=to_axes, color=PALETTE['accent'])
             
             # Label
-            ax.text(x, y - 0.05, label, fontsize=10, fontweight='bold', 
-                   ha='center', va='center', transform=ax.transAxes,
-                   color='#34495e')
+            ax.text(x, y - 0.05, label, fontproperties=_font(10), 
+                   ha='center', va='center', transform=to_axes,
+                   color=PALETTE['text'])
         
         # Remove axes
         ax.set_xlim(0, 1)
@@ -74,22 +167,22 @@ class PosterElementGenerator:
         ax.axis('off')
         
         # Save
-        plt.tight_layout()
-        plt.savefig(f'{self.output_dir}/iconography.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_figure('iconography')
         
         print("Iconography created: poster_elements/iconography.png")
         
     def create_flow_diagram(self):
         """Create flow diagram showing the pipeline"""
-        fig, ax = plt.subplots(1, 1, figsize=(14, 8))
-        fig.patch.set_facecolor('#f8f9fa')
-        ax.set_facecolor('#f8f9fa')
+        fig = self._new_figure(14, 8)
+        ax = fig.add_subplot(111)
+        to_axes = ax.transAxes
+        fig.patch.set_facecolor(PALETTE['background'])
+        ax.set_facecolor(PALETTE['background'])
         
         # Title
         ax.text(0.5, 0.95, 'UAV Path Planning Pipeline', 
-                fontsize=24, fontweight='bold', ha='center', va='center',
-                transform=ax.transAxes, color='#2c3e50')
+                fontproperties=_font(24), ha='center', va='center',
+                transform=to_axes, color=PALETTE['title'])
         
         # Define components
         components = [
@@ -101,63 +194,47 @@ class PosterElementGenerator:
             ('UAV', 'UAV Action', 0.85, 0.5, '#2980b9')
         ]
         
+        # Background boxes, added as one collection
+        boxes = [FancyBboxPatch((x-0.08, y-0.15), 0.16, 0.3, boxstyle=ROUND_002)
+                 for _, _, x, y, _ in components]
+        ax.add_collection(PatchCollection(boxes, facecolor=[c[4] for c in components],
+                                          edgecolor='white', linewidth=2))
+        
         # Draw components
         for icon, label, x, y, color in components:
-            # Background box
-            box = FancyBboxPatch((x-0.08, y-0.15), 0.16, 0.3,
-                               boxstyle="round,pad=0.02",
-                               facecolor=color, edgecolor='white', linewidth=2)
-            ax.add_patch(box)
-            
             # Icon
-            ax.text(x, y + 0.05, icon, fontsize=14, fontweight='bold', ha='center', va='center',
-                   transform=ax.transAxes, color='white')
+            ax.text(x, y + 0.05, icon, fontproperties=_font(14), ha='center', va='center',
+                   transform=to_axes, color='white')
             
             # Label
-            ax.text(x, y - 0.08, label, fontsize=9, fontweight='bold', 
-                   ha='center', va='center', transform=ax.transAxes,
+            ax.text(x, y - 0.08, label, fontproperties=_font(9), 
+                   ha='center', va='center', transform=to_axes,
                    color='white')
         
+        # Arrow end points between neighboring boxes
+        xs = np.array([c[2] for c in components])
+        ys = np.array([c[3] for c in components])
+        arrow_labels = ['Object Detection', 'Multi-Object Tracking', 'Reinforcement Learning',
+                        'Path Planning', 'Execution']
+        
         # Draw arrows
-        for i in range(len(components) - 1):
-            x1 = components[i][2] + 0.08
-            x2 = components[i+1][2] - 0.08
-            y = components[i][3]
-            
+        for x1, x2, y, arrow_label in zip(xs[:-1] + 0.08, xs[1:] - 0.08, ys[:-1], arrow_labels):
             # Arrow
             arrow = ConnectionPatch((x1, y), (x2, y), "data", "data",
                                   arrowstyle="->", shrinkA=5, shrinkB=5,
-                                  mutation_scale=20, fc="#34495e", ec="#34495e",
+                                  mutation_scale=20, fc=PALETTE['text'], ec=PALETTE['text'],
                                   linewidth=2)
             ax.add_patch(arrow)
             
             # Arrow label
-            if i == 0:
-                ax.text((x1 + x2)/2, y + 0.2, 'Object Detection', 
-                       fontsize=8, ha='center', va='center',
-                       transform=ax.transAxes, color='#34495e')
-            elif i == 1:
-                ax.text((x1 + x2)/2, y + 0.2, 'Multi-Object Tracking', 
-                       fontsize=8, ha='center', va='center',
-                       transform=ax.transAxes, color='#34495e')
-            elif i == 2:
-                ax.text((x1 + x2)/2, y + 0.2, 'Reinforcement Learning', 
-                       fontsize=8, ha='center', va='center',
-                       transform=ax.transAxes, color='#34495e')
-            elif i == 3:
-                ax.text((x1 + x2)/2, y + 0.2, 'Path Planning', 
-                       fontsize=8, ha='center', va='center',
-                       transform=ax.transAxes, color='#34495e')
-            elif i == 4:
-                ax.text((x1 + x2)/2, y + 0.2, 'Execution', 
-                       fontsize=8, ha='center', va='center',
-                       transform=ax.transAxes, color='#34495e')
+            ax.text((x1 + x2)/2, y + 0.2, arrow_label, 
+                   fontproperties=_font(8, 'normal'), ha='center', va='center',
+                   transform=to_axes, color=PALETTE['text'])
         
         # Add performance indicators
         ax.text(0.5, 0.15, 'Real-time Processing | High Accuracy | Adaptive Learning', 
-               fontsize=14, fontweight='bold', ha='center', va='center',
-               transform=ax.transAxes, color='#27ae60',
-               bbox=dict(boxstyle="round,pad=0.3", facecolor='white', edgecolor='#27ae60'))
+               fontproperties=_font(14), ha='center', va='center',
+               transform=to_axes, color=PALETTE['good'], bbox=GOOD_BADGE)
         
         # Remove axes
         ax.set_xlim(0, 1)
@@ -165,22 +242,22 @@ class PosterElementGenerator:
         ax.axis('off')
         
         # Save
-        plt.tight_layout()
-        plt.savefig(f'{self.output_dir}/flow_diagram.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_figure('flow_diagram')
         
         print("Flow diagram created: poster_elements/flow_diagram.png")
         
     def create_comparison_table(self):
         """Create comparison table highlighting performance gains"""
-        fig, ax = plt.subplots(1, 1, figsize=(12, 8))
-        fig.patch.set_facecolor('#f8f9fa')
-        ax.set_facecolor('#f8f9fa')
+        fig = self._new_figure(12, 8)
+        ax = fig.add_subplot(111)
+        to_axes = ax.transAxes
+        fig.patch.set_facecolor(PALETTE['background'])
+        ax.set_facecolor(PALETTE['background'])
         
         # Title
         ax.text(0.5, 0.95, 'Performance Comparison: Our Approach vs Baselines', 
-                fontsize=20, fontweight='bold', ha='center', va='center',
-                transform=ax.transAxes, color='#2c3e50')
+                fontproperties=_font(20), ha='center', va='center',
+                transform=to_axes, color=PALETTE['title'])
         
         # Define data
         metrics = ['Success Rate (%)', 'Path Efficiency (%)', 'Response Time (ms)', 
@@ -189,55 +266,44 @@ class PosterElementGenerator:
         a_star = [72.1, 65.8, 120, 92.1, 'None']
         vanilla_dqn = [68.4, 71.2, 85, 88.7, 'Low']
 
-        # Transpose data for table: each row is a metric, columns are methods
-        table_data = []
-        for i, metric in enumerate(metrics):
-            table_data.append([
-                metric,
-                our_approach[i],
-                a_star[i],
-                vanilla_dqn[i]
-            ])
+        # Table rows: the header, then one row per metric with a column per method
         column_labels = ['Metric', 'Our Approach\n(Hybrid DDQN)', 'A* Algorithm', 'Vanilla DQN']
-
-        # Colors for highlighting
-        colors = []
-        for i in range(len(metrics)):
-            row_colors = ['#ecf0f1', '#d5f4e6', '#fadbd8', '#fdeaa7']
-            colors.append(row_colors)
-
-        # Create table
-        table = ax.table(cellText=table_data, colLabels=column_labels,
-                        cellColours=colors, cellLoc='center',
-                        loc='center', bbox=None)
-
-        # Style the table
-        table.auto_set_font_size(False)
-        table.set_fontsize(12)
-        table.scale(1, 2)
-
-        # Highlight header
-        for i in range(len(column_labels)):
-            table[(0, i)].set_facecolor('#3498db')
-            table[(0, i)].set_text_props(weight='bold', color='white')
-
-        # Highlight our approach as best
-        for i in range(1, len(metrics) + 1):
-            table[(i, 1)].set_facecolor('#27ae60')
-            table[(i, 1)].set_text_props(weight='bold', color='white')
+        rows = [column_labels] + [list(row) for row in zip(metrics, our_approach, a_star, vanilla_dqn)]
+        
+        # Cell grid in axes coordinates: equal-width columns across the axes
+        # and rows stacked top to bottom, centered vertically
+        n_rows, n_cols = len(rows), len(column_labels)
+        cell_width, cell_height = 1 / n_cols, 0.054
+        xs = np.arange(n_cols) * cell_width
+        ys = 0.5 + (n_rows / 2 - 1 - np.arange(n_rows)) * cell_height
+        
+        # Colors for highlighting: blue header, our approach as best
+        row_colors = ['#ecf0f1', PALETTE['good'], '#fadbd8', '#fdeaa7']
+        cell_colors = [PALETTE['accent']] * n_cols + row_colors * len(metrics)
+        
+        # Cells as one collection, then their text
+        cells = [Rectangle((x, y), cell_width, cell_height) for y in ys for x in xs]
+        ax.add_collection(PatchCollection(cells, facecolor=cell_colors, edgecolor='black',
+                                          linewidth=1, transform=to_axes))
+        for r, (y, row) in enumerate(zip(ys + cell_height / 2, rows)):
+            for c, (x, text) in enumerate(zip(xs + cell_width / 2, row)):
+                highlighted = r == 0 or c == 1
+                ax.text(x, y, text, fontproperties=_font(12, 'bold' if highlighted else 'normal'),
+                        ha='center', va='center', color='white' if highlighted else 'black',
+                        transform=to_axes)
 
         # Add performance improvement arrows
         improvements = ['+32%', '+33%', '+47%', '+15%', 'N/A']
+        improvement_box = dict(boxstyle=ROUND_02, facecolor='white', edgecolor=PALETTE['good'])
         for i, improvement in enumerate(improvements):
             if improvement != 'N/A':
                 ax.text(0.85, 0.75 - i * 0.1, improvement, 
-                       fontsize=10, fontweight='bold', ha='center', va='center',
-                       transform=ax.transAxes, color='#27ae60',
-                       bbox=dict(boxstyle="round,pad=0.2", facecolor='white', edgecolor='#27ae60'))
+                       fontproperties=_font(10), ha='center', va='center',
+                       transform=to_axes, color=PALETTE['good'], bbox=improvement_box)
 
         # Add legend
         legend_elements = [
-            Rectangle((0, 0), 1, 1, facecolor='#27ae60', label='Best Performance'),
+            Rectangle((0, 0), 1, 1, facecolor=PALETTE['good'], label='Best Performance'),
             Rectangle((0, 0), 1, 1, facecolor='#fadbd8', label='Baseline A*'),
             Rectangle((0, 0), 1, 1, facecolor='#fdeaa7', label='Baseline DQN')
         ]
@@ -249,22 +315,22 @@ class PosterElementGenerator:
         ax.axis('off')
 
         # Save
-        plt.tight_layout()
-        plt.savefig(f'{self.output_dir}/comparison_table.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_figure('comparison_table')
 
         print("Comparison table created: poster_elements/comparison_table.png")
         
     def create_system_architecture(self):
         """Create system architecture diagram"""
-        fig, ax = plt.subplots(1, 1, figsize=(14, 10))
-        fig.patch.set_facecolor('#f8f9fa')
-        ax.set_facecolor('#f8f9fa')
+        fig = self._new_figure(14, 10)
+        ax = fig.add_subplot(111)
+        to_axes = ax.transAxes
+        fig.patch.set_facecolor(PALETTE['background'])
+        ax.set_facecolor(PALETTE['background'])
         
         # Title
         ax.text(0.5, 0.95, 'Hybrid UAV Path Planning System Architecture', 
-                fontsize=20, fontweight='bold', ha='center', va='center',
-                transform=ax.transAxes, color='#2c3e50')
+                fontproperties=_font(20), ha='center', va='center',
+                transform=to_axes, color=PALETTE['title'])
         
         # Define system layers
         layers = [
@@ -280,21 +346,21 @@ class PosterElementGenerator:
             ('COMM', 'Communication', 0.5, 0.15, '#34495e', 0.2, 0.06)
         ]
         
+        # Background boxes, added as one collection
+        boxes = [FancyBboxPatch((x-width/2, y-height/2), width, height, boxstyle=ROUND_001)
+                 for _, _, x, y, _, width, height in layers]
+        ax.add_collection(PatchCollection(boxes, facecolor=[layer[4] for layer in layers],
+                                          edgecolor='white', linewidth=2))
+        
         # Draw layers
         for icon, label, x, y, color, width, height in layers:
-            # Background box
-            box = FancyBboxPatch((x-width/2, y-height/2), width, height,
-                               boxstyle="round,pad=0.01",
-                               facecolor=color, edgecolor='white', linewidth=2)
-            ax.add_patch(box)
-            
             # Icon
-            ax.text(x, y + 0.02, icon, fontsize=12, fontweight='bold', ha='center', va='center',
-                   transform=ax.transAxes, color='white')
+            ax.text(x, y + 0.02, icon, fontproperties=_font(12), ha='center', va='center',
+                   transform=to_axes, color='white')
             
             # Label
-            ax.text(x, y - 0.02, label, fontsize=8, fontweight='bold', 
-                   ha='center', va='center', transform=ax.transAxes,
+            ax.text(x, y - 0.02, label, fontproperties=_font(8), 
+                   ha='center', va='center', transform=to_axes,
                    color='white')
         
         # Draw connections
@@ -312,25 +378,35 @@ class PosterElementGenerator:
             ((0.5, 0.22), (0.5, 0.12))   # Safety to Communication
         ]
         
-        for (x1, y1), (x2, y2) in connections:
-            arrow = ConnectionPatch((x1, y1), (x2, y2), "data", "data",
-                                  arrowstyle="->", shrinkA=5, shrinkB=5,
-                                  mutation_scale=15, fc="#34495e", ec="#34495e",
-                                  linewidth=1.5, alpha=0.7)
-            ax.add_patch(arrow)
+        # All arrows as one LineCollection. Each is a single stroke from its
+        # tail to the tip, out to one barb of the open head, back to the tip
+        # and out to the other barb. The geometry is laid out in inches so the
+        # heads keep their shape on the non-square axes
+        size = fig.get_size_inches()
+        starts, tips = np.array(connections).transpose(1, 0, 2) * size
+        direction = tips - starts
+        direction /= np.hypot(direction[:, 0], direction[:, 1])[:, None]
+        normal = direction[:, ::-1] * (-1, 1)
+        # Pull both ends in by 5 pt; heads are 6 pt long and 6 pt across
+        starts += direction * (5 / 72)
+        tips -= direction * (5 / 72)
+        back = tips - direction * (6 / 72)
+        arrows = np.stack([starts, tips, back + normal * (3 / 72), tips, back - normal * (3 / 72)],
+                          axis=1) / size
+        ax.add_collection(LineCollection(arrows, colors=PALETTE['text'], linewidths=1.5, alpha=0.7))
         
         # Add technology stack
         tech_stack = [
             'Python + Rust', 'PyTorch', 'OpenCV', 'ROS2',
             'TensorRT', 'CUDA', 'Real-time Linux'
         ]
+        tech_box = dict(boxstyle=ROUND_02, facecolor='white', edgecolor='#bdc3c7')
         
         for i, tech in enumerate(tech_stack):
             x = 0.1 + (i % 3) * 0.3
             y = 0.05 - (i // 3) * 0.03
-            ax.text(x, y, tech, fontsize=9, ha='center', va='center',
-                   transform=ax.transAxes, color='#34495e',
-                   bbox=dict(boxstyle="round,pad=0.2", facecolor='white', edgecolor='#bdc3c7'))
+            ax.text(x, y, tech, fontproperties=_font(9, 'normal'), ha='center', va='center',
+                   transform=to_axes, color=PALETTE['text'], bbox=tech_box)
         
         # Remove axes
         ax.set_xlim(0, 1)
@@ -338,19 +414,15 @@ class PosterElementGenerator:
         ax.axis('off')
         
         # Save
-        plt.tight_layout()
-        plt.savefig(f'{self.output_dir}/system_architecture.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_figure('system_architecture')
         
         print("System architecture created: poster_elements/system_architecture.png")
         
     def create_performance_chart(self):
         """Create performance visualization chart"""
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
-        fig.patch.set_facecolor('#f8f9fa')
-        
-        # Set style
-        plt.style.use('default')
+        fig = self._new_figure(12, 8)
+        ax = fig.add_subplot(111)
+        fig.patch.set_facecolor(PALETTE['background'])
         
         # Data
         methods = ['A*', 'Vanilla DQN', 'Our Approach\n(Hybrid DDQN)']
@@ -361,62 +433,109 @@ class PosterElementGenerator:
         # Color scheme
         colors = ['#e74c3c', '#f39c12', '#27ae60']
         
-        # Success Rate Chart
-        bars1 = ax1.bar(methods, success_rates, color=colors, alpha=0.8, edgecolor='white', linewidth=2)
-        ax1.set_title('Success Rate Comparison (%)', fontsize=16, fontweight='bold', color='#2c3e50')
-        ax1.set_ylabel('Success Rate (%)', fontsize=12, color='#34495e')
-        ax1.set_ylim(0, 100)
+        # Grouped bars: success rate (solid) on the left axis beside
+        # response time (hatched) on its own right axis for each method
+        x = np.arange(len(methods))
+        bar_width = 0.38
+        ax_ms = ax.twinx()
+        ax_ms.spines['right'].set_visible(True)
+        ax_ms.grid(False)
+        ax.bar(x - bar_width/2, success_rates, bar_width, color=colors, alpha=0.8,
+               edgecolor='white', linewidth=2)
+        ax_ms.bar(x + bar_width/2, response_times, bar_width, color=colors, alpha=0.45,
+                  edgecolor='white', linewidth=2, hatch='//')
+        ax.set_title('Success Rate and Response Time Comparison', fontproperties=_font(16),
+                     color=PALETTE['title'])
+        ax.set_ylabel('Success Rate (%)', fontproperties=_font(12, 'normal'),
+                      color=PALETTE['text'])
+        ax_ms.set_ylabel('Response Time (ms)', fontproperties=_font(12, 'normal'),
+                         color=PALETTE['text'])
+        ax.set_xticks(x)
+        ax.set_xticklabels(methods)
+        # Headroom above the tallest bars for the value labels and legend
+        ax.set_ylim(0, 120)
+        ax_ms.set_ylim(0, 160)
         
         # Add value labels on bars
-        for bar, value in zip(bars1, success_rates):
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + 1,
-                    f'{value}%', ha='center', va='bottom', fontweight='bold', fontsize=12)
+        for center, success, response in zip(x, success_rates, response_times):
+            ax.text(center - bar_width/2, success + 1, f'{success}%',
+                    ha='center', va='bottom', fontproperties=_font(12))
+            ax_ms.text(center + bar_width/2, response + 1, f'{response}ms',
+                       ha='center', va='bottom', fontproperties=_font(12))
         
-        # Response Time Chart
-        bars2 = ax2.bar(methods, response_times, color=colors, alpha=0.8, edgecolor='white', linewidth=2)
-        ax2.set_title('Response Time Comparison (ms)', fontsize=16, fontweight='bold', color='#2c3e50')
-        ax2.set_ylabel('Response Time (ms)', fontsize=12, color='#34495e')
-        ax2.set_ylim(0, 140)
-        
-        # Add value labels on bars
-        for bar, value in zip(bars2, response_times):
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height + 2,
-                    f'{value}ms', ha='center', va='bottom', fontweight='bold', fontsize=12)
-        
-        # Improve appearance
-        for ax in [ax1, ax2]:
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.grid(True, alpha=0.3)
-            ax.tick_params(colors='#34495e')
+        # Legend tells the two measures apart; the colors identify the method
+        legend_elements = [
+            Rectangle((0, 0), 1, 1, facecolor='#95a5a6', alpha=0.8, label='Success Rate (%)'),
+            Rectangle((0, 0), 1, 1, facecolor='#95a5a6', alpha=0.45, hatch='//',
+                      label='Response Time (ms)')
+        ]
+        # The twin axes draws over the first, so the legend goes on it
+        ax_ms.legend(handles=legend_elements, loc='upper right')
         
         # Add improvement indicators
-        ax1.text(2, 85, '↑ +32%', fontsize=12, fontweight='bold', color='#27ae60',
-                ha='center', va='center',
-                bbox=dict(boxstyle="round,pad=0.3", facecolor='white', edgecolor='#27ae60'))
+        ax.text(2 - bar_width/2, 85, '↑ +32%', fontproperties=_font(12), color=PALETTE['good'],
+                ha='center', va='center', bbox=GOOD_BADGE)
         
-        ax2.text(2, 35, '↓ -47%', fontsize=12, fontweight='bold', color='#27ae60',
-                ha='center', va='center',
-                bbox=dict(boxstyle="round,pad=0.3", facecolor='white', edgecolor='#27ae60'))
+        ax_ms.text(2 + bar_width/2, 30, '↓ -47%', fontproperties=_font(12), color=PALETTE['good'],
+                   ha='center', va='center', bbox=GOOD_BADGE)
         
-        plt.tight_layout()
-        plt.savefig(f'{self.output_dir}/performance_chart.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_figure('performance_chart')
         
         print("Performance chart created: poster_elements/performance_chart.png")
         
+    def _element_hash(self, name):
+        """Hash everything an element's images are rendered from"""
+        # Elements depend on module-level styles and helpers as well as their
+        # create_* method, so the whole module source is hashed, plus the
+        # rcParams in effect (matplotlibrc files can change those) and which
+        # path _save_figure takes
+        source = Path(__file__).read_bytes()
+        rc_params = sorted(plt.rcParams.items())
+        key = repr((name, rc_params, CAIROSVG_AVAILABLE, self.dpi, self.thumbnail_width,
+                    matplotlib.__version__))
+        return hashlib.sha256(source + key.encode()).hexdigest()
+        
+    def _is_up_to_date(self, name):
+        """Check an element's images against the hash recorded when they were rendered"""
+        png_path = self.paths[name]
+        hash_path = png_path.with_name(f'{name}.png.hash')
+        if not (png_path.exists() and hash_path.exists()):
+            return False
+        if self.thumbnail_width and not png_path.with_name(f'{name}_thumb.png').exists():
+            return False
+        return hash_path.read_text(encoding='utf-8') == self._element_hash(name)
+        
+    def render_element(self, name):
+        """Render one element and record the hash of its inputs next to the PNG"""
+        getattr(self, f'create_{name}')()
+        hash_path = self.paths[name].with_name(f'{name}.png.hash')
+        hash_path.write_text(self._element_hash(name), encoding='utf-8')
+        
     def generate_all_elements(self):
         """Generate all poster elements"""
         print("Generating Poster Design Elements...")
         print("=" * 50)
         
-        self.create_iconography()
-        self.create_flow_diagram()
-        self.create_comparison_table()
-        self.create_system_architecture()
-        self.create_performance_chart()
+        # Skip elements whose inputs have not changed since they were rendered
+        pending = []
+        for name in self.ELEMENTS:
+            if self._is_up_to_date(name):
+                print(f"Up to date: poster_elements/{name}.png")
+            else:
+                pending.append(name)
+        
+        workers = min(len(pending), os.cpu_count() or 1)
+        if workers > 1:
+            # Elements share no state, so each renders in its own process;
+            # spawn gives every worker a fresh interpreter on all platforms
+            jobs = [(name, self.width, self.height, self.dpi, self.thumbnail_width)
+                    for name in pending]
+            with get_context('spawn').Pool(workers) as pool:
+                pool.starmap(_run_one, jobs)
+        else:
+            for name in pending:
+                self.render_element(name)
+        plt.close(self._fig)
         
         print("\nAll poster elements generated successfully!")
         print("Files saved in: poster_elements/")
@@ -427,6 +546,12 @@ class PosterElementGenerator:
         print("- system_architecture.png")
         print("- performance_chart.png")
 
+def _run_one(name, width, height, dpi, thumbnail_width):
+    """Generate a single poster element in a worker process"""
+    generator = PosterElementGenerator(width, height, dpi, thumbnail_width)
+    generator.render_element(name)
+    plt.close(generator._fig)
+
 def main():
     """Main function to generate all poster elements"""
     print("UAV Path Planning Poster Design Elements Generator")
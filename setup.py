@@ -3,13 +3,15 @@
 Setup script for UAV Path Planning Demo
 """
 
+from pathlib import Path
+
 from setuptools import setup, find_packages
 
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+long_description = Path("README.md").read_text(encoding="utf-8")
 
-with open("requirements.txt", "r", encoding="utf-8") as fh:
-    requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+# Each line is stripped once; blank lines and comments are skipped
+requirement_lines = map(str.strip, Path("requirements.txt").read_text(encoding="utf-8").splitlines())
+requirements = [line for line in requirement_lines if line and not line.startswith("#")]
 
 setup(
     name="uav-path-planning-demo",
@@ -9,22 +9,36 @@ import subprocess
 import sys
 from pathlib import Path
 
-def run_command(command, cwd=None):
-    """Run a shell command and return the result"""
+# Files committed to the new repository; anything else (rendered videos,
+# poster_elements/, caches) stays out of the initial commit
+REPO_FILES = [
+    'src', 'README.md', 'QUICKSTART.md', 'GITHUB_SETUP.md', 'LICENSE',
+    'requirements.txt', 'setup.py', 'setup_github.py',
+    'create_demo_video.py', 'create_enhanced_video.py', 'create_learning_video.py',
+    'create_poster_elements.py',
+    'run_demo.sh', 'run_demo.bat', 'run_3d.sh', 'run_3d.bat',
+]
+
+# Generated output that should never be committed
+GITIGNORE_ENTRIES = ['poster_elements/', '__pycache__/', '*.pyc', '*.mp4']
+
+def run_command(argv, cwd=None):
+    """Run a command given as an argument list and return its output"""
     try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True, cwd=cwd)
+        # No shell: arguments are passed through verbatim, so nothing needs quoting
+        result = subprocess.run(argv, capture_output=True, text=True, cwd=cwd, check=False)
         if result.returncode != 0:
-            print(f"Error running command: {command}")
+            print(f"Error running command: {' '.join(argv)}")
             print(f"Error: {result.stderr}")
             return False
         return result.stdout.strip()
     except Exception as e:
-        print(f"Exception running command {command}: {e}")
+        print(f"Exception running command {' '.join(argv)}: {e}")
         return False
 
 def check_git_installed():
     """Check if git is installed"""
-    result = run_command("git --version")
+    result = run_command(["git", "--version"])
     if not result:
         print("Git is not installed. Please install Git first.")
         return False
@@ -33,7 +47,7 @@ def check_git_installed():
 
 def check_github_cli_installed():
     """Check if GitHub CLI is installed"""
-    result = run_command("gh --version")
+    result = run_command(["gh", "--version"])
     if not result:
         print("GitHub CLI is not installed. Please install GitHub CLI first.")
         print("Visit: https://cli.github.com/")
@@ -41,6 +55,17 @@ def check_github_cli_installed():
     print(f"GitHub CLI version: {result}")
     return True
 
+def update_gitignore():
+    """Add any missing generated-output patterns to .gitignore"""
+    gitignore = Path('.gitignore')
+    existing = gitignore.read_text(encoding='utf-8').splitlines() if gitignore.exists() else []
+    missing = [entry for entry in GITIGNORE_ENTRIES if entry not in existing]
+    if missing:
+        with gitignore.open('a', encoding='utf-8') as f:
+            if existing and existing[-1]:
+                f.write('\n')
+            f.write('\n'.join(missing) + '\n')
+
 def setup_repository():
     """Set up the GitHub repository"""
     print("Setting up UAV Path Planning Demo Repository...")
@@ -64,55 +89,60 @@ def setup_repository():
     
     # Check if user is authenticated with GitHub
     print("Checking GitHub authentication...")
-    auth_result = run_command("gh auth status")
+    auth_result = run_command(["gh", "auth", "status"])
     if not auth_result:
         print("Please authenticate with GitHub first:")
         print("Run: gh auth login")
         return False
     
+    # Look up the GitHub login once for all repository URLs
+    gh_user = run_command(["gh", "api", "user", "--jq", ".login"])
+    
     # Create repository on GitHub
     print(f"Creating repository: {repo_name}")
-    create_cmd = f'gh repo create {repo_name} --public --description "{description}"'
+    create_cmd = ["gh", "repo", "create", repo_name, "--public", "--description", description]
     if run_command(create_cmd):
-        print(f"Repository created successfully: https://github.com/{run_command('gh api user --jq .login')}/{repo_name}")
+        print(f"Repository created successfully: https://github.com/{gh_user}/{repo_name}")
     else:
         print("Failed to create repository. Please check your GitHub permissions.")
         return False
     
     # Initialize git repository locally
     print("Initializing local git repository...")
-    if not run_command("git init"):
+    if not run_command(["git", "init"]):
         print("Failed to initialize git repository")
         return False
     
-    # Add all files
+    # Add the project files by name rather than scanning the whole tree
     print("Adding files to git...")
-    if not run_command("git add ."):
+    update_gitignore()
+    paths = [path for path in REPO_FILES + ['.gitignore'] if Path(path).exists()]
+    if not run_command(["git", "add", "-A", "--"] + paths):
         print("Failed to add files")
         return False
     
     # Create initial commit
     print("Creating initial commit...")
-    if not run_command('git commit -m "Initial commit: UAV Path Planning Demo"'):
+    if not run_command(["git", "commit", "-m", "Initial commit: UAV Path Planning Demo"]):
         print("Failed to create commit")
         return False
     
     # Add remote origin
     print("Adding remote origin...")
-    remote_url = f"https://github.com/{run_command('gh api user --jq .login')}/{repo_name}.git"
-    if not run_command(f"git remote add origin {remote_url}"):
+    remote_url = f"https://github.com/{gh_user}/{repo_name}.git"
+    if not run_command(["git", "remote", "add", "origin", remote_url]):
         print("Failed to add remote origin")
         return False
     
     # Push to GitHub
     print("Pushing to GitHub...")
-    if not run_command("git push -u origin main"):
+    if not run_command(["git", "push", "-u", "origin", "main"]):
         print("Failed to push to GitHub")
         return False
     
     print("\n" + "="*50)
     print("Repository setup completed successfully!")
-    print(f"Repository URL: https://github.com/{run_command('gh api user --jq .login')}/{repo_name}")
+    print(f"Repository URL: https://github.com/{gh_user}/{repo_name}")
     print("\nNext steps:")
     print("1. Update the repository URL in README.md")
     print("2. Add any additional documentation")
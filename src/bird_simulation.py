@@ -5,12 +5,242 @@ Simplified bird behavior simulation for demonstration purposes
 
 import random
 import math
-from typing import List, Tuple
+from enum import IntEnum
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; BirdFlock falls back to NumPy
+    NUMBA_AVAILABLE = False
+
+# Sine/cosine lookup tables for steering angles; an angle maps to entry
+# int(angle * TRIG_LUT_SCALE) & TRIG_LUT_MASK
+TRIG_LUT_SIZE = 1024
+TRIG_LUT_MASK = TRIG_LUT_SIZE - 1
+TRIG_LUT_SCALE = TRIG_LUT_SIZE / (2 * np.pi)
+SIN_LUT = np.sin(np.arange(TRIG_LUT_SIZE) / TRIG_LUT_SCALE)
+COS_LUT = np.cos(np.arange(TRIG_LUT_SIZE) / TRIG_LUT_SCALE)
+# Plain lists index faster than arrays for the scalar Bird path
+_SIN_LIST = SIN_LUT.tolist()
+_COS_LIST = COS_LUT.tolist()
+
+def sincos(angle: float) -> Tuple[float, float]:
+    """Look up (sin, cos) of an angle in the trig tables"""
+    i = int(angle * TRIG_LUT_SCALE) & TRIG_LUT_MASK
+    return _SIN_LIST[i], _COS_LIST[i]
+
+def unit_vectors(angles: np.ndarray) -> np.ndarray:
+    """Look up (N, 2) unit vectors (cos, sin) of angles in the trig tables"""
+    i = (angles * TRIG_LUT_SCALE).astype(np.int64) & TRIG_LUT_MASK
+    return np.column_stack((COS_LUT[i], SIN_LUT[i]))
+
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, cache=True)
+    def _cruising_velocity(i, positions, velocities, energy, max_speeds,
+                           cells, order, starts, grid_height,
+                           bounds_x, bounds_y, desired_separation, neighbor_dist):
+        """Fused flocking forces, velocity integration and speed clamp for cruising bird i
+        
+        Neighbors are only looked up in the bird's own grid cell and the 8
+        around it (see BirdFlock._neighbor_grid).
+        """
+        grid_width = (starts.shape[0] - 1) // grid_height
+        separation_r2 = desired_separation * desired_separation
+        neighbor_r2 = neighbor_dist * neighbor_dist
+        margin = 50.0
+        px = positions[i, 0]
+        py = positions[i, 1]
+        sep_x = sep_y = 0.0
+        align_x = align_y = 0.0
+        center_x = center_y = 0.0
+        sep_count = 0
+        near_count = 0
+        for cx in range(max(cells[i, 0] - 1, 0), min(cells[i, 0] + 2, grid_width)):
+            for cy in range(max(cells[i, 1] - 1, 0), min(cells[i, 1] + 2, grid_height)):
+                cell = cx * grid_height + cy
+                for k in range(starts[cell], starts[cell + 1]):
+                    j = order[k]
+                    if i == j:
+                        continue
+                    dx = px - positions[j, 0]
+                    dy = py - positions[j, 1]
+                    d2 = dx * dx + dy * dy
+                    if 0 < d2 < separation_r2:
+                        inv_distance = 1.0 / np.sqrt(d2)
+                        sep_x += dx * inv_distance
+                        sep_y += dy * inv_distance
+                        sep_count += 1
+                    if d2 < neighbor_r2:
+                        align_x += velocities[j, 0]
+                        align_y += velocities[j, 1]
+                        center_x += positions[j, 0]
+                        center_y += positions[j, 1]
+                        near_count += 1
+        if sep_count > 0:
+            sep_x /= sep_count
+            sep_y /= sep_count
+        flock_x = flock_y = 0.0
+        if near_count > 0:
+            flock_x = align_x / near_count + (center_x / near_count - px) * 0.01
+            flock_y = align_y / near_count + (center_y / near_count - py) * 0.01
+        
+        # Steer back inside the margin
+        bound_x = bound_y = 0.0
+        if px < margin:
+            bound_x = (margin - px) * 0.1
+        elif px > bounds_x - margin:
+            bound_x = (bounds_x - margin - px) * 0.1
+        if py < margin:
+            bound_y = (margin - py) * 0.1
+        elif py > bounds_y - margin:
+            bound_y = (bounds_y - margin - py) * 0.1
+        
+        # Weight forces based on energy level and integrate
+        energy_factor = energy[i] / 100.0
+        vx = velocities[i, 0] + sep_x * 2.0 + flock_x * energy_factor + bound_x * 1.5
+        vy = velocities[i, 1] + sep_y * 2.0 + flock_y * energy_factor + bound_y * 1.5
+        speed = np.sqrt(vx * vx + vy * vy)
+        max_speed = max_speeds[i] * energy_factor
+        if speed > max_speed:
+            vx *= max_speed / speed
+            vy *= max_speed / speed
+        return vx, vy
+        
+    @njit(fastmath=True, cache=True)
+    def _near_any(x, y, locations, radius):
+        """Check whether (x, y) is within radius of any of the given locations"""
+        r2 = radius * radius
+        for k in range(locations.shape[0]):
+            dx = x - locations[k, 0]
+            dy = y - locations[k, 1]
+            if dx * dx + dy * dy < r2:
+                return True
+        return False
+        
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _flock_step_kernel(positions, velocities, altitudes, directions, max_speeds, glide_ratios,
+                           energy, states, state_durations, perch_timers,
+                           perch_locations, thermal_locations, draws, limits, perch_times,
+                           cells, order, starts, grid_height, wind_x, wind_y, bounds_x, bounds_y,
+                           min_speed, energy_deltas):
+        """One BirdFlock.update step over the structure-of-arrays
+        
+        Mirrors the NumPy path stage by stage: energy, state transitions and
+        the non-cruising handlers per bird, in place; then flocking for
+        cruising birds, which reads the velocities from the first stage, fused
+        with wind and integration. Returns the new (positions, velocities).
+        draws, limits and perch_times hold the random numbers the NumPy path
+        draws.
+        """
+        n = positions.shape[0]
+        
+        # Stage 1: energy, state transitions and non-cruising behavior
+        for i in prange(n):
+            state_durations[i] += 1
+            state = states[i]
+            energy[i] = min(100.0, max(0.0, energy[i] + energy_deltas[state]))
+            
+            if state == 3:
+                if perch_timers[i] <= 0 and energy[i] > 70:
+                    state = 4
+                    state_durations[i] = 0
+            elif state == 4:
+                if state_durations[i] > 30:
+                    state = 0
+                    state_durations[i] = 0
+            elif energy[i] < 30 and _near_any(positions[i, 0], positions[i, 1], perch_locations, 30.0):
+                state = 3
+                perch_timers[i] = perch_times[i]
+                velocities[i, 0] = 0.0
+                velocities[i, 1] = 0.0
+            elif (_near_any(positions[i, 0], positions[i, 1], thermal_locations, 50.0)
+                  and draws[0, i] < 0.1):
+                state = 1
+            elif altitudes[i] > 100 and draws[1, i] < 0.05:
+                state = 2
+            elif (state == 1 or state == 2) and state_durations[i] > limits[i]:
+                state = 0
+            states[i] = state
+            
+            if state == 3:
+                perch_timers[i] -= 1
+                velocities[i, 0] = 0.0
+                velocities[i, 1] = 0.0
+                altitudes[i] = 0.0
+            elif state == 1:
+                # Spiral upward in thermal
+                altitudes[i] = min(500.0, altitudes[i] + 2)
+                k = int(state_durations[i] * 0.1 * TRIG_LUT_SCALE) & TRIG_LUT_MASK
+                velocities[i, 0] = 3 * COS_LUT[k]
+                velocities[i, 1] = 3 * SIN_LUT[k]
+            elif state == 2:
+                # Gradual descent based on glide ratio, maintaining forward momentum
+                altitudes[i] = max(50.0, altitudes[i] - min_speed / glide_ratios[i])
+                speed = max(min_speed, np.sqrt(velocities[i, 0] ** 2 + velocities[i, 1] ** 2) * 0.99)
+                velocities[i, 0] = speed * directions[i, 0]
+                velocities[i, 1] = speed * directions[i, 1]
+            elif state == 4:
+                # Gradual increase in speed and altitude
+                altitudes[i] = min(100.0, altitudes[i] + 3)
+                takeoff_speed = max_speeds[i] * (state_durations[i] / 30)
+                velocities[i, 0] = takeoff_speed * directions[i, 0]
+                velocities[i, 1] = takeoff_speed * directions[i, 1]
+        
+        # Stage 2: flocking for cruising birds, wind, and integration within
+        # bounds, in registers; results go to new arrays as neighbors still
+        # read the old positions and velocities
+        new_positions = np.empty_like(positions)
+        new_velocities = np.empty_like(velocities)
+        for i in prange(n):
+            if states[i] == 0:
+                vx, vy = _cruising_velocity(i, positions, velocities, energy, max_speeds,
+                                            cells, order, starts, grid_height,
+                                            bounds_x, bounds_y, 25.0, 50.0)
+            else:
+                vx = velocities[i, 0]
+                vy = velocities[i, 1]
+            vx += wind_x * 0.1
+            vy += wind_y * 0.1
+            new_velocities[i, 0] = vx
+            new_velocities[i, 1] = vy
+            x = positions[i, 0]
+            y = positions[i, 1]
+            if states[i] != 3:  # Perched birds stay put
+                x += vx
+                y += vy
+            new_positions[i, 0] = min(bounds_x, max(0.0, x))
+            new_positions[i, 1] = min(bounds_y, max(0.0, y))
+        return new_positions, new_velocities
+
+class BirdState(IntEnum):
+    """Bird behavioral states as small integer codes"""
+    CRUISING = 0
+    SOARING = 1
+    GLIDING = 2
+    PERCHED = 3
+    TAKING_OFF = 4
+
+# State indicator colors indexed by BirdState
+STATE_COLORS = np.array([
+    (0, 255, 0),      # CRUISING
+    (255, 255, 0),    # SOARING
+    (0, 255, 255),    # GLIDING
+    (128, 128, 128),  # PERCHED
+    (255, 128, 0),    # TAKING_OFF
+], dtype=np.uint8)
 
 class Bird:
     """Simplified bird behavior simulation for demo purposes"""
     
-    STATES = ['CRUISING', 'SOARING', 'GLIDING', 'PERCHED', 'TAKING_OFF']
+    # BirdState members indexed by their integer code
+    STATES = tuple(BirdState)
+    
+    # Squared radii for the thermal and perch proximity checks
+    THERMAL_R2 = 50 * 50
+    PERCH_R2 = 30 * 30
     
     def __init__(self, position: Tuple[int, int], velocity: Tuple[float, float]):
         # Position and movement
@@ -18,7 +248,7 @@ class Bird:
         self.velocity = list(velocity)
         self.acceleration = [0, 0]
         self.altitude = random.randint(50, 200)
-        self.heading = math.atan2(velocity[1], velocity[0])
+        self.set_heading(math.atan2(velocity[1], velocity[0]))
         
         # Physical characteristics
         self.wingspan = random.uniform(1.0, 1.5)
@@ -35,7 +265,7 @@ class Bird:
         self.rest_energy_gain = 0.3
         
         # Behavioral state
-        self.state = 'CRUISING'
+        self.state = BirdState.CRUISING
         self.state_duration = 0
         self.perch_timer = 0
         self.in_formation = False
@@ -45,6 +275,11 @@ class Bird:
         self.perch_locations = [(100, 100), (700, 500), (300, 700)]
         self.wind = [0, 0]
         
+    def set_heading(self, heading: float):
+        """Set the heading and its cached direction vector together"""
+        self.heading = heading
+        self.dir_y, self.dir_x = sincos(heading)
+        
     def update(self, birds: List['Bird'], bounds: Tuple[int, int], wind: Tuple[float, float]):
         """Update bird position and state based on simplified behavior"""
         self.wind = list(wind)
@@ -57,13 +292,13 @@ class Bird:
         self._update_state(birds, bounds)
         
         # Apply state-specific behavior
-        if self.state == 'PERCHED':
+        if self.state == BirdState.PERCHED:
             self._handle_perched_state()
-        elif self.state == 'SOARING':
+        elif self.state == BirdState.SOARING:
             self._handle_soaring_state()
-        elif self.state == 'GLIDING':
+        elif self.state == BirdState.GLIDING:
             self._handle_gliding_state()
-        elif self.state == 'TAKING_OFF':
+        elif self.state == BirdState.TAKING_OFF:
             self._handle_takeoff_state()
         else:  # CRUISING
             self._handle_cruising_state(birds, bounds)
@@ -72,46 +307,46 @@ class Bird:
         self._apply_wind_effects()
         
         # Update position if not perched
-        if self.state != 'PERCHED':
+        if self.state != BirdState.PERCHED:
             self._update_position(bounds)
             
     def _update_energy(self):
         """Update bird's energy levels based on current state"""
-        if self.state == 'PERCHED':
+        if self.state == BirdState.PERCHED:
             self.energy = min(100, self.energy + self.rest_energy_gain)
-        elif self.state == 'SOARING':
+        elif self.state == BirdState.SOARING:
             self.energy = min(100, self.energy + self.soaring_energy_gain)
-        elif self.state == 'GLIDING':
+        elif self.state == BirdState.GLIDING:
             self.energy = max(0, self.energy - self.energy_consumption_rate * 0.3)
         else:  # CRUISING or TAKING_OFF
             self.energy = max(0, self.energy - self.energy_consumption_rate)
             
     def _update_state(self, birds: List['Bird'], bounds: Tuple[int, int]):
         """Update bird's behavioral state"""
-        if self.state == 'PERCHED':
+        if self.state == BirdState.PERCHED:
             if self.perch_timer <= 0 and self.energy > 70:
-                self.state = 'TAKING_OFF'
+                self.state = BirdState.TAKING_OFF
                 self.state_duration = 0
-        elif self.state == 'TAKING_OFF':
+        elif self.state == BirdState.TAKING_OFF:
             if self.state_duration > 30:
-                self.state = 'CRUISING'
+                self.state = BirdState.CRUISING
                 self.state_duration = 0
         else:
             # Check for perching conditions
             if self.energy < 30 and self._near_perch_location():
-                self.state = 'PERCHED'
+                self.state = BirdState.PERCHED
                 self.perch_timer = random.randint(100, 200)
                 self.velocity = [0, 0]
             # Check for thermal soaring conditions
             elif self._near_thermal() and random.random() < 0.1:
-                self.state = 'SOARING'
+                self.state = BirdState.SOARING
             # Check for gliding conditions
             elif self.altitude > 100 and random.random() < 0.05:
-                self.state = 'GLIDING'
+                self.state = BirdState.GLIDING
             # Return to cruising if soaring/gliding too long
-            elif (self.state in ['SOARING', 'GLIDING'] and 
+            elif (self.state in (BirdState.SOARING, BirdState.GLIDING) and 
                   self.state_duration > random.randint(100, 200)):
-                self.state = 'CRUISING'
+                self.state = BirdState.CRUISING
                 
     def _handle_perched_state(self):
         """Handle behavior while perched"""
@@ -124,12 +359,9 @@ class Bird:
         """Handle thermal soaring behavior"""
         # Spiral upward in thermal
         self.altitude = min(500, self.altitude + 2)
-        angle = self.state_duration * 0.1
+        sin_a, cos_a = sincos(self.state_duration * 0.1)
         speed = 3
-        self.velocity = [
-            speed * math.cos(angle),
-            speed * math.sin(angle)
-        ]
+        self.velocity = [speed * cos_a, speed * sin_a]
         
     def _handle_gliding_state(self):
         """Handle gliding behavior"""
@@ -138,20 +370,14 @@ class Bird:
         # Maintain forward momentum
         speed = max(self.min_speed, 
                    math.sqrt(self.velocity[0]**2 + self.velocity[1]**2) * 0.99)
-        self.velocity = [
-            speed * math.cos(self.heading),
-            speed * math.sin(self.heading)
-        ]
+        self.velocity = [speed * self.dir_x, speed * self.dir_y]
         
     def _handle_takeoff_state(self):
         """Handle takeoff behavior"""
         # Gradual increase in speed and altitude
         self.altitude = min(100, self.altitude + 3)
         takeoff_speed = self.max_speed * (self.state_duration / 30)
-        self.velocity = [
-            takeoff_speed * math.cos(self.heading),
-            takeoff_speed * math.sin(self.heading)
-        ]
+        self.velocity = [takeoff_speed * self.dir_x, takeoff_speed * self.dir_y]
         
     def _handle_cruising_state(self, birds: List['Bird'], bounds: Tuple[int, int]):
         """Handle normal cruising flight with simplified flocking"""
@@ -211,18 +437,18 @@ class Bird:
     def _near_thermal(self) -> bool:
         """Check if bird is near a thermal updraft"""
         for thermal in self.thermal_locations:
-            distance = math.sqrt((self.position[0] - thermal[0])**2 + 
-                               (self.position[1] - thermal[1])**2)
-            if distance < 50:
+            dx = self.position[0] - thermal[0]
+            dy = self.position[1] - thermal[1]
+            if dx * dx + dy * dy < self.THERMAL_R2:
                 return True
         return False
         
     def _near_perch_location(self) -> bool:
         """Check if bird is near a perch location"""
         for perch in self.perch_locations:
-            distance = math.sqrt((self.position[0] - perch[0])**2 + 
-                               (self.position[1] - perch[1])**2)
-            if distance < 30:
+            dx = self.position[0] - perch[0]
+            dy = self.position[1] - perch[1]
+            if dx * dx + dy * dy < self.PERCH_R2:
                 return True
         return False
         
@@ -241,15 +467,18 @@ class Bird:
         """Calculate separation force from other birds"""
         force = [0, 0]
         count = 0
+        separation_r2 = desired_separation * desired_separation
         
         for bird in birds:
             if bird != self:
-                distance = math.sqrt((self.position[0] - bird.position[0])**2 + 
-                                   (self.position[1] - bird.position[1])**2)
-                if distance < desired_separation and distance > 0:
+                dx = self.position[0] - bird.position[0]
+                dy = self.position[1] - bird.position[1]
+                d2 = dx * dx + dy * dy
+                if 0 < d2 < separation_r2:
                     # Calculate separation force
-                    force[0] += (self.position[0] - bird.position[0]) / distance
-                    force[1] += (self.position[1] - bird.position[1]) / distance
+                    inv_distance = 1.0 / math.sqrt(d2)
+                    force[0] += dx * inv_distance
+                    force[1] += dy * inv_distance
                     count += 1
                     
         if count > 0:
@@ -262,12 +491,13 @@ class Bird:
         """Calculate alignment force with nearby birds"""
         force = [0, 0]
         count = 0
+        neighbor_r2 = neighbor_dist * neighbor_dist
         
         for bird in birds:
             if bird != self:
-                distance = math.sqrt((self.position[0] - bird.position[0])**2 + 
-                                   (self.position[1] - bird.position[1])**2)
-                if distance < neighbor_dist:
+                dx = self.position[0] - bird.position[0]
+                dy = self.position[1] - bird.position[1]
+                if dx * dx + dy * dy < neighbor_r2:
                     force[0] += bird.velocity[0]
                     force[1] += bird.velocity[1]
                     count += 1
@@ -282,12 +512,13 @@ class Bird:
         """Calculate cohesion force towards center of nearby birds"""
         center = [0, 0]
         count = 0
+        neighbor_r2 = neighbor_dist * neighbor_dist
         
         for bird in birds:
             if bird != self:
-                distance = math.sqrt((self.position[0] - bird.position[0])**2 + 
-                                   (self.position[1] - bird.position[1])**2)
-                if distance < neighbor_dist:
+                dx = self.position[0] - bird.position[0]
+                dy = self.position[1] - bird.position[1]
+                if dx * dx + dy * dy < neighbor_r2:
                     center[0] += bird.position[0]
                     center[1] += bird.position[1]
                     count += 1
@@ -314,4 +545,391 @@ class Bird:
         elif self.position[1] > bounds[1] - margin:
             force[1] = (bounds[1] - margin) - self.position[1]
             
-        return [f * 0.1 for f in force] 
\ No newline at end of file
+        return [f * 0.1 for f in force] 
+
+class FlockBird:
+    """Lightweight view of a single bird stored in a BirdFlock"""
+    
+    __slots__ = ('flock', 'index')
+    
+    def __init__(self, flock: 'BirdFlock', index: int):
+        self.flock = flock
+        self.index = index
+        
+    @property
+    def position(self) -> np.ndarray:
+        return self.flock.positions[self.index]
+        
+    @property
+    def velocity(self) -> np.ndarray:
+        return self.flock.velocities[self.index]
+        
+    @property
+    def energy(self) -> float:
+        return float(self.flock.energy[self.index])
+        
+    @property
+    def state(self) -> BirdState:
+        return Bird.STATES[self.flock.states[self.index]]
+        
+    def get_color(self) -> Tuple[int, int, int]:
+        """Get bird color based on energy level"""
+        flock = self.flock
+        level = np.digitize(flock.energy[self.index], flock.ENERGY_LEVELS, right=True)
+        return tuple(flock.ENERGY_COLORS[level].tolist())
+
+
+class BirdFlock:
+    """Bird flock stored as structure-of-arrays with a batched update
+    
+    Mirrors Bird.update for every bird at once: states holds BirdState codes,
+    and all per-bird attributes live in arrays of length N.
+    """
+    
+    # Single precision is plenty for on-screen positions and halves memory traffic
+    DTYPE = np.float32
+    
+    # Flocking neighbor grid cell; no smaller than the largest interaction radius
+    NEIGHBOR_CELL_SIZE = 50.0
+    # Up to this many birds, the NumPy path compares all pairs instead of using the grid
+    DENSE_FLOCK_SIZE = 64
+    
+    # Energy colors indexed by np.digitize(energy, ENERGY_LEVELS, right=True)
+    ENERGY_LEVELS = np.array([20.0, 50.0, 80.0])
+    ENERGY_COLORS = np.array([
+        (255, 0, 0),    # Red - very low energy
+        (255, 128, 0),  # Orange - low energy
+        (255, 255, 0),  # Yellow - medium energy
+        (0, 255, 0),    # Green - high energy
+    ], dtype=np.uint8)
+    
+    def __init__(self, positions: np.ndarray, velocities: np.ndarray,
+                 rng: Optional[np.random.Generator] = None):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        n = len(positions)
+        
+        # Position and movement
+        self.positions = np.array(positions, dtype=self.DTYPE).reshape(n, 2)
+        self.velocities = np.array(velocities, dtype=self.DTYPE).reshape(n, 2)
+        self.altitudes = self.rng.integers(50, 200, size=n, endpoint=True).astype(self.DTYPE)
+        self.headings = np.arctan2(self.velocities[:, 1], self.velocities[:, 0])
+        # Heading unit vectors, refreshed only where set_headings changes a heading
+        self.directions = unit_vectors(self.headings).astype(self.DTYPE)
+        
+        # Physical characteristics
+        self.max_speeds = self.rng.uniform(10, 15, size=n).astype(self.DTYPE)
+        self.min_speed = 5
+        self.glide_ratios = self.rng.uniform(12, 15, size=n).astype(self.DTYPE)
+        
+        # Energy and stamina
+        self.energy = np.full(n, 100.0, dtype=self.DTYPE)
+        self.energy_consumption_rate = 0.1
+        self.soaring_energy_gain = 0.2
+        self.rest_energy_gain = 0.3
+        
+        # Behavioral state
+        self.states = np.full(n, BirdState.CRUISING, dtype=np.int8)
+        self.state_durations = np.zeros(n, dtype=np.int64)
+        self.perch_timers = np.zeros(n, dtype=np.int64)
+        
+        # Environmental awareness
+        self.thermal_locations = np.empty((0, 2), dtype=self.DTYPE)
+        self.perch_locations = np.array([(100, 100), (700, 500), (300, 700)], dtype=self.DTYPE)
+        
+        self.birds = [FlockBird(self, i) for i in range(n)]
+        
+    def __len__(self) -> int:
+        return len(self.positions)
+        
+    def add_bird(self, position: Tuple[float, float], velocity: Tuple[float, float]):
+        """Append a cruising bird with freshly drawn physical characteristics"""
+        # NumPy scalars and arrays of another dtype would upcast the appended arrays
+        velocity = np.asarray(velocity, dtype=self.DTYPE)
+        max_speed, glide_ratio = self.rng.uniform((10, 12), (15, 15)).astype(self.DTYPE)
+        self.positions = np.vstack((self.positions, np.asarray(position, dtype=self.DTYPE)))
+        self.velocities = np.vstack((self.velocities, velocity))
+        self.altitudes = np.append(self.altitudes, self.DTYPE(self.rng.integers(50, 200, endpoint=True)))
+        self.headings = np.append(self.headings, np.arctan2(velocity[1], velocity[0]))
+        self.directions = np.vstack((self.directions, unit_vectors(self.headings[-1:]).astype(self.DTYPE)))
+        self.max_speeds = np.append(self.max_speeds, max_speed)
+        self.glide_ratios = np.append(self.glide_ratios, glide_ratio)
+        self.energy = np.append(self.energy, self.DTYPE(100.0))
+        self.states = np.append(self.states, np.int8(BirdState.CRUISING))
+        self.state_durations = np.append(self.state_durations, 0)
+        self.perch_timers = np.append(self.perch_timers, 0)
+        self.birds.append(FlockBird(self, len(self.birds)))
+        
+    def __iter__(self):
+        return iter(self.birds)
+        
+    def set_headings(self, indices: np.ndarray, headings: np.ndarray):
+        """Set the headings of the given birds and refresh only their direction vectors"""
+        self.headings[indices] = headings
+        self.directions[indices] = unit_vectors(self.headings[indices])
+        
+    def update(self, bounds: Tuple[int, int], wind: Tuple[float, float]):
+        """Update every bird's position and state in one batched step"""
+        if NUMBA_AVAILABLE:
+            self._update_compiled(bounds, wind)
+            return
+        self.state_durations += 1
+        
+        self._update_energy()
+        self._update_state()
+        
+        states = self.states
+        self._handle_perched_state(states == BirdState.PERCHED)
+        self._handle_soaring_state(states == BirdState.SOARING)
+        self._handle_gliding_state(states == BirdState.GLIDING)
+        self._handle_takeoff_state(states == BirdState.TAKING_OFF)
+        self._handle_cruising_state(states == BirdState.CRUISING, bounds)
+        
+        # Apply wind effects
+        self.velocities += np.asarray(wind, dtype=self.DTYPE) * 0.1
+        
+        # Update position if not perched, in place without gathering the flying rows
+        flying = (states != BirdState.PERCHED)[:, None]
+        np.add(self.positions, self.velocities, out=self.positions, where=flying)
+        np.clip(self.positions, 0, bounds, out=self.positions)
+        
+    def _update_compiled(self, bounds: Tuple[int, int], wind: Tuple[float, float]):
+        """Run update as one compiled kernel over the arrays"""
+        # Random numbers are drawn here so the Generator stays the only source
+        draws, limits, perch_times = self._draw_step_randoms(len(self.positions))
+        grid = self._neighbor_grid(bounds, self.NEIGHBOR_CELL_SIZE)
+        self.positions, self.velocities = _flock_step_kernel(
+            self.positions, self.velocities, self.altitudes, self.directions,
+            self.max_speeds, self.glide_ratios, self.energy, self.states,
+            self.state_durations, self.perch_timers,
+            self.perch_locations, np.asarray(self.thermal_locations, dtype=self.DTYPE).reshape(-1, 2),
+            draws, limits, perch_times, *grid,
+            float(wind[0]), float(wind[1]), float(bounds[0]), float(bounds[1]),
+            float(self.min_speed), self._energy_deltas())
+        
+    def _energy_deltas(self) -> np.ndarray:
+        """Per-frame energy change for each state, indexed by BirdState code"""
+        deltas = np.full(len(BirdState), -self.energy_consumption_rate)  # CRUISING, TAKING_OFF
+        deltas[BirdState.PERCHED] = self.rest_energy_gain
+        deltas[BirdState.SOARING] = self.soaring_energy_gain
+        deltas[BirdState.GLIDING] = -self.energy_consumption_rate * 0.3
+        return deltas
+        
+    def _draw_step_randoms(self, n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Draw one step's random numbers for n birds in two Generator calls
+        
+        Returns the (2, n) soar and glide draws, the soaring/gliding time
+        limits and the perch times; both update paths consume them the same way.
+        """
+        draws = self.rng.random((2, n))
+        limits, perch_times = self.rng.integers(100, 200, size=(2, n), endpoint=True)
+        return draws, limits, perch_times
+        
+    def _update_energy(self):
+        """Update energy levels based on current state"""
+        np.clip(self.energy + self._energy_deltas()[self.states], 0, 100, out=self.energy)
+        
+    def _update_state(self):
+        """Update behavioral states using boolean masks"""
+        states = self.states
+        n = len(states)
+        
+        # All of this step's random numbers, drawn up front
+        draws, limits, perch_times = self._draw_step_randoms(n)
+        
+        perched = states == BirdState.PERCHED
+        taking_off = states == BirdState.TAKING_OFF
+        airborne = ~(perched | taking_off)
+        
+        take_off = perched & (self.perch_timers <= 0) & (self.energy > 70)
+        done_taking_off = taking_off & (self.state_durations > 30)
+        
+        # Candidate transitions for airborne birds, in priority order
+        perch = airborne & (self.energy < 30) & self._near(self.perch_locations, 30)
+        soar = airborne & ~perch & self._near(self.thermal_locations, 50) & (draws[0] < 0.1)
+        glide = airborne & ~perch & ~soar & (self.altitudes > 100) & (draws[1] < 0.05)
+        stop_soaring = (((states == BirdState.SOARING) | (states == BirdState.GLIDING))
+                        & (self.state_durations > limits))
+        
+        # np.select takes the first true condition, so stop_soaring only
+        # applies to birds that did not start perching, soaring or gliding
+        states[:] = np.select(
+            [take_off, perch, soar, glide, done_taking_off | stop_soaring],
+            [BirdState.TAKING_OFF, BirdState.PERCHED, BirdState.SOARING, BirdState.GLIDING,
+             BirdState.CRUISING],
+            states)
+        self.state_durations[take_off | done_taking_off] = 0
+        self.perch_timers[perch] = perch_times[perch]
+        self.velocities[perch] = 0
+        
+    def _near(self, locations: np.ndarray, radius: float) -> np.ndarray:
+        """Check which birds are within radius of any of the given locations"""
+        if len(locations) == 0:
+            return np.zeros(len(self.positions), dtype=bool)
+        deltas = self.positions[:, None, :] - locations[None, :, :]
+        return (deltas ** 2).sum(axis=-1).min(axis=1) < radius * radius
+        
+    def _handle_perched_state(self, mask: np.ndarray):
+        """Handle behavior while perched"""
+        self.perch_timers[mask] -= 1
+        self.velocities[mask] = 0
+        self.altitudes[mask] = 0
+        
+    def _handle_soaring_state(self, mask: np.ndarray):
+        """Handle thermal soaring behavior"""
+        # Spiral upward in thermal
+        self.altitudes[mask] = np.minimum(500, self.altitudes[mask] + 2)
+        speed = 3
+        self.velocities[mask] = speed * unit_vectors(self.state_durations[mask] * 0.1)
+        
+    def _handle_gliding_state(self, mask: np.ndarray):
+        """Handle gliding behavior"""
+        # Gradual descent based on glide ratio
+        self.altitudes[mask] = np.maximum(
+            50, self.altitudes[mask] - self.min_speed / self.glide_ratios[mask])
+        # Maintain forward momentum
+        speed = np.maximum(self.min_speed,
+                           np.linalg.norm(self.velocities[mask], axis=1) * 0.99)
+        self.velocities[mask] = speed[:, None] * self.directions[mask]
+        
+    def _handle_takeoff_state(self, mask: np.ndarray):
+        """Handle takeoff behavior"""
+        # Gradual increase in speed and altitude
+        self.altitudes[mask] = np.minimum(100, self.altitudes[mask] + 3)
+        takeoff_speed = self.max_speeds[mask] * (self.state_durations[mask] / 30)
+        self.velocities[mask] = takeoff_speed[:, None] * self.directions[mask]
+        
+    def _handle_cruising_state(self, mask: np.ndarray, bounds: Tuple[int, int]):
+        """Handle normal cruising flight with simplified flocking"""
+        if not mask.any():
+            return
+        if len(self.positions) <= self.DENSE_FLOCK_SIZE:
+            separation, alignment, cohesion = self._dense_flocking_forces()
+        else:
+            grid = self._neighbor_grid(bounds, self.NEIGHBOR_CELL_SIZE)
+            separation, alignment, cohesion = self._flocking_forces(grid)
+        
+        # Steer back inside the margin; at most one of the two terms is nonzero
+        margin = 50
+        bounds_force = (np.clip(margin - self.positions, 0, None)
+                        + np.clip((np.asarray(bounds, dtype=self.DTYPE) - margin) - self.positions, None, 0))
+        
+        # Weight forces based on energy levels
+        energy_factor = (self.energy / 100.0)[:, None]
+        acceleration = (separation * 2.0 + (alignment + cohesion) * energy_factor
+                        + bounds_force * (0.1 * 1.5))
+        
+        # Update velocity with energy constraints
+        velocities = self.velocities[mask] + acceleration[mask]
+        speed = np.linalg.norm(velocities, axis=1)
+        max_speed = self.max_speeds[mask] * (self.energy[mask] / 100.0)
+        too_fast = speed > max_speed
+        velocities[too_fast] *= (max_speed[too_fast] / speed[too_fast])[:, None]
+        self.velocities[mask] = velocities
+        
+    def _neighbor_grid(self, bounds: Tuple[int, int], cell_size: float):
+        """Bin birds into a uniform grid of cell_size squares
+        
+        Returns (cells, order, starts, grid_height): each bird's (x, y) cell,
+        the bird indices sorted by cell, and for each cell id
+        (x * grid_height + y) the slice starts[id]:starts[id + 1] of order
+        holding the birds in that cell. With cell_size at least the largest
+        interaction radius, every neighbor lies in the same or an adjacent cell.
+        """
+        grid_width = int(bounds[0] // cell_size) + 1
+        grid_height = int(bounds[1] // cell_size) + 1
+        cells = (self.positions // cell_size).astype(np.int32)
+        np.clip(cells, 0, (grid_width - 1, grid_height - 1), out=cells)
+        cell_ids = cells[:, 0] * grid_height + cells[:, 1]
+        order = np.argsort(cell_ids, kind='stable').astype(np.int32)
+        starts = np.searchsorted(cell_ids[order], np.arange(grid_width * grid_height + 1))
+        return cells, order, starts.astype(np.int32), grid_height
+        
+    def _neighbor_pairs(self, grid) -> Tuple[np.ndarray, np.ndarray]:
+        """List candidate (i, j) pairs of distinct birds in the same or adjacent grid cells"""
+        cells, order, starts, grid_height = grid
+        grid_width = (len(starts) - 1) // grid_height
+        n = len(cells)
+        pairs_i, pairs_j = [], []
+        for offset_x in (-1, 0, 1):
+            for offset_y in (-1, 0, 1):
+                cx = cells[:, 0] + offset_x
+                cy = cells[:, 1] + offset_y
+                inside = (cx >= 0) & (cx < grid_width) & (cy >= 0) & (cy < grid_height)
+                cell_ids = np.where(inside, cx * grid_height + cy, 0)
+                first = starts[cell_ids]
+                counts = np.where(inside, starts[cell_ids + 1] - first, 0)
+                # Expand each bird into one pair per bird in the neighboring cell
+                i = np.repeat(np.arange(n), counts)
+                slots = np.arange(len(i)) - np.repeat(np.cumsum(counts) - counts, counts)
+                pairs_i.append(i)
+                pairs_j.append(order[np.repeat(first, counts) + slots])
+        i = np.concatenate(pairs_i)
+        j = np.concatenate(pairs_j)
+        others = i != j
+        return i[others], j[others]
+        
+    def _dense_flocking_forces(self, desired_separation: float = 25,
+                               neighbor_dist: float = 50) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Calculate separation, alignment and cohesion forces from all pairs at once
+        
+        Cheaper than expanding grid pairs for small flocks; one (N, N) squared
+        distance matrix feeds all three forces.
+        """
+        # deltas[i, j] points from bird j to bird i
+        deltas = self.positions[:, None, :] - self.positions[None, :, :]
+        d2 = (deltas ** 2).sum(axis=-1)
+        np.fill_diagonal(d2, np.inf)
+        
+        # Separation: unit vectors away from birds that are too close
+        close = (d2 < desired_separation * desired_separation) & (d2 > 0)
+        inv_distance = np.divide(1.0, np.sqrt(d2), out=np.zeros_like(d2), where=close)
+        separation = (deltas * inv_distance[..., None]).sum(axis=1)
+        separation /= np.maximum(close.sum(axis=1), 1)[:, None]
+        
+        # Alignment and cohesion share the same neighborhood
+        near = (d2 < neighbor_dist * neighbor_dist).astype(d2.dtype)
+        counts = near.sum(axis=1)[:, None]
+        has_neighbors = counts > 0
+        counts = np.maximum(counts, 1)
+        alignment = near @ self.velocities / counts
+        center = near @ self.positions / counts
+        cohesion = np.where(has_neighbors, (center - self.positions) * 0.01, 0.0)
+        
+        return separation, alignment, cohesion
+        
+    def _flocking_forces(self, grid, desired_separation: float = 25,
+                         neighbor_dist: float = 50) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Calculate separation, alignment and cohesion forces for all birds"""
+        n = len(self.positions)
+        i, j = self._neighbor_pairs(grid)
+        # deltas[k] points from bird j[k] to bird i[k]
+        deltas = self.positions[i] - self.positions[j]
+        d2 = (deltas ** 2).sum(axis=-1)
+        
+        # Separation: unit vectors away from birds that are too close; only
+        # these pairs need the actual distance
+        close = (d2 < desired_separation * desired_separation) & (d2 > 0)
+        away = deltas[close] / np.sqrt(d2[close])[:, None]
+        close_i = i[close]
+        separation = np.column_stack((np.bincount(close_i, away[:, 0], n),
+                                      np.bincount(close_i, away[:, 1], n)))
+        # Not in place: bincount returns integers when there are no close pairs
+        separation = separation / np.maximum(np.bincount(close_i, minlength=n), 1)[:, None]
+        
+        # Alignment and cohesion share the same neighborhood
+        near = d2 < neighbor_dist * neighbor_dist
+        near_i, near_j = i[near], j[near]
+        counts = np.bincount(near_i, minlength=n)[:, None]
+        has_neighbors = counts > 0
+        counts = np.maximum(counts, 1)
+        alignment = np.column_stack((np.bincount(near_i, self.velocities[near_j, 0], n),
+                                     np.bincount(near_i, self.velocities[near_j, 1], n))) / counts
+        center = np.column_stack((np.bincount(near_i, self.positions[near_j, 0], n),
+                                  np.bincount(near_i, self.positions[near_j, 1], n))) / counts
+        cohesion = np.where(has_neighbors, (center - self.positions) * 0.01, 0.0)
+        
+        return separation, alignment, cohesion
+        
+    def get_colors(self) -> np.ndarray:
+        """Get bird colors (N, 3) based on energy levels"""
+        return self.ENERGY_COLORS[np.digitize(self.energy, self.ENERGY_LEVELS, right=True)]
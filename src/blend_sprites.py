@@ -0,0 +1,60 @@
+"""
+Blend Sprites for UAV Path Planning Demo
+Static overlays rendered once and composited onto every frame
+"""
+
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+def blend_sprite(over_black: np.ndarray, over_white: np.ndarray,
+                 block: Optional[Tuple[int, int, int, int]] = None):
+    """Capture a drawing as a sprite that can be blended onto any background
+    
+    over_black and over_white are the same drawing rendered over black and
+    over white. Each (anti-aliased) draw blends its color over what is
+    underneath, so the result is affine in the background:
+    pixel = background * gain + offset. Fully covered pixels (gain 0) are
+    copied when blitting and only the partially covered ones are blended.
+    block optionally gives (y0, y1, x0, x1) of an opaque rectangle, such as a
+    filled panel, that is copied as one slice. Other pixels are addressed
+    by flat index into frames of the same size.
+    """
+    height, width = over_black.shape[:2]
+    outside = np.ones((height, width), dtype=bool)
+    patch = None
+    if block is not None:
+        y0, y1, x0, x1 = block
+        outside[y0:y1, x0:x1] = False
+        patch = over_black[y0:y1, x0:x1].copy()
+    outside = outside.ravel()
+    
+    over_black = over_black.reshape(-1, 3)
+    offset = over_black.astype(np.float32)
+    gain = (over_white.reshape(-1, 3).astype(np.float32) - offset) / 255.0
+    untouched = ((gain == 1) & (offset == 0)).all(axis=1)
+    opaque = (gain == 0).all(axis=1)
+    copied = np.flatnonzero(outside & opaque)
+    blended = np.flatnonzero(outside & ~opaque & ~untouched)
+    # Bias the offset by half a level so the uint8 cast rounds
+    return block, patch, copied, over_black[copied], blended, gain[blended], offset[blended] + 0.5
+
+def render_blend_sprite(draw: Callable[[np.ndarray], None], width: int, height: int,
+                        block: Optional[Tuple[int, int, int, int]] = None):
+    """Run a drawing function over black and over white and capture it as a blend sprite"""
+    over_black = np.zeros((height, width, 3), dtype=np.uint8)
+    over_white = np.full((height, width, 3), 255, dtype=np.uint8)
+    draw(over_black)
+    draw(over_white)
+    return blend_sprite(over_black, over_white, block)
+
+def blit_blend_sprite(frame: np.ndarray, sprite):
+    """Composite a sprite from blend_sprite onto a contiguous frame in place"""
+    block, patch, copied, colors, blended, gain, offset = sprite
+    if block is not None:
+        y0, y1, x0, x1 = block
+        frame[y0:y1, x0:x1] = patch
+    flat = frame.view()
+    flat.shape = (-1, 3)  # Raises rather than silently copying a non-contiguous frame
+    flat[copied] = colors
+    flat[blended] = flat[blended] * gain + offset
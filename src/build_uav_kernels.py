@@ -0,0 +1,26 @@
+"""
+Ahead-of-time Build of the UAV Swarm Kernel
+Compiles the UAVSwarm step into the _uav_kernels extension module next to
+this file, so swarms step without JIT compilation at startup
+
+Run once after installing numba:
+    python src/build_uav_kernels.py
+"""
+
+import os
+
+from numba.pycc import CC
+
+from uav_controller import _swarm_step_kernel
+
+cc = CC('_uav_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+# Same arguments as _swarm_step_kernel, with the dtypes UAVSwarm and BirdFlock use;
+# AOT builds are not parallel, so the prange loop compiles as a serial loop
+cc.export(
+    'swarm_step',
+    'void(f4[:, ::1], f4[:, ::1], f4[::1], i8[::1], f4[:, ::1], f4[::1], b1[::1], f8, f8, f8)',
+)(_swarm_step_kernel.py_func)
+
+if __name__ == "__main__":
+    cc.compile()
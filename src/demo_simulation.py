@@ -8,9 +8,8 @@ import cv2
 import numpy as np
 import time
 from typing import List, Tuple
-import random
 import math
-from bird_simulation import Bird
+from bird_simulation import STATE_COLORS, BirdFlock
 from uav_controller import UAVController
 
 def calculate_movement(current_pos, target_pos, speed=5):
@@ -43,14 +42,25 @@ def run_demo_simulation():
     
     # Initialize simulation parameters
     width, height = 800, 600
-    screen = np.zeros((height, width, 3), dtype=np.uint8)
+    screen = np.empty((height, width, 3), dtype=np.uint8)
     
-    # Initialize birds
-    birds = []
-    for i in range(5):
-        pos = (random.randint(100, 700), random.randint(100, 500))
-        vel = (random.uniform(-2, 2), random.uniform(-2, 2))
-        birds.append(Bird(pos, vel))
+    # Background with every UI element that never changes, copied into screen each frame
+    background = np.empty_like(screen)
+    background[:] = (50, 100, 50)  # Green background
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    # Metric labels; values are drawn per frame after the labels
+    value_x = []
+    for label, y in (("Birds:", 30), ("UAV Energy:", 60), ("Frame:", 90), ("FPS:", 120)):
+        cv2.putText(background, label, (10, y), font, 0.7, (255, 255, 255), 2)
+        value_x.append(10 + cv2.getTextSize(label + " ", font, 0.7, 2)[0][0])
+    cv2.putText(background, "Controls: 'a' - Add bird, 't' - Add thermal, 'q' - Quit", 
+               (10, height - 20), font, 0.5, (200, 200, 200), 1)
+    
+    # Initialize birds as one structure-of-arrays flock
+    rng = np.random.default_rng()
+    positions = rng.integers([100, 100], [700, 500], size=(5, 2), endpoint=True)
+    velocities = rng.uniform(-2, 2, size=(5, 2))
+    flock = BirdFlock(positions, velocities, rng=rng)
     
     # Initialize UAV
     uav = UAVController((width//2, height//2))
@@ -60,64 +70,49 @@ def run_demo_simulation():
     start_time = time.time()
     
     while True:
-        # Clear screen
-        screen.fill((50, 100, 50))  # Green background
+        # Clear screen to the static background
+        np.copyto(screen, background)
         
-        # Update birds
+        # Update the whole flock in one batched step
         wind = (0, 0)  # No wind for demo
         bounds = (width, height)
-        for bird in birds:
-            bird.update(birds, bounds, wind)
-            
-            # Draw bird
-            x, y = int(bird.position[0]), int(bird.position[1])
-            color = bird.get_color()
+        flock.update(bounds, wind)
+        
+        # Draw birds (positions and colors converted in one batch)
+        pixels = flock.positions.astype(np.int32).tolist()
+        bird_colors = flock.get_colors().tolist()
+        state_colors = STATE_COLORS[flock.states].tolist()
+        for (x, y), color, state_color in zip(pixels, bird_colors, state_colors):
             cv2.circle(screen, (x, y), 8, color, -1)
-            cv2.circle(screen, (x, y), 8, (255, 255, 255), 2)
+            cv2.circle(screen, (x, y), 8, (255, 255, 255), 2, lineType=cv2.LINE_4)
             
             # Draw state indicator
-            state_colors = {
-                'CRUISING': (0, 255, 0),
-                'SOARING': (255, 255, 0),
-                'GLIDING': (0, 255, 255),
-                'PERCHED': (128, 128, 128),
-                'TAKING_OFF': (255, 128, 0)
-            }
-            state_color = state_colors.get(bird.state, (255, 255, 255))
             cv2.circle(screen, (x+12, y-12), 4, state_color, -1)
         
         # Update UAV
-        uav.update(birds)
+        uav.update(flock)
         
         # Draw UAV
         uav_x, uav_y = int(uav.position[0]), int(uav.position[1])
         cv2.circle(screen, (uav_x, uav_y), 12, (255, 0, 0), -1)
-        cv2.circle(screen, (uav_x, uav_y), 12, (255, 255, 255), 2)
+        cv2.circle(screen, (uav_x, uav_y), 12, (255, 255, 255), 2, lineType=cv2.LINE_4)
         
         # Draw UAV target line if tracking
-        if uav.target_bird:
-            target_x, target_y = int(uav.target_bird.position[0]), int(uav.target_bird.position[1])
+        if uav.target_index >= 0:
+            target_x, target_y = flock.positions[uav.target_index].astype(np.int32).tolist()
             cv2.line(screen, (uav_x, uav_y), (target_x, target_y), (255, 255, 0), 2)
         
-        # Draw UI elements
-        cv2.putText(screen, f"Birds: {len(birds)}", (10, 30), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        cv2.putText(screen, f"UAV Energy: {uav.energy:.1f}%", (10, 60), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        cv2.putText(screen, f"Frame: {frame_count}", (10, 90), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+        # Draw UI values next to their pre-drawn labels
+        cv2.putText(screen, str(len(flock)), (value_x[0], 30), font, 0.7, (255, 255, 255), 2)
+        cv2.putText(screen, f"{uav.energy:.1f}%", (value_x[1], 60), font, 0.7, (255, 255, 255), 2)
+        cv2.putText(screen, str(frame_count), (value_x[2], 90), font, 0.7, (255, 255, 255), 2)
         
         # Calculate and display FPS
         frame_count += 1
         elapsed_time = time.time() - start_time
         if elapsed_time > 0:
             fps = frame_count / elapsed_time
-            cv2.putText(screen, f"FPS: {fps:.1f}", (10, 120), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        
-        # Display controls
-        cv2.putText(screen, "Controls: 'a' - Add bird, 't' - Add thermal, 'q' - Quit", 
-                   (10, height - 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
+            cv2.putText(screen, f"{fps:.1f}", (value_x[3], 120), font, 0.7, (255, 255, 255), 2)
         
         # Show simulation
         cv2.imshow("UAV Path Planning Demo", screen)
@@ -128,17 +123,17 @@ def run_demo_simulation():
             break
         elif key == ord('a'):
             # Add new bird
-            pos = (random.randint(100, 700), random.randint(100, 500))
-            vel = (random.uniform(-2, 2), random.uniform(-2, 2))
-            birds.append(Bird(pos, vel))
-            print(f"Added bird. Total birds: {len(birds)}")
+            pos = rng.integers([100, 100], [700, 500], endpoint=True)
+            vel = rng.uniform(-2, 2, size=2)
+            flock.add_bird(pos, vel)
+            print(f"Added bird. Total birds: {len(flock)}")
         elif key == ord('t'):
-            # Add thermal updraft (visual effect)
-            thermal_x = random.randint(100, 700)
-            thermal_y = random.randint(100, 500)
-            cv2.circle(screen, (thermal_x, thermal_y), 30, (0, 255, 255), 2)
-            cv2.putText(screen, "THERMAL", (thermal_x-30, thermal_y-40), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
+            # Add thermal updraft (visual effect), drawn once into the background
+            # so it stays on screen without being re-rasterized every frame
+            thermal_x, thermal_y = rng.integers([100, 100], [700, 500], endpoint=True).tolist()
+            cv2.circle(background, (thermal_x, thermal_y), 30, (0, 255, 255), 2)
+            cv2.putText(background, "THERMAL", (thermal_x-30, thermal_y-40), 
+                       font, 0.5, (0, 255, 255), 1)
             print(f"Added thermal updraft at ({thermal_x}, {thermal_y})")
     
     cv2.destroyAllWindows()
@@ -7,6 +7,7 @@ import sys
 import numpy as np
 from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget
 from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QVector3D
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
@@ -14,59 +15,110 @@ from mpl_toolkits.mplot3d import Axes3D
 from matplotlib.colors import LightSource
 import matplotlib.colors as colors
 
+try:
+    import pyqtgraph.opengl as gl
+    PYQTGRAPH_AVAILABLE = True
+except ImportError:  # pyqtgraph/PyOpenGL are optional; the viewer falls back to matplotlib
+    PYQTGRAPH_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; perlin_noise falls back to NumPy
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _perlin_kernel(x, y, gradients, scale, out):
+        """Fill out with TerrainGenerator.perlin_noise of x and y, one pass per pixel"""
+        for i in prange(x.shape[0]):
+            for j in range(x.shape[1]):
+                px = x[i, j] / scale
+                py = y[i, j] / scale
+                x0 = np.floor(px)
+                y0 = np.floor(py)
+                sx = px - x0
+                sy = py - y0
+                row0 = int(x0) % 99
+                row1 = (int(x0) + 1) % 99
+                col0 = int(y0) % 99
+                col1 = (int(y0) + 1) % 99
+                
+                n0 = gradients[row0, col0, 0] * sx + gradients[row0, col0, 1] * sy
+                n1 = gradients[row1, col0, 0] * (sx - 1) + gradients[row1, col0, 1] * sy
+                ix0 = n0 + sx * (n1 - n0)
+                
+                n0 = gradients[row0, col1, 0] * sx + gradients[row0, col1, 1] * (sy - 1)
+                n1 = gradients[row1, col1, 0] * (sx - 1) + gradients[row1, col1, 1] * (sy - 1)
+                ix1 = n0 + sx * (n1 - n0)
+                
+                out[i, j] = ix0 + sy * (ix1 - ix0)
+
 class TerrainGenerator:
     """Simplified terrain generator for demo purposes"""
     
     def __init__(self, size=100, resolution=50):
         self.size = size
         self.resolution = resolution
+        
+        # Random gradients, shared by every octave
+        np.random.seed(42)  # For consistent terrain
+        angles = 2 * np.pi * np.random.rand(100, 100)
+        self.gradients = np.stack([np.cos(angles), np.sin(angles)], axis=-1).astype(np.float32)
+        
         self.generate_terrain()
         self.generate_vegetation()
         
     def generate_terrain(self):
         """Generate terrain using simplified Perlin noise"""
-        x = np.linspace(-self.size/2, self.size/2, self.resolution)
-        y = np.linspace(-self.size/2, self.size/2, self.resolution)
+        # Single precision throughout, down to LightSource.shade
+        x = np.linspace(-self.size/2, self.size/2, self.resolution, dtype=np.float32)
+        y = np.linspace(-self.size/2, self.size/2, self.resolution, dtype=np.float32)
         self.X, self.Y = np.meshgrid(x, y)
         
         # Generate terrain using multiple frequency components
-        self.Z = (
-            self.perlin_noise(self.X, self.Y, scale=50) * 15 +  # Large features
-            self.perlin_noise(self.X, self.Y, scale=20) * 5 +   # Medium features
-            self.perlin_noise(self.X, self.Y, scale=5) * 2      # Small features
-        )
+        self.Z = self.perlin_noise(self.X, self.Y, scale=50)
+        self.Z *= 15                                               # Large features
+        self.Z += self.perlin_noise(self.X, self.Y, scale=20) * 5  # Medium features
+        self.Z += self.perlin_noise(self.X, self.Y, scale=5) * 2   # Small features
         
         # Add some flat areas for agricultural fields
         mask = np.abs(self.perlin_noise(self.X, self.Y, scale=30)) < 0.3
-        self.Z[mask] = self.Z[mask] * 0.2
+        self.Z[mask] *= 0.2
         
     def perlin_noise(self, x, y, scale=10):
         """Simplified Perlin-like noise generation"""
+        if NUMBA_AVAILABLE:
+            out = np.empty(np.shape(x), dtype=np.float32)
+            _perlin_kernel(np.asarray(x, dtype=np.float32), np.asarray(y, dtype=np.float32),
+                           self.gradients, float(scale), out)
+            return out
+            
         x = x / scale
         y = y / scale
         
-        # Create grid points
-        x0 = np.floor(x).astype(int)
-        x1 = x0 + 1
-        y0 = np.floor(y).astype(int)
-        y1 = y0 + 1
-        
-        # Random gradients
-        np.random.seed(42)  # For consistent terrain
-        angles = 2 * np.pi * np.random.rand(100, 100)
-        gradients = np.stack([np.cos(angles), np.sin(angles)], axis=-1)
-        
-        # Interpolation weights
+        # Grid cell and interpolation weights
+        x0 = np.floor(x)
+        y0 = np.floor(y)
         sx = x - x0
         sy = y - y0
         
+        # Gradient table rows and columns of the four cell corners
+        x0 = x0.astype(int)
+        y0 = y0.astype(int)
+        rows0 = x0 % 99
+        rows1 = (x0 + 1) % 99
+        cols0 = y0 % 99
+        cols1 = (y0 + 1) % 99
+        
         # Interpolate
-        n0 = self.gradient(gradients[x0 % 99, y0 % 99], x - x0, y - y0)
-        n1 = self.gradient(gradients[x1 % 99, y0 % 99], x - x1, y - y0)
+        gradients = self.gradients
+        n0 = self.gradient(gradients[rows0, cols0], sx, sy)
+        n1 = self.gradient(gradients[rows1, cols0], sx - 1, sy)
         ix0 = self.lerp(n0, n1, sx)
         
-        n0 = self.gradient(gradients[x0 % 99, y1 % 99], x - x0, y - y1)
-        n1 = self.gradient(gradients[x1 % 99, y1 % 99], x - x1, y - y1)
+        n0 = self.gradient(gradients[rows0, cols1], sx, sy - 1)
+        n1 = self.gradient(gradients[rows1, cols1], sx - 1, sy - 1)
         ix1 = self.lerp(n0, n1, sx)
         
         return self.lerp(ix0, ix1, sy)
@@ -100,11 +152,14 @@ class BirdSwarm:
             low=bounds[0], 
             high=bounds[1], 
             size=(num_birds, 3)
-        )
+        ).astype(np.float32)
         # Set minimum height for birds
         self.positions[:, 2] = np.random.uniform(30, 80, num_birds)
         # Initialize random velocities
-        self.velocities = np.random.uniform(-1, 1, (num_birds, 3))
+        self.velocities = np.random.uniform(-1, 1, (num_birds, 3)).astype(np.float32)
+        # Per-axis position limits: the bounds, with the height range applied on z
+        self.position_min = np.array([bounds[0], bounds[0], np.clip(bounds[0], 30, 80)], dtype=np.float32)
+        self.position_max = np.array([bounds[1], bounds[1], np.clip(bounds[1], 30, 80)], dtype=np.float32)
         
     def update(self):
         """Update bird positions"""
@@ -116,22 +171,15 @@ class BirdSwarm:
         
         # Limit velocity magnitude
         velocity_magnitudes = np.linalg.norm(self.velocities, axis=1)
-        for i in range(self.num_birds):
-            if velocity_magnitudes[i] > 2:
-                self.velocities[i] = self.velocities[i] / velocity_magnitudes[i] * 2
-        
-        # Keep birds within bounds
-        for i in range(3):
-            mask = self.positions[:, i] < self.bounds[0]
-            self.positions[mask, i] = self.bounds[0]
-            self.velocities[mask, i] *= -1
-            
-            mask = self.positions[:, i] > self.bounds[1]
-            self.positions[mask, i] = self.bounds[1]
-            self.velocities[mask, i] *= -1
+        scale = np.minimum(1.0, 2.0 / np.maximum(velocity_magnitudes, 1e-9))
+        self.velocities *= scale[:, None]
+        
+        # Keep birds within bounds, reflecting the velocity on every axis that left them
+        outside = (self.positions < self.bounds[0]) | (self.positions > self.bounds[1])
+        np.negative(self.velocities, out=self.velocities, where=outside)
         
-        # Keep minimum and maximum height
-        self.positions[:, 2] = np.clip(self.positions[:, 2], 30, 80)
+        # Clamp to the bounds and the minimum and maximum height in one pass
+        np.clip(self.positions, self.position_min, self.position_max, out=self.positions)
 
 class EnvironmentViewer(QMainWindow):
     """3D Environment Viewer for UAV Path Planning Demo"""
@@ -145,14 +193,6 @@ class EnvironmentViewer(QMainWindow):
         main_widget = QWidget()
         self.setCentralWidget(main_widget)
         layout = QVBoxLayout(main_widget)
-
-        # Create the matplotlib figure
-        self.figure = Figure(figsize=(12, 9))
-        self.canvas = FigureCanvas(self.figure)
-        layout.addWidget(self.canvas)
-
-        # Create 3D axes
-        self.ax = self.figure.add_subplot(111, projection='3d')
         
         # Initialize environment
         self.terrain = TerrainGenerator()
@@ -168,7 +208,62 @@ class EnvironmentViewer(QMainWindow):
         self.timer.timeout.connect(self.update_animation)
         self.timer.start(100)  # Update every 100ms
         
-        self.setup_plot()
+        # Render on the GPU through pyqtgraph when available, else with matplotlib
+        self.use_opengl = PYQTGRAPH_AVAILABLE
+        if self.use_opengl:
+            self.view = gl.GLViewWidget()
+            layout.addWidget(self.view)
+            self.setup_gl_scene()
+        else:
+            # Create the matplotlib figure
+            self.figure = Figure(figsize=(12, 9))
+            self.canvas = FigureCanvas(self.figure)
+            layout.addWidget(self.canvas)
+            
+            # Create 3D axes
+            self.ax = self.figure.add_subplot(111, projection='3d')
+            self.setup_plot()
+            
+            # Static scene captured after each full draw; animation frames are blitted onto it
+            self.background = None
+            self.canvas.mpl_connect('draw_event', self.on_draw)
+        
+    def setup_gl_scene(self):
+        """Setup the OpenGL scene with the same content as setup_plot"""
+        self.view.setCameraPosition(distance=160, elevation=30, azimuth=-60)
+        # Look at the middle of the 0-100 m altitude band
+        self.view.opts['center'] = QVector3D(0, 0, 30)
+        
+        grid = gl.GLGridItem()
+        grid.setSize(100, 100)
+        grid.setSpacing(10, 10)
+        self.view.addItem(grid)
+        
+        # Terrain colored with the same light source shading as the matplotlib view;
+        # GLSurfacePlotItem indexes z and colors by (x, y), the meshgrid by (y, x)
+        ls = LightSource(azdeg=315, altdeg=45)
+        rgb = ls.shade(self.terrain.Z, plt.cm.terrain, vert_exag=0.3)
+        self.terrain_surface = gl.GLSurfacePlotItem(
+            x=self.terrain.X[0], y=self.terrain.Y[:, 0], z=self.terrain.Z.T,
+            colors=rgb.transpose(1, 0, 2), smooth=False
+        )
+        self.view.addItem(self.terrain_surface)
+        
+        # Add vegetation
+        if hasattr(self.terrain, 'tree_positions') and len(self.terrain.tree_positions) > 0:
+            self.view.addItem(gl.GLScatterPlotItem(
+                pos=self.terrain.tree_positions, color=(0, 0.5, 0, 0.7), size=5
+            ))
+        
+        # Add birds and UAV
+        self.bird_scatter = gl.GLScatterPlotItem(
+            pos=self.bird_swarm.positions, color=(1, 0, 0, 0.8), size=8
+        )
+        self.view.addItem(self.bird_scatter)
+        self.uav_scatter = gl.GLScatterPlotItem(
+            pos=self.uav_position[None], color=(0, 0, 1, 0.9), size=12
+        )
+        self.view.addItem(self.uav_scatter)
 
     def setup_plot(self):
         """Setup the 3D plot"""
@@ -209,13 +304,13 @@ class EnvironmentViewer(QMainWindow):
             self.bird_swarm.positions[:, 0],
             self.bird_swarm.positions[:, 1],
             self.bird_swarm.positions[:, 2],
-            c='red', s=50, alpha=0.8, label='Birds'
+            c='red', s=50, alpha=0.8, label='Birds', animated=True
         )
 
         # Add UAV
         self.uav_scatter = self.ax.scatter(
             [self.uav_position[0]], [self.uav_position[1]], [self.uav_position[2]],
-            c='blue', s=100, alpha=0.9, label='UAV'
+            c='blue', s=100, alpha=0.9, label='UAV', animated=True
         )
 
         # Add legend
@@ -226,13 +321,6 @@ class EnvironmentViewer(QMainWindow):
         # Update bird positions
         self.bird_swarm.update()
         
-        # Update bird scatter plot
-        self.bird_scatter._offsets3d = (
-            self.bird_swarm.positions[:, 0],
-            self.bird_swarm.positions[:, 1],
-            self.bird_swarm.positions[:, 2]
-        )
-        
         # Update UAV position (simple movement)
         self.uav_position[0] += np.random.uniform(-0.5, 0.5)
         self.uav_position[1] += np.random.uniform(-0.5, 0.5)
@@ -242,15 +330,43 @@ class EnvironmentViewer(QMainWindow):
         self.uav_position[0] = np.clip(self.uav_position[0], -45, 45)
         self.uav_position[1] = np.clip(self.uav_position[1], -45, 45)
         
-        # Update UAV scatter plot
+        # The GL scatters only need their new positions
+        if self.use_opengl:
+            self.bird_scatter.setData(pos=self.bird_swarm.positions)
+            self.uav_scatter.setData(pos=self.uav_position[None])
+            return
+        
+        # Update scatter plots
+        self.bird_scatter._offsets3d = (
+            self.bird_swarm.positions[:, 0],
+            self.bird_swarm.positions[:, 1],
+            self.bird_swarm.positions[:, 2]
+        )
         self.uav_scatter._offsets3d = (
             [self.uav_position[0]], 
             [self.uav_position[1]], 
             [self.uav_position[2]]
         )
         
-        # Redraw canvas
-        self.canvas.draw()
+        # Blit the moving scatters over the cached static scene
+        if self.background is None:
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self.background)
+        self.draw_animated()
+        self.canvas.blit(self.figure.bbox)
+        
+    def on_draw(self, event):
+        """Cache the static scene after a full redraw (first show, resize, rotation)"""
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.draw_animated()
+        
+    def draw_animated(self):
+        """Draw the animated bird and UAV scatters onto the canvas"""
+        for scatter in (self.bird_scatter, self.uav_scatter):
+            # draw_artist skips the 3D projection a full draw would do
+            scatter.do_3d_projection()
+            self.ax.draw_artist(scatter)
 
 def main():
     """Main function to run the 3D environment viewer"""
@@ -4,84 +4,296 @@ Simplified UAV control and path planning for demonstration purposes
 """
 
 import math
-import random
-from typing import List, Tuple, Optional
-from bird_simulation import Bird
+from collections import namedtuple
+from typing import List, Tuple, Optional, Union
+import numpy as np
+from bird_simulation import (Bird, BirdFlock, BirdState, COS_LUT, SIN_LUT, TRIG_LUT_MASK,
+                             TRIG_LUT_SCALE, sincos, unit_vectors)
+
+try:
+    from numba import njit, prange, vectorize
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; target selection and steering fall back to NumPy
+    NUMBA_AVAILABLE = False
+
+try:
+    # Ahead-of-time build of _swarm_step_kernel (see build_uav_kernels.py)
+    from _uav_kernels import swarm_step as _aot_swarm_step
+    AOT_KERNELS_AVAILABLE = True
+except ImportError:  # Not built; UAVSwarm uses the JIT kernel or NumPy
+    AOT_KERNELS_AVAILABLE = False
+
+# Snapshot returned by UAVController.get_status
+UAVStatus = namedtuple('UAVStatus', 'position energy has_target search_radius')
+
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, cache=True)
+    def _best_target(ux, uy, radius_sq, bird_x, bird_y, bird_energy, alive_mask):
+        """Index of the best target for a UAV at (ux, uy), or -1 if no bird is in range
+        
+        Same scoring as UAVController.select_target.
+        """
+        best = -1
+        best_score = 0.0
+        for i in range(bird_x.shape[0]):
+            if not alive_mask[i]:
+                continue
+            dx = bird_x[i] - ux
+            dy = bird_y[i] - uy
+            d2 = dx * dx + dy * dy
+            if d2 > radius_sq:
+                continue
+            score = np.sqrt(d2) - bird_energy[i] * 0.5
+            if best < 0 or score < best_score:
+                best_score = score
+                best = i
+        return best
+        
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _select_targets_kernel(uav_positions, radius_sq, bird_x, bird_y, bird_energy, alive_mask):
+        """Best target index for each UAV, or -1 where no bird is in range
+        
+        UAV u searches within radius_sq[u] of uav_positions[u].
+        """
+        num_uavs = uav_positions.shape[0]
+        best = np.empty(num_uavs, dtype=np.int64)
+        for u in prange(num_uavs):
+            best[u] = _best_target(uav_positions[u, 0], uav_positions[u, 1], radius_sq[u],
+                                   bird_x, bird_y, bird_energy, alive_mask)
+        return best
+        
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _swarm_step_kernel(positions, velocities, energy, target_indices, bird_positions,
+                           bird_energy, alive_mask, radius_sq, max_speed, consumption_rate):
+        """One UAVSwarm.update step over the structure-of-arrays, in place
+        
+        Energy, target validation and search, steering and integration run
+        in a single pass per UAV, mirroring the NumPy stages.
+        """
+        bird_x = bird_positions[:, 0]
+        bird_y = bird_positions[:, 1]
+        for u in prange(positions.shape[0]):
+            energy[u] = max(energy[u] - consumption_rate, 0.0)
+            ux = positions[u, 0]
+            uy = positions[u, 1]
+            
+            # Find a target if none or the target has perched or is too far
+            t = target_indices[u]
+            if t >= 0:
+                dx = bird_x[t] - ux
+                dy = bird_y[t] - uy
+                if not alive_mask[t] or dx * dx + dy * dy > radius_sq:
+                    t = -1
+            if t < 0:
+                t = _best_target(ux, uy, radius_sq, bird_x, bird_y, bird_energy, alive_mask)
+                target_indices[u] = t
+                
+            # Head for the target bird, or for the patrol circle when there is none
+            if t >= 0:
+                dx = bird_x[t] - ux
+                dy = bird_y[t] - uy
+                speed = max_speed * min(1.0, energy[u] / 100.0)
+            else:
+                k = int((ux + uy) * 0.01 * TRIG_LUT_SCALE) & TRIG_LUT_MASK
+                dx = 400.0 + 100.0 * COS_LUT[k] - ux
+                dy = 300.0 + 100.0 * SIN_LUT[k] - uy
+                speed = max_speed * 0.5
+            distance = np.sqrt(dx * dx + dy * dy)
+            scale = speed / distance if distance > 0 else 0.0
+            velocities[u, 0] = dx * scale
+            velocities[u, 1] = dy * scale
+            positions[u, 0] = ux + velocities[u, 0]
+            positions[u, 1] = uy + velocities[u, 1]
+        
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _select_targets_grid_kernel(uav_positions, radius, bird_x, bird_y, bird_energy, alive_mask,
+                                    order, starts, origin_x, origin_y, grid_height):
+        """_select_targets_kernel over the birds of a grid of radius squares
+        
+        Only the 3x3 cells around each UAV are scanned (see UAVSwarm._bird_grid);
+        ties go to the lowest bird index, as in a scan over all birds.
+        """
+        num_uavs = uav_positions.shape[0]
+        grid_width = (starts.shape[0] - 1) // grid_height
+        radius_sq = radius * radius
+        best = np.full(num_uavs, -1, dtype=np.int64)
+        for u in prange(num_uavs):
+            ux = uav_positions[u, 0]
+            uy = uav_positions[u, 1]
+            cx = int(np.floor(ux / radius)) - origin_x
+            cy = int(np.floor(uy / radius)) - origin_y
+            y0 = max(cy - 1, 0)
+            y1 = min(cy + 1, grid_height - 1)
+            if y0 > y1:
+                continue  # No cell rows within reach
+            best_score = 0.0
+            for x in range(max(cx - 1, 0), min(cx + 1, grid_width - 1) + 1):
+                # Cells (x, y0..y1) are adjacent in cell id order
+                for k in range(starts[x * grid_height + y0], starts[x * grid_height + y1 + 1]):
+                    i = order[k]
+                    if not alive_mask[i]:
+                        continue
+                    dx = bird_x[i] - ux
+                    dy = bird_y[i] - uy
+                    d2 = dx * dx + dy * dy
+                    if d2 > radius_sq:
+                        continue
+                    score = np.sqrt(d2) - bird_energy[i] * 0.5
+                    if best[u] < 0 or score < best_score or (score == best_score and i < best[u]):
+                        best_score = score
+                        best[u] = i
+        return best
+        
+    @vectorize(['float32(float32, float32, float32)', 'float64(float64, float64, float64)'],
+               nopython=True, fastmath=True, cache=True)
+    def _steering_scale(dx, dy, speed):
+        """Factor that scales direction (dx, dy) to length speed; 0 for a zero direction"""
+        distance = math.sqrt(dx * dx + dy * dy)
+        if distance > 0:
+            return speed / distance
+        return 0.0
 
 class UAVController:
     """Simplified UAV controller for demo purposes"""
     
     def __init__(self, position: Tuple[int, int]):
-        self.position = list(position)
-        self.velocity = [0, 0]
+        # Length-2 single-precision arrays, like the flock's bird rows
+        self.position = np.array(position, dtype=np.float32)
+        self.velocity = np.zeros(2, dtype=np.float32)
         self.energy = 100.0
         self.max_speed = 8.0
-        self.target_bird: Optional[Bird] = None
+        # Target as an index into the birds of the last update, or -1
+        self.target_index = -1
+        self._birds: Union[BirdFlock, List[Bird], None] = None
         self.target_position: Optional[Tuple[int, int]] = None
         self.search_radius = 150
+        # Range checks compare squared distances against this, without a square root
+        self.search_radius_sq = self.search_radius * self.search_radius
         self.energy_consumption_rate = 0.05
+        # A tracked target's range is re-checked only every this many frames
+        self.target_check_period = 5
+        self._frames_since_check = 0
+        
+    @property
+    def target_bird(self) -> Optional[Bird]:
+        """The bird at target_index, or None"""
+        if self.target_index < 0:
+            return None
+        birds = self._birds.birds if isinstance(self._birds, BirdFlock) else self._birds
+        return birds[self.target_index]
+        
+    def update(self, birds: Union[BirdFlock, List[Bird]]):
+        """Update UAV position and behavior among a BirdFlock or a list of birds"""
+        self._bind_birds(birds)
         
-    def update(self, birds: List[Bird]):
-        """Update UAV position and behavior"""
         # Consume energy
         self.energy = max(0, self.energy - self.energy_consumption_rate)
         
-        # Find target if none or target is too far
-        if not self.target_bird or self._distance_to_bird(self.target_bird) > self.search_radius:
+        # Find target if none, if the target has perched or, checked every
+        # few frames, if it is too far
+        self._frames_since_check += 1
+        check_range = self._frames_since_check >= self.target_check_period
+        if check_range:
+            self._frames_since_check = 0
+        if not self._target_still_valid(check_range):
             self._find_new_target(birds)
             
         # Move towards target
-        if self.target_bird:
+        if self.target_index >= 0:
             self._move_towards_target()
         else:
             # Patrol behavior when no target
             self._patrol_behavior()
             
         # Update position
-        self.position[0] += self.velocity[0]
-        self.position[1] += self.velocity[1]
+        self.position += self.velocity
         
-    def _find_new_target(self, birds: List[Bird]):
+    def _bind_birds(self, birds: Union[BirdFlock, List[Bird]]):
+        """Make birds the collection target_index refers to, dropping a target from another one"""
+        if birds is not self._birds:
+            self._birds = birds
+            self.target_index = -1
+            
+    def _find_new_target(self, birds: Union[BirdFlock, List[Bird]]):
         """Find the best target bird based on simplified criteria"""
-        best_target = None
-        best_score = float('inf')
-        
-        for bird in birds:
-            if bird.state != 'PERCHED':  # Don't target perched birds
-                distance = self._distance_to_bird(bird)
-                if distance <= self.search_radius:
-                    # Simple scoring: prefer closer birds with lower energy
-                    score = distance + (100 - bird.energy) * 0.5
-                    if score < best_score:
-                        best_score = score
-                        best_target = bird
-                        
-        self.target_bird = best_target
+        if isinstance(birds, BirdFlock):
+            positions = birds.positions
+            energy = birds.energy
+            flying = birds.states != BirdState.PERCHED  # Don't target perched birds
+        else:
+            positions = np.array([bird.position for bird in birds], dtype=np.float32).reshape(-1, 2)
+            energy = np.array([bird.energy for bird in birds], dtype=np.float32)
+            states = np.array([bird.state for bird in birds], dtype=np.int8)
+            flying = states != BirdState.PERCHED
+            
+        self._birds = birds
+        self.target_index = self.select_target(positions[:, 0], positions[:, 1], energy, flying)
+        
+    def select_target(self, bird_x: np.ndarray, bird_y: np.ndarray,
+                      bird_energy: np.ndarray, alive_mask: np.ndarray) -> int:
+        """Index of the best target among birds given as arrays, or -1 if none is in range"""
+        if NUMBA_AVAILABLE:
+            return int(_select_targets_kernel(
+                np.array([self.position], dtype=np.float64),
+                np.array([self.search_radius_sq], dtype=np.float64),
+                bird_x, bird_y, bird_energy, alive_mask)[0])
+        dx = bird_x - self.position[0]
+        dy = bird_y - self.position[1]
+        d2 = dx * dx + dy * dy
+        # Only birds that pass the squared radius filter need a square root
+        candidates = np.flatnonzero((d2 <= self.search_radius_sq) & alive_mask)
+        if len(candidates) == 0:
+            return -1
+        # Simple scoring: prefer closer birds with lower energy. The score is
+        # distance + (100 - energy) * 0.5; the constant 50 can't change the
+        # argmin, so it is left out
+        scores = np.sqrt(d2[candidates]) - bird_energy[candidates] * 0.5
+        return int(candidates[np.argmin(scores)])
+        
+    def _target_still_valid(self, check_range: bool = True) -> bool:
+        """Check that there is a target, it is flying and, if check_range, within the search radius"""
+        if self.target_index < 0:
+            return False
+        if isinstance(self._birds, BirdFlock):
+            perched = self._birds.states[self.target_index] == BirdState.PERCHED
+        else:
+            perched = self._birds[self.target_index].state == BirdState.PERCHED
+        if perched:
+            return False
+        return not check_range or self._sq_distance_to_target() <= self.search_radius_sq
+        
+    def _target_position(self):
+        """Position of the target bird, read from the flock arrays when there is a flock"""
+        if isinstance(self._birds, BirdFlock):
+            return self._birds.positions[self.target_index]
+        return self._birds[self.target_index].position
+        
+    def _sq_distance_to_target(self) -> float:
+        """Calculate squared distance to the target bird"""
+        target_x, target_y = self._target_position()
+        dx = self.position[0] - target_x
+        dy = self.position[1] - target_y
+        return dx * dx + dy * dy
         
-    def _distance_to_bird(self, bird: Bird) -> float:
-        """Calculate distance to a bird"""
-        return math.sqrt((self.position[0] - bird.position[0])**2 + 
-                        (self.position[1] - bird.position[1])**2)
+    def _distance_to_target(self) -> float:
+        """Calculate distance to the target bird"""
+        target_x, target_y = self._target_position()
+        return math.hypot(self.position[0] - target_x, self.position[1] - target_y)
                         
     def _move_towards_target(self):
         """Move UAV towards the target bird"""
-        if not self.target_bird:
+        if self.target_index < 0:
             return
             
         # Calculate direction to target
-        dx = self.target_bird.position[0] - self.position[0]
-        dy = self.target_bird.position[1] - self.position[1]
+        direction = np.subtract(self._target_position(), self.position, dtype=np.float32)
         
-        # Normalize direction
-        distance = math.sqrt(dx**2 + dy**2)
-        if distance > 0:
-            dx /= distance
-            dy /= distance
-            
-        # Apply movement with speed limit
+        # Apply movement with speed limit, normalizing with one division
         speed = min(self.max_speed, self.max_speed * (self.energy / 100.0))
-        self.velocity[0] = dx * speed
-        self.velocity[1] = dy * speed
+        distance = math.hypot(*direction.tolist())
+        if distance > 0:
+            direction *= speed / distance
+        self.velocity[:] = direction
         
     def _patrol_behavior(self):
         """Patrol behavior when no target is found"""
@@ -91,27 +303,166 @@ class UAVController:
         
         # Calculate desired position on patrol circle
         angle = (self.position[0] + self.position[1]) * 0.01  # Simple angle calculation
-        desired_x = center_x + radius * math.cos(angle)
-        desired_y = center_y + radius * math.sin(angle)
+        sin_a, cos_a = sincos(angle)  # Table lookup; the patrol circle needn't be exact
+        desired = np.array([center_x + radius * cos_a, center_y + radius * sin_a], dtype=np.float32)
         
         # Move towards desired position
-        dx = desired_x - self.position[0]
-        dy = desired_y - self.position[1]
+        direction = desired - self.position
         
-        distance = math.sqrt(dx**2 + dy**2)
-        if distance > 0:
-            dx /= distance
-            dy /= distance
-            
         speed = self.max_speed * 0.5  # Slower patrol speed
-        self.velocity[0] = dx * speed
-        self.velocity[1] = dy * speed
+        distance = math.hypot(*direction.tolist())
+        if distance > 0:
+            direction *= speed / distance
+        self.velocity[:] = direction
         
-    def get_status(self) -> dict:
+    def get_status(self) -> UAVStatus:
         """Get UAV status information"""
-        return {
-            'position': self.position.copy(),
-            'energy': self.energy,
-            'target_bird': self.target_bird is not None,
-            'search_radius': self.search_radius
-        } 
\ No newline at end of file
+        x, y = self.position.tolist()
+        return UAVStatus((x, y), self.energy, self.target_index >= 0, self.search_radius) 
+
+class UAVSwarm:
+    """Several UAVs stored as structure-of-arrays with a batched update
+    
+    Mirrors UAVController.update for every UAV at once against a BirdFlock:
+    target_indices holds each UAV's target as an index into the flock, or
+    -1 while it patrols.
+    """
+    
+    # Target selection bins the birds into a grid of search radius squares, and
+    # each UAV scores only the 3x3 cells around it, once that beats scanning
+    # every bird: from this many retargeting UAVs with Numba, and from this
+    # many birds with NumPy
+    GRID_MIN_UAVS = 256
+    GRID_MIN_BIRDS = 1024
+    
+    def __init__(self, positions: np.ndarray):
+        n = len(positions)
+        self.positions = np.array(positions, dtype=np.float32).reshape(n, 2)
+        self.velocities = np.zeros((n, 2), dtype=np.float32)
+        self.energy = np.full(n, 100.0, dtype=np.float32)
+        self.max_speed = 8.0
+        self.target_indices = np.full(n, -1, dtype=np.int64)
+        self.search_radius = 150
+        self.search_radius_sq = self.search_radius * self.search_radius
+        self.energy_consumption_rate = 0.05
+        
+    def __len__(self) -> int:
+        return len(self.positions)
+        
+    def update(self, flock: BirdFlock):
+        """Update every UAV's position and behavior in one batched step"""
+        if (AOT_KERNELS_AVAILABLE or NUMBA_AVAILABLE) and len(self) < self.GRID_MIN_UAVS:
+            # The prebuilt kernel skips JIT compilation on the first step
+            step = _aot_swarm_step if AOT_KERNELS_AVAILABLE else _swarm_step_kernel
+            step(self.positions, self.velocities, self.energy, self.target_indices,
+                 flock.positions, flock.energy, flock.states != BirdState.PERCHED,
+                 float(self.search_radius_sq), float(self.max_speed),
+                 float(self.energy_consumption_rate))
+            return
+        # Consume energy
+        np.maximum(self.energy - self.energy_consumption_rate, 0, out=self.energy)
+        
+        # Find targets for UAVs without one or whose target has perched or is too far
+        flying = flock.states != BirdState.PERCHED
+        retarget = self.target_indices < 0
+        tracking = np.flatnonzero(~retarget)
+        targets = self.target_indices[tracking]
+        offsets = flock.positions[targets] - self.positions[tracking]
+        retarget[tracking] = ~flying[targets] | ((offsets ** 2).sum(axis=1) > self.search_radius_sq)
+        if retarget.any():
+            self.target_indices[retarget] = self.select_targets(
+                flock.positions[:, 0], flock.positions[:, 1], flock.energy,
+                flying, np.flatnonzero(retarget))
+            
+        # Head for the target bird, or for the patrol circle when there is none
+        tracking = self.target_indices >= 0
+        angles = (self.positions[:, 0] + self.positions[:, 1]) * 0.01
+        desired = np.array([400, 300], dtype=np.float32) + 100 * unit_vectors(angles)
+        desired[tracking] = flock.positions[self.target_indices[tracking]]
+        speeds = np.where(tracking, self.max_speed * np.minimum(1.0, self.energy / 100.0),
+                          self.max_speed * 0.5)
+        
+        # Normalize directions and apply the speeds
+        directions = desired - self.positions
+        if NUMBA_AVAILABLE:
+            scale = _steering_scale(directions[:, 0], directions[:, 1], speeds)
+        else:
+            distances = np.sqrt((directions ** 2).sum(axis=1))
+            scale = np.divide(speeds, distances, out=np.zeros_like(distances), where=distances > 0)
+        self.velocities = (directions * scale[:, None]).astype(np.float32)
+        
+        # Update positions
+        self.positions += self.velocities
+        
+    def select_targets(self, bird_x: np.ndarray, bird_y: np.ndarray, bird_energy: np.ndarray,
+                       alive_mask: np.ndarray, uavs: np.ndarray) -> np.ndarray:
+        """Best target index for each of the given UAVs, or -1 where none is in range"""
+        positions = self.positions[uavs]
+        if NUMBA_AVAILABLE:
+            use_grid = len(positions) >= self.GRID_MIN_UAVS
+        else:
+            use_grid = len(bird_x) >= self.GRID_MIN_BIRDS
+        if use_grid and len(bird_x) > 0:
+            return self._select_targets_in_grid(positions, bird_x, bird_y, bird_energy, alive_mask)
+        if NUMBA_AVAILABLE:
+            radius_sq = np.full(len(positions), self.search_radius_sq, dtype=np.float64)
+            return _select_targets_kernel(positions, radius_sq, bird_x, bird_y, bird_energy, alive_mask)
+        if len(bird_x) == 0:
+            return np.full(len(positions), -1, dtype=np.int64)
+        # (U, B) squared distances from every UAV to every bird
+        dx = bird_x[None, :] - positions[:, 0:1]
+        dy = bird_y[None, :] - positions[:, 1:2]
+        d2 = dx * dx + dy * dy
+        in_range = (d2 <= self.search_radius_sq) & alive_mask
+        # Same scoring as UAVController.select_target
+        scores = np.where(in_range, np.sqrt(d2) - bird_energy * 0.5, np.inf)
+        return np.where(in_range.any(axis=1), scores.argmin(axis=1), -1)
+        
+    def _select_targets_in_grid(self, positions: np.ndarray, bird_x: np.ndarray, bird_y: np.ndarray,
+                                bird_energy: np.ndarray, alive_mask: np.ndarray) -> np.ndarray:
+        """select_targets for UAVs at the given positions, scoring only nearby grid cells"""
+        order, starts, origin, grid_height = self._bird_grid(bird_x, bird_y)
+        if NUMBA_AVAILABLE:
+            return _select_targets_grid_kernel(
+                positions, float(self.search_radius), bird_x, bird_y, bird_energy, alive_mask,
+                order, starts, int(origin[0]), int(origin[1]), grid_height)
+        grid_width = (len(starts) - 1) // grid_height
+        cells = np.floor(positions / self.search_radius).astype(np.int64) - origin
+        best = np.full(len(positions), -1, dtype=np.int64)
+        for u, (cx, cy) in enumerate(cells.tolist()):
+            y0, y1 = max(cy - 1, 0), min(cy + 1, grid_height - 1)
+            if y0 > y1:
+                continue  # No cell rows within reach
+            # Cells (x, y0..y1) are adjacent in cell id order
+            candidates = [order[starts[x * grid_height + y0]:starts[x * grid_height + y1 + 1]]
+                          for x in range(max(cx - 1, 0), min(cx + 1, grid_width - 1) + 1)]
+            if not candidates:
+                continue
+            # Sorted so ties go to the lowest bird index, as in a scan over all birds
+            candidates = np.sort(np.concatenate(candidates))
+            dx = bird_x[candidates] - positions[u, 0]
+            dy = bird_y[candidates] - positions[u, 1]
+            d2 = dx * dx + dy * dy
+            in_range = (d2 <= self.search_radius_sq) & alive_mask[candidates]
+            if in_range.any():
+                scores = np.sqrt(d2[in_range]) - bird_energy[candidates[in_range]] * 0.5
+                best[u] = candidates[in_range][np.argmin(scores)]
+        return best
+        
+    def _bird_grid(self, bird_x: np.ndarray, bird_y: np.ndarray):
+        """Bin birds into a uniform grid of search_radius squares
+        
+        Returns (order, starts, origin, grid_height): the bird indices sorted
+        by cell, for each cell id (x * grid_height + y) the slice
+        starts[id]:starts[id + 1] of order holding the birds in that cell, and
+        the (x, y) cell of the grid's corner. Every bird within the search
+        radius of a point lies in the 3x3 cells around it.
+        """
+        cells = np.floor(np.column_stack((bird_x, bird_y)) / self.search_radius).astype(np.int64)
+        origin = cells.min(axis=0)
+        cells -= origin
+        grid_width, grid_height = (cells.max(axis=0) + 1).tolist()
+        cell_ids = cells[:, 0] * grid_height + cells[:, 1]
+        order = np.argsort(cell_ids, kind='stable')
+        starts = np.searchsorted(cell_ids[order], np.arange(grid_width * grid_height + 1))
+        return order, starts, origin, grid_height
@@ -0,0 +1,284 @@
+"""
+Video Writer Utilities for UAV Path Planning Demo
+Encoder backend selection and background encoding so frame generation and
+video encoding overlap
+"""
+
+import glob
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+class CudaCodecWriter:
+    """NVENC H.264 writer backed by cv2.cudacodec (CUDA builds of OpenCV)"""
+
+    def __init__(self, filename: str, fps: float, frame_size: Tuple[int, int]):
+        self.writer = cv2.cudacodec.createVideoWriter(
+            filename, frame_size, cv2.cudacodec.H264, fps, cv2.cudacodec.ColorFormat_BGR
+        )
+        # Persistent device buffer; each frame is uploaded into it in place
+        width, height = frame_size
+        self._gpu_frame = cv2.cuda_GpuMat(height, width, cv2.CV_8UC3)
+
+    def write(self, frame):
+        self._gpu_frame.upload(frame)
+        self.writer.write(self._gpu_frame)
+
+    def release(self):
+        self.writer.release()
+
+class PyAVWriter:
+    """H.264 writer backed by PyAV/FFmpeg (e.g. the h264_nvenc encoder)"""
+
+    def __init__(self, filename: str, fps: float, frame_size: Tuple[int, int], codec: str):
+        import av
+        self._av = av
+        self.container = av.open(filename, 'w')
+        try:
+            self.stream = self.container.add_stream(codec, rate=fps)
+            self.stream.width, self.stream.height = frame_size
+            self.stream.pix_fmt = 'yuv420p'
+            # Held frames leave gaps in the timestamps; with B-frame reordering
+            # the muxer then derives a wrong stream duration
+            self.stream.codec_context.max_b_frames = 0
+            # Open the encoder now so a missing GPU/driver fails here, not mid-video
+            self.stream.codec_context.open()
+        except Exception:
+            self.container.close()
+            raise
+        # Presentation timestamp of the next frame, in frame periods
+        self._pts = 0
+
+    def write(self, frame):
+        self.write_repeated(frame, 1)
+
+    def write_repeated(self, frame, count: int):
+        """Show a frame for count frame periods, encoding it at most twice
+
+        The frame is encoded at its first timestamp and, to pin the end of the
+        hold, again at its last; the gap in between costs nothing to encode.
+        """
+        video_frame = self._av.VideoFrame.from_ndarray(frame, format='bgr24')
+        timestamps = (self._pts,) if count == 1 else (self._pts, self._pts + count - 1)
+        for pts in timestamps:
+            video_frame.pts = pts
+            for packet in self.stream.encode(video_frame):
+                self.container.mux(packet)
+        self._pts += count
+
+    def release(self):
+        # Flush frames still buffered in the encoder
+        for packet in self.stream.encode():
+            self.container.mux(packet)
+        self.container.close()
+
+class FFmpegPipeWriter:
+    """Writer that streams raw BGR frames to an ffmpeg subprocess"""
+
+    def __init__(self, filename: str, fps: float, frame_size: Tuple[int, int],
+                 codec: str = 'libx264', preset: str = 'ultrafast', threads: Optional[int] = None):
+        width, height = frame_size
+        threads = threads or os.cpu_count() or 1
+        command = [
+            'ffmpeg', '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'bgr24', '-s', f'{width}x{height}', '-r', str(fps),
+            '-i', '-',
+            '-c:v', codec, '-preset', preset, '-threads', str(threads),
+            '-pix_fmt', 'yuv420p', filename,
+        ]
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE)
+
+    def write(self, frame):
+        self.process.stdin.write(frame.tobytes())
+
+    def release(self):
+        self.process.stdin.close()
+        self.process.wait()
+
+def _open_cudacodec_writer(filename, fps, frame_size) -> Optional[CudaCodecWriter]:
+    """Open an NVENC writer through cv2.cudacodec, or None if unsupported"""
+    if not hasattr(cv2, 'cudacodec'):
+        return None
+    try:
+        if cv2.cuda.getCudaEnabledDeviceCount() == 0:
+            return None
+        return CudaCodecWriter(filename, fps, frame_size)
+    except (AttributeError, cv2.error):
+        return None
+
+def _open_pyav_writer(filename, fps, frame_size, codec='h264_nvenc') -> Optional[PyAVWriter]:
+    """Open a PyAV writer for the given encoder, or None if unavailable"""
+    try:
+        import av
+    except ImportError:
+        return None
+    if codec not in av.codecs_available:
+        return None
+    try:
+        return PyAVWriter(filename, fps, frame_size, codec)
+    except Exception:
+        return None
+
+# Device nodes of the hardware encoders OpenCV's FFmpeg backend can use on
+# Linux: VAAPI/QSV render nodes, V4L2 memory-to-memory codecs and NVIDIA GPUs
+LINUX_HW_ENCODER_DEVICES = ('/dev/dri/renderD*', '/dev/video*', '/dev/nvidia*')
+
+@contextmanager
+def _stderr_silenced():
+    """Discard output to file descriptor 2, including FFmpeg's own logging"""
+    if sys.stderr is not None:
+        sys.stderr.flush()
+    saved_fd = os.dup(2)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    try:
+        os.dup2(devnull, 2)
+        yield
+    finally:
+        os.dup2(saved_fd, 2)
+        os.close(devnull)
+        os.close(saved_fd)
+
+def _open_cv2_hw_writer(filename, fps, frame_size) -> Optional[cv2.VideoWriter]:
+    """Open an OpenCV/FFmpeg H.264 writer on a hardware encoder, or None if unavailable"""
+    if not hasattr(cv2, 'VIDEOWRITER_PROP_HW_ACCELERATION'):
+        return None
+    if sys.platform.startswith('linux') and not any(
+            glob.glob(pattern) for pattern in LINUX_HW_ENCODER_DEVICES):
+        # No encoder device for the probe to find
+        return None
+    params = [cv2.VIDEOWRITER_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+    # A failed probe is expected on machines without VAAPI/NVENC/QSV; keep it
+    # quiet, both OpenCV's logging and what FFmpeg prints straight to stderr
+    log_level = cv2.utils.logging.getLogLevel()
+    cv2.utils.logging.setLogLevel(cv2.utils.logging.LOG_LEVEL_SILENT)
+    try:
+        with _stderr_silenced():
+            writer = cv2.VideoWriter(filename, cv2.CAP_FFMPEG, cv2.VideoWriter_fourcc(*'avc1'),
+                                     fps, frame_size, params)
+    finally:
+        cv2.utils.logging.setLogLevel(log_level)
+    if not writer.isOpened():
+        return None
+    if writer.get(cv2.VIDEOWRITER_PROP_HW_ACCELERATION) == cv2.VIDEO_ACCELERATION_NONE:
+        # Opened, but on a software encoder; the ffmpeg pipe is the faster choice then
+        writer.release()
+        return None
+    return writer
+
+def create_video_writer(filename: str, fps: float, frame_size: Tuple[int, int]):
+    """Open the fastest available writer for BGR frames of the given (width, height)
+
+    Tries hardware H.264 encoding through cv2.cudacodec, then PyAV's h264_nvenc,
+    then OpenCV's FFmpeg backend with hardware acceleration (VAAPI, NVENC,
+    QSV), then multi-threaded libx264 through an ffmpeg pipe, and falls back
+    to OpenCV's software mp4v writer.
+    """
+    writer = _open_cudacodec_writer(filename, fps, frame_size)
+    if writer is None:
+        writer = _open_pyav_writer(filename, fps, frame_size)
+    if writer is None:
+        writer = _open_cv2_hw_writer(filename, fps, frame_size)
+    if writer is None and shutil.which('ffmpeg'):
+        writer = FFmpegPipeWriter(filename, fps, frame_size)
+    if writer is None:
+        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+        writer = cv2.VideoWriter(filename, fourcc, fps, frame_size)
+    return writer
+
+class ThreadedVideoWriter:
+    """Wrap a video writer so frames are encoded on a background thread"""
+
+    def __init__(self, writer, queue_size: int = 8, cpu: Optional[int] = None):
+        self.writer = writer
+        # Optional core to pin the writer thread to (Linux only)
+        self.cpu = cpu
+        # Frames queued plus the one being encoded; callers reusing frame
+        # buffers need at least this many besides the one they are drawing into
+        self.max_in_flight = queue_size + 1
+        # Bounded queue applies back-pressure when the encoder falls behind
+        self._write_q = queue.Queue(maxsize=queue_size)
+        # Exception that stopped the writer thread, re-raised to the producer
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._thread.start()
+
+    def _writer_loop(self):
+        """Drain queued frames into the wrapped writer until the sentinel arrives"""
+        if self.cpu is not None and hasattr(os, 'sched_setaffinity'):
+            try:
+                # pid 0 is the calling thread, so only the writer thread is pinned
+                os.sched_setaffinity(0, {self.cpu})
+            except OSError:
+                pass
+        write_repeated = getattr(self.writer, 'write_repeated', None)
+        try:
+            while True:
+                item = self._write_q.get()
+                if item is None:
+                    break
+                frame, count = item
+                if count == 1:
+                    self.writer.write(frame)
+                elif write_repeated is not None:
+                    # Writers that can express a hold through timestamps encode it once
+                    write_repeated(frame, count)
+                else:
+                    for _ in range(count):
+                        self.writer.write(frame)
+        except Exception as exc:
+            # E.g. a broken ffmpeg pipe; nothing drains the queue after this,
+            # so producers check for it instead of blocking on a full queue
+            self._error = exc
+
+    def _raise_if_failed(self):
+        """Re-raise the exception that stopped the writer thread, if any"""
+        if self._error is not None:
+            raise self._error
+
+    def _put(self, item):
+        """Queue an item, waiting while the queue is full unless the writer thread has failed"""
+        while True:
+            self._raise_if_failed()
+            try:
+                self._write_q.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def write(self, frame):
+        """Queue a frame for encoding (blocks while the queue is full)"""
+        self.write_repeated(frame, 1)
+
+    def write_repeated(self, frame, count: int):
+        """Queue a frame to be shown for count consecutive frame periods"""
+        # Encoders copy or convert anything but contiguous uint8 BGR internally;
+        # normalize here so that happens at most once, on this thread
+        if frame.dtype != np.uint8 or not frame.flags['C_CONTIGUOUS']:
+            frame = np.ascontiguousarray(frame, dtype=np.uint8)
+        self._put((frame, count))
+
+    def release(self):
+        """Flush pending frames, stop the writer thread and release the writer
+
+        Re-raises the exception that stopped the writer thread, if any.
+        """
+        try:
+            self._put(None)
+            self._thread.join()
+        finally:
+            try:
+                self.writer.release()
+            except Exception:
+                # A writer that already failed often fails to close too;
+                # report the original error instead
+                if self._error is None:
+                    raise
+        self._raise_if_failed()